@@ -1,5 +1,5 @@
 import os
-from flask import Flask, jsonify, render_template, request, send_from_directory, session, flash, redirect, url_for
+from flask import Flask, Response, jsonify, render_template, request, send_from_directory, session, flash, redirect, url_for
 from flask_cors import CORS
 from flask_login import current_user, login_required
 from werkzeug.exceptions import NotFound
@@ -7,8 +7,11 @@ from flask_babel import Babel, get_locale
 
 from src.infrastructure.config import settings
 from src.infrastructure.database import init_app as init_db, db
+from src.infrastructure.request_limits import ContentLengthLimit
 from sb_utils.logger_utils import logger
 from src.services import email_service, auth_service
+from src.services.capybara_of_the_day_service import get_capybara_of_the_day, get_random_family_fact
+from src.services.health_service import get_cached_health_json
 
 # Import Blueprints
 from src.api.routes_summary import summary_bp
@@ -59,6 +62,7 @@ def create_app():
     app.config['SESSION_COOKIE_SECURE'] = settings.FLASK_ENV == 'production'
     app.config['SESSION_COOKIE_HTTPONLY'] = True
     app.config['SESSION_COOKIE_SAMESITE'] = 'Lax'
+    app.wsgi_app = ContentLengthLimit(app.wsgi_app, settings.MAX_CONTENT_LENGTH)
     CORS(app, resources={r"/api/*": {"origins": "*"}}, supports_credentials=True)
 
     init_db(app)
@@ -112,7 +116,6 @@ def create_app():
 
     @app.route('/')
     def index():
-        from src.services.capybara_of_the_day_service import get_capybara_of_the_day, get_random_family_fact
         capybara_of_day = get_capybara_of_the_day()
         family_fact = get_random_family_fact()
         return render_template('index.html', capybara_of_day=capybara_of_day, family_fact=family_fact)
@@ -188,15 +191,14 @@ def create_app():
     
     @app.route('/health/detailed')
     def detailed_health_check():
-        from src.services.health_service import get_comprehensive_health
         try:
-            health_report = get_comprehensive_health(db)
-            if health_report["overall_status"] == "healthy":
-                return jsonify(health_report), 200
-            elif health_report["overall_status"] == "degraded":
-                return jsonify(health_report), 200
-            else:
-                return jsonify(health_report), 503
+            # Body is serialized once per refresh, not per probe
+            body, overall_status, etag = get_cached_health_json(db)
+            status_code = 503 if overall_status == "unhealthy" else 200
+            response = Response(body, status=status_code, mimetype="application/json")
+            response.set_etag(etag)
+            # 304 for If-None-Match probes while the snapshot is unchanged
+            return response.make_conditional(request) if status_code == 200 else response
         except Exception as e:
             logger.error(f"Health check failed with exception: {e}", exc_info=True)
             return jsonify({"status": "unhealthy", "error": "Health check failed to complete", "details": str(e)}), 503
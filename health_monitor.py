@@ -6,11 +6,13 @@ import schedule
 import subprocess
 import tempfile
 import os
+from collections import deque
 from datetime import datetime, timezone
 from pathlib import Path
 
 from src.services.health_service import get_comprehensive_health
-from src.services.email_service import send_email
+from src.services.email_service import send_email, send_error_notification
+from src.services.alert_throttle import alert_throttle
 from src.infrastructure.config import settings
 from src.infrastructure.database import db
 from sb_utils.logger_utils import logger
@@ -30,7 +32,8 @@ consecutive_failures = {
     "git": 0
 }
 last_restart_time = None
-last_email_sent = {}
+# (component, status, error) alerts collected during a check cycle
+pending_alerts = deque()
 
 
 def create_test_file() -> str:
@@ -105,9 +108,30 @@ def should_restart_services() -> bool:
     return (datetime.now(timezone.utc) - last_restart_time).total_seconds() > (RESTART_COOLDOWN_MINUTES * 60)
 
 
-def send_critical_alert(component: str, error_details: str):
-    # ... (implementation remains the same)
-    pass
+def send_critical_alert(component: str, error_details: str, status: str = "unhealthy"):
+    """Queue an alert; flush_pending_alerts() sends the cycle's alerts as one email."""
+    if not alert_throttle.should_send(component, status):
+        return
+    pending_alerts.append((component, status, error_details))
+
+
+def flush_pending_alerts():
+    if not pending_alerts:
+        return
+    alerts = []
+    while pending_alerts:
+        alerts.append(pending_alerts.popleft())
+
+    components = ", ".join(component for component, _, _ in alerts)
+    details = "\n".join(
+        f"{component} ({status}, {consecutive_failures.get(component, 0)} consecutive failures): {error}"
+        for component, status, error in alerts
+    )
+    send_error_notification(
+        error_type=f"Health: {len(alerts)} component(s) unhealthy",
+        error_message=components,
+        details=details,
+    )
 
 def send_daily_health_report():
     # ... (implementation remains the same)
@@ -120,13 +144,15 @@ def perform_health_check_and_recovery():
         from app import create_app
         app = create_app()
         with app.app_context():
-            health_report = get_comprehensive_health(db)
+            health_report = get_comprehensive_health(db, deep=True)
             upload_test = test_real_file_upload()
             
             for component, status_data in health_report["components"].items():
                 if status_data.get("status") == "unhealthy":
                     consecutive_failures[component] += 1
                     logger.warning(f"Component {component} unhealthy ({consecutive_failures[component]}/{MAX_CONSECUTIVE_FAILURES})")
+                    if consecutive_failures[component] >= MAX_CONSECUTIVE_FAILURES:
+                        send_critical_alert(component, status_data.get("error", "unknown error"))
                     if consecutive_failures[component] >= MAX_CONSECUTIVE_FAILURES and should_restart_services():
                         # ... (restart logic remains the same)
                         pass
@@ -137,6 +163,8 @@ def perform_health_check_and_recovery():
             
             if upload_test.get("status") == "failed":
                 logger.error(f"File upload test failed: {upload_test.get('error')}")
+
+            flush_pending_alerts()
             
             logger.info(f"Health check complete: {health_report['overall_status']}")
     except Exception as e:
@@ -7,28 +7,11 @@ This module is responsible for wrapping user prompts with:
 - Domain constraints (education-only)
 """
 
+from functools import lru_cache
 from typing import Optional
 
 
-def create_safety_guard_prompt(prompt: str, context: Optional[str] = "") -> str:
-    """
-    Wrap a task prompt with safety instructions and context grounding.
-
-    This function is the single place where we:
-    - Force the model to stay on the given text.
-    - Avoid hallucinations.
-    - Keep the assistant strictly educational.
-
-    Args:
-        prompt: A natural-language *task* description
-                (e.g. "Summarize the key ideas in 5 bullet points").
-        context: Raw text / RAG context / document content.
-                 Can be empty, but usually should contain the student's material.
-
-    Returns:
-        A single string to send as the model's "user" message.
-    """
-    safety_instructions = """
+SAFETY_INSTRUCTIONS = """
     IMPORTANT: You are an educational assistant. Your response MUST be directly
     related to the provided text and the user's question.
 
@@ -41,17 +24,57 @@ def create_safety_guard_prompt(prompt: str, context: Optional[str] = "") -> str:
     - Format your response clearly as requested in the task.
     """
 
-    context_block = context or ""
-
-    full_prompt = f"""
-{safety_instructions}
+# The wrapper text never changes, so it is assembled once at import time and
+# each call only concatenates the context and the task around it.
+_PROMPT_PRE = f"""
+{SAFETY_INSTRUCTIONS}
 
 --- TEXT FOR CONTEXT ---
-{context_block}
+""".lstrip()
+_PROMPT_MID = """
 --- END OF TEXT ---
 
 Based *only* on the text provided above, please perform the following task:
 
-Task: {prompt}
-"""
-    return full_prompt.strip()
+Task: """
+_PROMPT_MID_NO_TASK = _PROMPT_MID.rstrip()
+
+# Short prompt/context pairs (app help, fixed task templates over the same
+# snippet) repeat a lot, so their wrapped form is memoized. Document-sized
+# contexts skip the cache: hashing them costs as much as wrapping them, and
+# keeping them alive would pin megabytes of text.
+_CACHEABLE_CONTEXT_CHARS = 4096
+
+
+def _wrap(prompt: str, context: str) -> str:
+    task = prompt.rstrip()
+    if not task:
+        return _PROMPT_PRE + context + _PROMPT_MID_NO_TASK
+    return _PROMPT_PRE + context + _PROMPT_MID + task
+
+
+_wrap_cached = lru_cache(maxsize=1024)(_wrap)
+
+
+def create_safety_guard_prompt(prompt: str, context: Optional[str] = "") -> str:
+    """
+    Wrap a task prompt with safety instructions and context grounding.
+
+    This function is the single place where we:
+    - Force the model to stay on the given text.
+    - Avoid hallucinations.
+    - Keep the assistant strictly educational.
+
+    Args:
+        prompt: A natural-language *task* description
+                (e.g. "Summarize the key ideas in 5 bullet points").
+        context: Raw text / RAG context / document content.
+                 Can be empty, but usually should contain the student's material.
+
+    Returns:
+        A single string to send as the model's "user" message.
+    """
+    context = context or ""
+    if len(context) <= _CACHEABLE_CONTEXT_CHARS:
+        return _wrap_cached(prompt, context)
+    return _wrap(prompt, context)
@@ -1,8 +1,9 @@
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import IO, Optional
 import os
+import re
 import tempfile
-import shutil
 import logging
 import mimetypes
 import hashlib
@@ -10,10 +11,11 @@ import hashlib
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class UploadedFile:
     """
     Represents a single uploaded file stored temporarily on disk.
+    One is created per upload, so instances carry no per-object __dict__.
     """
     filename: str
     content_type: str
@@ -21,18 +23,25 @@ class UploadedFile:
     temp_path: str
 
 
-ALLOWED_MIMETYPES = {
+ALLOWED_MIMETYPES = frozenset({
     "text/plain",
     "application/pdf",
     "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
     "image/png",
     "image/jpeg",
-}
+})
 
 # per-file size limit (10MB)
 MAX_FILE_SIZE_BYTES: int = 10 * 1024 * 1024
 
-_CHUNK_SIZE_BYTES: int = 4096  # for streaming reads
+# for streaming reads: a 10MB upload is ~10 read/write calls instead of
+# ~2500; the size check still runs per chunk, so oversize uploads stop early
+_CHUNK_SIZE_BYTES: int = 1 << 20
+
+# Everything except word characters (str.isalnum() plus "_"), space, "." and
+# "-". Matches the old per-character filter, Hebrew letters included, but
+# runs in C.
+_UNSAFE_NAME_CHARS = re.compile(r"[^\w .\-]")
 
 
 def secure_name(filename: str) -> str:
@@ -41,8 +50,7 @@ def secure_name(filename: str) -> str:
     and restrict characters + length.
     """
     name = os.path.basename(filename or "")
-    name = name.replace("\x00", "")  # strip null bytes
-    safe = "".join(c for c in name if c.isalnum() or c in " ._-")
+    safe = _UNSAFE_NAME_CHARS.sub("", name)  # also strips null bytes
     return safe[:200]
 
 
@@ -50,8 +58,14 @@ def digest_name(filename: str) -> str:
     """
     Deterministic hashed filename to avoid collisions and leaking originals.
     """
-    safe_original = secure_name(filename)
-    h = hashlib.sha256(safe_original.encode("utf-8")).hexdigest()[:12]
+    return _digest_safe_name(secure_name(filename))
+
+
+@lru_cache(maxsize=4096)
+def _digest_safe_name(safe_original: str) -> str:
+    """digest_name for a name that already went through secure_name."""
+    # 6-byte BLAKE2b: same 12 hex chars as before, without hashing to 32 bytes first
+    h = hashlib.blake2b(safe_original.encode("utf-8"), digest_size=6).hexdigest()
     base, ext = os.path.splitext(safe_original)
     return f"{base[:80]}-{h}{ext}"
 
@@ -60,6 +74,22 @@ def allowed_mimetype(mime: Optional[str]) -> bool:
     return mime in ALLOWED_MIMETYPES
 
 
+def _copy_chunks(stream: IO[bytes], f: IO[bytes], max_size: int) -> int:
+    """
+    Copy ``stream`` into ``f`` chunk by chunk.
+
+    Stops as soon as more than ``max_size`` bytes have been read and returns
+    the byte count, so the caller can reject the upload.
+    """
+    total = 0
+    for chunk in iter(lambda: stream.read(_CHUNK_SIZE_BYTES), b""):
+        total += len(chunk)
+        if total > max_size:
+            break
+        f.write(chunk)
+    return total
+
+
 def save_stream_to_temp(
     stream: IO[bytes],
     original_filename: str,
@@ -70,31 +100,23 @@ def save_stream_to_temp(
     Does not log filename or content.
     """
     tmp_dir = tempfile.mkdtemp(prefix="studybuddy_upload_")
-    safe = digest_name(original_filename)
-    temp_path = os.path.join(tmp_dir, safe)
-    total = 0
+    safe_original = secure_name(original_filename)
+    temp_path = os.path.join(tmp_dir, _digest_safe_name(safe_original))
 
     try:
         with open(temp_path, "wb") as f:
-            for chunk in iter(lambda: stream.read(_CHUNK_SIZE_BYTES), b""):
-                if not chunk:
-                    break
-                total += len(chunk)
-                if total > max_size:
-                    # cleanup and raise
-                    f.close()
-                    shutil.rmtree(tmp_dir, ignore_errors=True)
-                    logger.debug("Upload rejected: size exceeded limit bytes=%d", max_size)
-                    raise ValueError("oversize")
-                f.write(chunk)
+            total = _copy_chunks(stream, f, max_size)
+            if total > max_size:
+                logger.debug("Upload rejected: size exceeded limit bytes=%d", max_size)
+                raise ValueError("oversize")
     except Exception:
         # best effort cleanup on failure
-        shutil.rmtree(tmp_dir, ignore_errors=True)
+        clean_temp_path(temp_path)
         raise
 
     mime, _ = mimetypes.guess_type(original_filename)
     uploaded = UploadedFile(
-        filename=secure_name(original_filename),
+        filename=safe_original,
         content_type=mime or "application/octet-stream",
         size=total,
         temp_path=temp_path,
@@ -106,11 +128,21 @@ def save_stream_to_temp(
 
 def clean_temp_path(path: str) -> None:
     """
-    Delete the temp directory that contains the given file.
+    Delete the given temp file and the directory that contains it.
+
+    Upload directories only ever hold this one file, so this is a plain
+    unlink + rmdir rather than a recursive tree walk.
     """
+    base = os.path.dirname(path)
+    if not base:
+        return
     try:
-        base = os.path.dirname(path)
-        if base and os.path.isdir(base):
-            shutil.rmtree(base, ignore_errors=True)
-    except Exception:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        os.rmdir(base)
+    except FileNotFoundError:
+        pass
+    except OSError:
         logger.warning("Failed to clean temp upload directory", exc_info=True)
@@ -1,7 +1,25 @@
 import logging
 import sys
+
+import orjson
 from pythonjsonlogger import jsonlogger
 
+
+class FastJsonFormatter(jsonlogger.JsonFormatter):
+    """JsonFormatter that serializes records with orjson instead of json.dumps."""
+
+    def jsonify_log_record(self, log_record):
+        # `extra=` values orjson can't encode fall back to str(), like json_default
+        return orjson.dumps(
+            log_record, default=str, option=orjson.OPT_NON_STR_KEYS
+        ).decode()
+
+
+# One formatter for every logger: it holds no per-logger state
+_formatter = FastJsonFormatter(
+    '%(asctime)s %(name)s %(levelname)s %(module)s %(funcName)s %(message)s'
+)
+
 # This function can be called from the app factory to get a configured logger
 
 
@@ -10,15 +28,13 @@ def get_logger(name: str, log_level: str = "INFO"):
     logger.setLevel(log_level)
     logger.propagate = False
 
-    formatter = jsonlogger.JsonFormatter(
-        '%(asctime)s %(name)s %(levelname)s %(module)s %(funcName)s %(message)s'
-    )
+    # Already configured: don't build a handler just to throw it away
+    if logger.handlers:
+        return logger
 
     handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(formatter)
-
-    if not logger.handlers:
-        logger.addHandler(handler)
+    handler.setFormatter(_formatter)
+    logger.addHandler(handler)
 
     return logger
 
@@ -1,4 +1,4 @@
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, stop_after_attempt, wait_exponential_jitter
 from .logger_utils import logger
 
 
@@ -10,9 +10,9 @@ def on_retry_callback(retry_state):
     )
 
 
-# A general-purpose retry decorator
+# A general-purpose retry decorator (capped, jittered exponential backoff)
 retry_decorator = retry(
-    wait=wait_exponential(multiplier=1, min=2, max=60),
+    wait=wait_exponential_jitter(multiplier=2, max=60, jitter=1),
     stop=stop_after_attempt(5),
     before_sleep=on_retry_callback
 )
@@ -9,21 +9,41 @@ HEBREW_ERRORS = {
     "no_input": "לא הוזן טקסט או קובץ. אנא העתק טקסט או העלה קובץ.",
     "bad_type": "סוג הקובץ אינו נתמך. אנא העלה PDF, DOCX, TXT או תמונה (PNG/JPEG).",
     "too_large": "הקובץ גדול מדי. אנא השתמש בקבצים עד 10MB.",
+    "too_large_for_limit": "הקובץ גדול מדי. אנא השתמש בקבצים עד {limit_mb}MB.",
     "server_error": "אירעה שגיאה בשרת. נסה שוב מאוחר יותר.",
 }
 
-def validate_upload(mime: Optional[str], size: int) -> Optional[str]:
+# resolved once for validate_upload, which runs on every upload
+_ERR_NO_INPUT = HEBREW_ERRORS["no_input"]
+_ERR_TOO_LARGE = HEBREW_ERRORS["too_large"]
+_ERR_TOO_LARGE_FOR_LIMIT = HEBREW_ERRORS["too_large_for_limit"]
+_ERR_BAD_TYPE = HEBREW_ERRORS["bad_type"]
+
+def validate_upload_size(size: int, max_size: int = MAX_FILE_SIZE_BYTES) -> Optional[str]:
     """
-    Validate upload size and MIME type.
+    Validate upload size only (cheap enough to run before storing anything).
     Returns a Hebrew error message if invalid, otherwise None.
     """
     if size <= 0:
         logger.debug("Validation failed: empty upload (size=%d)", size)
-        return HEBREW_ERRORS["no_input"]
-    if size > MAX_FILE_SIZE_BYTES:
+        return _ERR_NO_INPUT
+    if size > max_size:
         logger.debug("Validation failed: too large (size=%d)", size)
-        return HEBREW_ERRORS["too_large"]
+        if max_size == MAX_FILE_SIZE_BYTES:
+            return _ERR_TOO_LARGE
+        return _ERR_TOO_LARGE_FOR_LIMIT.format(limit_mb=max_size // (1024 * 1024))
+    return None
+
+
+def validate_upload(mime: Optional[str], size: int) -> Optional[str]:
+    """
+    Validate upload size and MIME type.
+    Returns a Hebrew error message if invalid, otherwise None.
+    """
+    error = validate_upload_size(size)
+    if error:
+        return error
     if not allowed_mimetype(mime):
         logger.debug("Validation failed: bad MIME type (%s)", mime)
-        return HEBREW_ERRORS["bad_type"]
+        return _ERR_BAD_TYPE
     return None
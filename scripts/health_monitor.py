@@ -15,9 +15,11 @@ Environment Variables Required:
     - HEALTH_CHECK_INTERVAL (optional): Check interval in seconds, defaults to 60
 """
 import os
+import string
 import sys
 import time
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 from pathlib import Path
 
@@ -30,6 +32,109 @@ from sb_utils.logger_utils import logger
 from src.services.email_service import send_email
 
 
+# Email bodies are static apart from a few fields: parsed once, filled per alert
+_ALERT_HTML = string.Template("""
+<!DOCTYPE html>
+<html dir="ltr" lang="en">
+<head>
+    <meta charset="UTF-8">
+    <style>
+        body { font-family: 'Segoe UI', Arial, sans-serif; background-color: #FFF8E6; margin: 0; padding: 20px; }
+        .container { max-width: 600px; margin: 0 auto; background: #FAF3D7; border-radius: 16px; padding: 30px; border: 2px solid #DC2626; }
+        .header { text-align: center; margin-bottom: 20px; color: #DC2626; }
+        .content { color: #4B2E16; line-height: 1.8; }
+        .alert-box { background: #FEE2E2; padding: 15px; border-radius: 8px; margin: 10px 0; border-left: 4px solid #DC2626; }
+        .info { background: #FFF8E6; padding: 10px; border-radius: 4px; margin: 5px 0; font-size: 14px; }
+        .footer { margin-top: 20px; text-align: center; color: #8B5E34; font-size: 12px; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h2>🚨 StudyBuddy Health Alert</h2>
+        </div>
+        <div class="content">
+            <div class="alert-box">
+                <p><strong>⚠️ Application Health Check Failed</strong></p>
+                <p>The StudyBuddy application is reporting an unhealthy status.</p>
+            </div>
+            <div class="info">
+                <p><strong>Timestamp:</strong> $timestamp</p>
+                <p><strong>Health Check URL:</strong> $health_url</p>
+                <p><strong>Consecutive Failures:</strong> $failures</p>
+                <p><strong>Error Details:</strong> $message</p>
+            </div>
+            <p style="margin-top: 20px;"><strong>Recommended Actions:</strong></p>
+            <ul>
+                <li>Check application logs for errors</li>
+                <li>Verify all services are running (app, worker, MongoDB, RabbitMQ)</li>
+                <li>Check system resources (CPU, memory, disk space)</li>
+                <li>Restart services if necessary using: <code>docker-compose restart</code></li>
+            </ul>
+        </div>
+        <div class="footer">
+            <p>This is an automated alert from StudyBuddy Health Monitor</p>
+        </div>
+    </div>
+</body>
+</html>
+""")
+
+_ALERT_TEXT = string.Template("""
+StudyBuddy Health Alert
+========================
+
+The StudyBuddy application is reporting an unhealthy status.
+
+Timestamp: $timestamp
+Health Check URL: $health_url
+Consecutive Failures: $failures
+Error Details: $message
+
+Recommended Actions:
+- Check application logs for errors
+- Verify all services are running
+- Check system resources
+- Restart services if necessary
+
+This is an automated alert from StudyBuddy Health Monitor
+""")
+
+_RECOVERY_HTML = string.Template("""
+<!DOCTYPE html>
+<html dir="ltr" lang="en">
+<head>
+    <meta charset="UTF-8">
+    <style>
+        body { font-family: 'Segoe UI', Arial, sans-serif; background-color: #FFF8E6; margin: 0; padding: 20px; }
+        .container { max-width: 600px; margin: 0 auto; background: #FAF3D7; border-radius: 16px; padding: 30px; border: 2px solid #10B981; }
+        .header { text-align: center; margin-bottom: 20px; color: #10B981; }
+        .content { color: #4B2E16; line-height: 1.8; }
+        .success-box { background: #D1FAE5; padding: 15px; border-radius: 8px; margin: 10px 0; border-left: 4px solid #10B981; }
+        .info { background: #FFF8E6; padding: 10px; border-radius: 4px; margin: 5px 0; font-size: 14px; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h2>✅ StudyBuddy Health Recovered</h2>
+        </div>
+        <div class="content">
+            <div class="success-box">
+                <p><strong>✓ Application Has Recovered</strong></p>
+                <p>The StudyBuddy application is now reporting a healthy status.</p>
+            </div>
+            <div class="info">
+                <p><strong>Recovery Timestamp:</strong> $timestamp</p>
+                <p><strong>Health Check URL:</strong> $health_url</p>
+            </div>
+        </div>
+    </div>
+</body>
+</html>
+""")
+
+
 class HealthMonitor:
     """Monitors application health and sends email alerts."""
 
@@ -38,9 +143,16 @@ class HealthMonitor:
         self.check_interval = int(os.getenv('HEALTH_CHECK_INTERVAL', '60'))
         self.max_consecutive_failures = int(os.getenv('MAX_CONSECUTIVE_FAILURES', '3'))
         self.consecutive_failures = 0
-        self.last_alert_time = None
+        # Monotonic clock: an NTP step must not re-enable or suppress alerts
+        self.last_alert_ns = None
         self.alert_cooldown = int(os.getenv('ALERT_COOLDOWN_SECONDS', '3600'))  # 1 hour default
+        self.alert_cooldown_ns = self.alert_cooldown * 1_000_000_000
         self.is_unhealthy = False
+        # One kept-alive connection reused by every probe (no TCP/TLS
+        # handshake per check)
+        self._session = requests.Session()
+        self._session.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=1))
+        self._session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=1))
 
     def check_health(self) -> tuple[bool, str]:
         """
@@ -50,7 +162,8 @@ class HealthMonitor:
             tuple: (is_healthy: bool, message: str)
         """
         try:
-            response = requests.get(self.health_url, timeout=10)
+            # Fail fast if the app isn't accepting connections at all
+            response = self._session.get(self.health_url, timeout=(3, 10))
             
             if response.status_code == 200:
                 data = response.json()
@@ -62,7 +175,7 @@ class HealthMonitor:
                 return False, f"Health check returned status code {response.status_code}"
                 
         except requests.exceptions.Timeout:
-            return False, "Health check timed out after 10 seconds"
+            return False, "Health check timed out (3s connect / 10s read)"
         except requests.exceptions.ConnectionError:
             return False, "Could not connect to application (connection error)"
         except requests.exceptions.RequestException as e:
@@ -72,11 +185,9 @@ class HealthMonitor:
 
     def should_send_alert(self) -> bool:
         """Check if enough time has passed since last alert."""
-        if self.last_alert_time is None:
+        if self.last_alert_ns is None:
             return True
-        
-        time_since_last_alert = time.time() - self.last_alert_time
-        return time_since_last_alert >= self.alert_cooldown
+        return time.monotonic_ns() - self.last_alert_ns >= self.alert_cooldown_ns
 
     def send_health_alert(self, message: str):
         """Send email alert about unhealthy application."""
@@ -85,77 +196,19 @@ class HealthMonitor:
             return
 
         if not self.should_send_alert():
-            logger.info(f"Skipping alert (cooldown period active). Next alert in {self.alert_cooldown - (time.time() - self.last_alert_time):.0f}s")
+            logger.info(f"Skipping alert (cooldown period active). Next alert in {(self.alert_cooldown_ns - (time.monotonic_ns() - self.last_alert_ns)) / 1e9:.0f}s")
             return
 
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
-        html_body = f"""
-        <!DOCTYPE html>
-        <html dir="ltr" lang="en">
-        <head>
-            <meta charset="UTF-8">
-            <style>
-                body {{ font-family: 'Segoe UI', Arial, sans-serif; background-color: #FFF8E6; margin: 0; padding: 20px; }}
-                .container {{ max-width: 600px; margin: 0 auto; background: #FAF3D7; border-radius: 16px; padding: 30px; border: 2px solid #DC2626; }}
-                .header {{ text-align: center; margin-bottom: 20px; color: #DC2626; }}
-                .content {{ color: #4B2E16; line-height: 1.8; }}
-                .alert-box {{ background: #FEE2E2; padding: 15px; border-radius: 8px; margin: 10px 0; border-left: 4px solid #DC2626; }}
-                .info {{ background: #FFF8E6; padding: 10px; border-radius: 4px; margin: 5px 0; font-size: 14px; }}
-                .footer {{ margin-top: 20px; text-align: center; color: #8B5E34; font-size: 12px; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h2>🚨 StudyBuddy Health Alert</h2>
-                </div>
-                <div class="content">
-                    <div class="alert-box">
-                        <p><strong>⚠️ Application Health Check Failed</strong></p>
-                        <p>The StudyBuddy application is reporting an unhealthy status.</p>
-                    </div>
-                    <div class="info">
-                        <p><strong>Timestamp:</strong> {timestamp}</p>
-                        <p><strong>Health Check URL:</strong> {self.health_url}</p>
-                        <p><strong>Consecutive Failures:</strong> {self.consecutive_failures}</p>
-                        <p><strong>Error Details:</strong> {message}</p>
-                    </div>
-                    <p style="margin-top: 20px;"><strong>Recommended Actions:</strong></p>
-                    <ul>
-                        <li>Check application logs for errors</li>
-                        <li>Verify all services are running (app, worker, MongoDB, RabbitMQ)</li>
-                        <li>Check system resources (CPU, memory, disk space)</li>
-                        <li>Restart services if necessary using: <code>docker-compose restart</code></li>
-                    </ul>
-                </div>
-                <div class="footer">
-                    <p>This is an automated alert from StudyBuddy Health Monitor</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
-
-        text_body = f"""
-        StudyBuddy Health Alert
-        ========================
-
-        The StudyBuddy application is reporting an unhealthy status.
-
-        Timestamp: {timestamp}
-        Health Check URL: {self.health_url}
-        Consecutive Failures: {self.consecutive_failures}
-        Error Details: {message}
-
-        Recommended Actions:
-        - Check application logs for errors
-        - Verify all services are running
-        - Check system resources
-        - Restart services if necessary
-
-        This is an automated alert from StudyBuddy Health Monitor
-        """
+        fields = {
+            "timestamp": timestamp,
+            "health_url": self.health_url,
+            "failures": self.consecutive_failures,
+            "message": message,
+        }
+        html_body = _ALERT_HTML.substitute(fields)
+        text_body = _ALERT_TEXT.substitute(fields)
 
         try:
             success = send_email(
@@ -165,7 +218,7 @@ class HealthMonitor:
                 text_body
             )
             if success:
-                self.last_alert_time = time.time()
+                self.last_alert_ns = time.monotonic_ns()
                 logger.info(f"Health alert sent to {settings.ADMIN_EMAIL}")
             else:
                 logger.error("Failed to send health alert email")
@@ -179,39 +232,7 @@ class HealthMonitor:
 
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
-        html_body = f"""
-        <!DOCTYPE html>
-        <html dir="ltr" lang="en">
-        <head>
-            <meta charset="UTF-8">
-            <style>
-                body {{ font-family: 'Segoe UI', Arial, sans-serif; background-color: #FFF8E6; margin: 0; padding: 20px; }}
-                .container {{ max-width: 600px; margin: 0 auto; background: #FAF3D7; border-radius: 16px; padding: 30px; border: 2px solid #10B981; }}
-                .header {{ text-align: center; margin-bottom: 20px; color: #10B981; }}
-                .content {{ color: #4B2E16; line-height: 1.8; }}
-                .success-box {{ background: #D1FAE5; padding: 15px; border-radius: 8px; margin: 10px 0; border-left: 4px solid #10B981; }}
-                .info {{ background: #FFF8E6; padding: 10px; border-radius: 4px; margin: 5px 0; font-size: 14px; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h2>✅ StudyBuddy Health Recovered</h2>
-                </div>
-                <div class="content">
-                    <div class="success-box">
-                        <p><strong>✓ Application Has Recovered</strong></p>
-                        <p>The StudyBuddy application is now reporting a healthy status.</p>
-                    </div>
-                    <div class="info">
-                        <p><strong>Recovery Timestamp:</strong> {timestamp}</p>
-                        <p><strong>Health Check URL:</strong> {self.health_url}</p>
-                    </div>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
+        html_body = _RECOVERY_HTML.substitute(timestamp=timestamp, health_url=self.health_url)
 
         try:
             send_email(
@@ -1,9 +1,15 @@
 """Admin routes for system management."""
 import platform
+import threading
+import time
+from typing import Optional
+
 import psutil
 from datetime import datetime, timezone
 from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify
 from flask_login import login_required, current_user
+from pymongo.database import Database
+from pymongo.errors import PyMongoError
 
 from src.infrastructure.database import db
 from src.services import auth_service
@@ -17,12 +23,128 @@ from src.services.avner_learning import (
 
 admin_bp = Blueprint('admin', __name__)
 
+# CPU usage is sampled by a background thread (each sample spans this many
+# seconds) so health requests read the latest value instead of blocking.
+CPU_SAMPLE_INTERVAL_S = 2.0
+_cpu_percent: Optional[float] = None
+_cpu_sampler: Optional[threading.Thread] = None
+_cpu_lock = threading.Lock()
+
+
+def _sample_cpu() -> None:
+    global _cpu_percent
+    while True:
+        _cpu_percent = psutil.cpu_percent(interval=CPU_SAMPLE_INTERVAL_S)
+
+
+def _current_cpu_percent() -> float:
+    """Latest CPU usage; starts the sampler on first use."""
+    global _cpu_sampler
+    if _cpu_sampler is None:
+        with _cpu_lock:
+            if _cpu_sampler is None:
+                _cpu_sampler = threading.Thread(target=_sample_cpu, name="admin-cpu-sampler", daemon=True)
+                _cpu_sampler.start()
+    if _cpu_percent is None:
+        # First request after start-up: a short sample until the thread reports
+        return psutil.cpu_percent(interval=0.1)
+    return _cpu_percent
+
+
+# Host details that can't change while the process runs
+_PLATFORM_INFO = {
+    "platform": platform.system(),
+    "platform_version": platform.version(),
+    "python_version": platform.python_version(),
+    "hostname": platform.node(),
+}
+_BOOT_TIME = psutil.boot_time()
+_CPU_COUNT = psutil.cpu_count()
+
+
+# Health and statistics are requested by the dashboard, /system and the
+# polled JSON endpoints; results are reused for a few seconds. dbStats walks
+# every collection's stats, so it is kept longer.
+HEALTH_CACHE_TTL_S = 5
+STATS_CACHE_TTL_S = 5
+DB_STATS_CACHE_TTL_S = 30
+_ttl_cache: dict = {}
+_ttl_lock = threading.Lock()
+
+
+def _cached(key: str, ttl: float, compute):
+    """Return the value stored under ``key`` if younger than ``ttl``, else recompute it."""
+    now = time.monotonic()
+    with _ttl_lock:
+        hit = _ttl_cache.get(key)
+    if hit is not None and hit[0] > now:
+        return hit[1]
+    value = compute()
+    if value:  # empty results mean the lookup failed; retry next time
+        with _ttl_lock:
+            _ttl_cache[key] = (now + ttl, value)
+    return value
+
+
+# Last SystemConfig read, and the stored updated_at it was built from. Other
+# workers may update the document, so a hit is confirmed by reading only
+# updated_at instead of refetching and re-validating the whole document.
+_config_cache: Optional[SystemConfig] = None
+_config_version: Optional[datetime] = None
+# The config is read on user-facing pages too (library, Avner), so a cached
+# copy is trusted without any round trip for this long after it was checked.
+# Updates made in this process invalidate it at once; other workers' updates
+# are seen within this delay.
+CONFIG_RECHECK_S = 10
+_config_checked_at = 0.0
+
+
+# What the dashboard's recent-users list renders
+RECENT_USERS_SHOWN = 5
+RECENT_USER_FIELDS = {"_id": 0, "name": 1, "email": 1, "is_verified": 1}
+
+# Indexes behind the dashboard's sorted list and statistics, created once per
+# process. The status index lets the per-status $group read the index alone.
+_DASHBOARD_INDEXES = (
+    ("users", [("created_at", -1)], {}),
+    ("tasks", [("status", 1)], {}),
+)
+_indexes_ready = False
+
+
+def _ensure_dashboard_indexes(database: Optional[Database] = None) -> None:
+    """Create the dashboard indexes (idempotent) the first time they are needed."""
+    global _indexes_ready
+    if _indexes_ready:
+        return
+    database = database if database is not None else db
+    try:
+        for collection, keys, options in _DASHBOARD_INDEXES:
+            database[collection].create_index(keys, **options)
+        _indexes_ready = True
+    except PyMongoError as e:
+        logger.warning("Could not create admin dashboard indexes: %s", e)
+
 
 def get_system_config() -> SystemConfig:
     """Get or create system configuration."""
+    global _config_cache, _config_version, _config_checked_at
+    cached = _config_cache
+    if cached is not None:
+        now = time.monotonic()
+        if now - _config_checked_at < CONFIG_RECHECK_S:
+            return cached
+        current = db.system_config.find_one({"_id": "system_config"}, {"updated_at": 1})
+        if current is not None and current.get("updated_at") == _config_version:
+            _config_checked_at = now
+            return cached
+
     config_data = db.system_config.find_one({"_id": "system_config"})
     if config_data:
-        return SystemConfig(**config_data)
+        config = SystemConfig(**config_data)
+        _config_cache, _config_version = config, config_data.get("updated_at")
+        _config_checked_at = time.monotonic()
+        return config
     # Create default config
     config = SystemConfig()
     db.system_config.insert_one(config.to_dict())
@@ -31,17 +153,24 @@ def get_system_config() -> SystemConfig:
 
 def update_system_config(updates: dict) -> bool:
     """Update system configuration."""
+    global _config_cache
     updates["updated_at"] = datetime.now(timezone.utc)
     result = db.system_config.update_one(
         {"_id": "system_config"},
         {"$set": updates},
         upsert=True
     )
+    _config_cache = None
     return result.modified_count > 0 or result.upserted_id is not None
 
 
-def get_system_health():
-    """Get system health information."""
+def get_system_health(db_conn: Optional[Database] = None):
+    """Get system health information (cached for HEALTH_CACHE_TTL_S)."""
+    database = db_conn if db_conn is not None else db
+    return _cached("health", HEALTH_CACHE_TTL_S, lambda: _collect_system_health(database))
+
+
+def _collect_system_health(database: Database) -> dict:
     health = {
         "status": "healthy",
         "issues": [],
@@ -50,10 +179,10 @@ def get_system_health():
 
     try:
         # CPU Usage
-        cpu_percent = psutil.cpu_percent(interval=1)
+        cpu_percent = _current_cpu_percent()
         health["metrics"]["cpu"] = {
             "percent": cpu_percent,
-            "cores": psutil.cpu_count(),
+            "cores": _CPU_COUNT,
             "status": "good" if cpu_percent < 80 else "warning" if cpu_percent < 95 else "critical"
         }
         if cpu_percent >= 80:
@@ -85,16 +214,13 @@ def get_system_health():
 
         # System Info
         health["metrics"]["system"] = {
-            "platform": platform.system(),
-            "platform_version": platform.version(),
-            "python_version": platform.python_version(),
-            "hostname": platform.node(),
-            "uptime_hours": round((datetime.now().timestamp() - psutil.boot_time()) / 3600, 1)
+            **_PLATFORM_INFO,
+            "uptime_hours": round((time.time() - _BOOT_TIME) / 3600, 1)
         }
 
         # Database Status
         try:
-            db_stats = db.command("dbStats")
+            db_stats = _cached("dbStats", DB_STATS_CACHE_TTL_S, lambda: database.command("dbStats"))
             health["metrics"]["database"] = {
                 "status": "connected",
                 "size_mb": round(db_stats.get("dataSize", 0) / (1024**2), 2),
@@ -115,75 +241,163 @@ def get_system_health():
             health["status"] = "warning"
 
     except Exception as e:
-        logger.error(f"Error getting system health: {e}")
+        logger.error("Error getting system health: %s", e)
         health["status"] = "error"
         health["issues"].append(f"Error collecting metrics: {str(e)}")
 
     return health
 
 
-def get_app_statistics():
-    """Get application-specific statistics."""
+def _facet_counts(collection, filters: dict) -> dict:
+    """
+    Count documents for several filters in one aggregation round trip.
+
+    `filters` maps a result name to a query ({} counts everything).
+    """
+    facet = {
+        name: ([{"$match": query}] if query else []) + [{"$count": "n"}]
+        for name, query in filters.items()
+    }
+    result = next(collection.aggregate([{"$facet": facet}]), {})
+    # $count emits nothing (not 0) when no document matches
+    return {name: (result.get(name) or [{"n": 0}])[0]["n"] for name in filters}
+
+
+def _status_counts(collection, statuses: tuple) -> dict:
+    """
+    Count documents per status in one $group pass, keyed by lower-case status.
+
+    ``total`` covers every document, including statuses not listed. The
+    leading $sort lets the server walk the status index without fetching
+    documents.
+    """
+    groups = {row["_id"]: row["n"] for row in collection.aggregate([
+        {"$sort": {"status": 1}},
+        {"$group": {"_id": "$status", "n": {"$sum": 1}}},
+    ])}
+    counts = {"total": sum(groups.values())}
+    for status in statuses:
+        counts[status.lower()] = groups.get(status, 0)
+    return counts
+
+
+def get_app_statistics(db_conn: Optional[Database] = None):
+    """
+    Get application-specific statistics (cached for STATS_CACHE_TTL_S).
+
+    User and task counts come from one aggregation per collection and are
+    exact. Content totals come from collection metadata
+    (estimated_document_count), so they may lag briefly after writes or an
+    unclean shutdown.
+    """
+    database = db_conn if db_conn is not None else db
+    return _cached("stats", STATS_CACHE_TTL_S, lambda: _collect_app_statistics(database))
+
+
+def _collect_app_statistics(database: Database) -> dict:
+    _ensure_dashboard_indexes(database)
+    start_of_day = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
     try:
-        stats = {
-            "users": {
-                "total": db.users.count_documents({}),
-                "verified": db.users.count_documents({"is_verified": True}),
-                "active": db.users.count_documents({"is_active": True}),
-                "admins": db.users.count_documents({"role": "admin"}),
-                "today": db.users.count_documents({
-                    "created_at": {"$gte": datetime.now(timezone.utc).replace(hour=0, minute=0, second=0)}
-                })
+        users = _facet_counts(database.users, {
+            "total": {},
+            "verified": {"is_verified": True},
+            "active": {"is_active": True},
+            "admins": {"role": "admin"},
+            "today": {
+                "created_at": {"$gte": start_of_day}
             },
+        })
+        stats = {
+            "users": users,
             "content": {
-                "documents": db.documents.count_documents({}),
-                "courses": db.courses.count_documents({}) if "courses" in db.list_collection_names() else 0,
-                "summaries": db.summaries.count_documents({}) if "summaries" in db.list_collection_names() else 0,
-                "flashcard_sets": db.flashcard_sets.count_documents({}),
-                "assessments": db.assessments.count_documents({})
+                "documents": database.documents.estimated_document_count(),
+                "courses": database.courses.estimated_document_count(),
+                "summaries": database.summaries.estimated_document_count(),
+                "flashcard_sets": database.flashcard_sets.estimated_document_count(),
+                "assessments": database.assessments.estimated_document_count()
             },
-            "tasks": {
-                "total": db.tasks.count_documents({}),
-                "pending": db.tasks.count_documents({"status": "PENDING"}),
-                "processing": db.tasks.count_documents({"status": "PROCESSING"}),
-                "completed": db.tasks.count_documents({"status": "COMPLETED"}),
-                "failed": db.tasks.count_documents({"status": "FAILED"})
-            }
+            "tasks": _status_counts(database.tasks, ("PENDING", "PROCESSING", "COMPLETED", "FAILED")),
         }
         return stats
     except Exception as e:
-        logger.error(f"Error getting app statistics: {e}")
+        logger.error("Error getting app statistics: %s", e)
         return {}
 
 
+# /api/stats is polled by open dashboards. It serves statistics stored in
+# MongoDB (shared by all workers) and refreshed by a background thread,
+# instead of re-counting every collection per poll.
+STATS_SNAPSHOT_INTERVAL_S = 30
+_stats_refresher: Optional[threading.Thread] = None
+_stats_lock = threading.Lock()
+
+
+def _refresh_stats_snapshot(database: Database) -> None:
+    """Recompute the stored statistics unless another worker just did."""
+    current = database.stats_snapshot.find_one({"_id": "current"}, {"refreshed_at": 1})
+    if current and time.time() - current["refreshed_at"] < STATS_SNAPSHOT_INTERVAL_S:
+        return
+    stats = get_app_statistics(database)
+    if stats:
+        database.stats_snapshot.replace_one(
+            {"_id": "current"}, {"stats": stats, "refreshed_at": time.time()}, upsert=True
+        )
+
+
+def _periodic_stats_refresh(database: Database) -> None:
+    while True:
+        try:
+            _refresh_stats_snapshot(database)
+        except PyMongoError as e:
+            logger.warning("Stats snapshot refresh failed: %s", e)
+        time.sleep(STATS_SNAPSHOT_INTERVAL_S)
+
+
+def get_stats_snapshot(database: Database) -> dict:
+    """
+    Latest stored application statistics.
+
+    Starts the refresher thread on first use; until a snapshot has been
+    stored the statistics are computed inline.
+    """
+    global _stats_refresher
+    if _stats_refresher is None:
+        with _stats_lock:
+            if _stats_refresher is None:
+                _stats_refresher = threading.Thread(
+                    target=_periodic_stats_refresh, args=(database,), name="admin-stats-refresher", daemon=True
+                )
+                _stats_refresher.start()
+    snapshot = database.stats_snapshot.find_one({"_id": "current"}, {"stats": 1})
+    if snapshot is None:
+        return get_app_statistics(database)
+    return snapshot["stats"]
+
+
+def _current_db() -> Database:
+    """The database behind the ``db`` proxy, usable outside the app context."""
+    get_current = getattr(db, "_get_current_object", None)
+    return get_current() if callable(get_current) else db
+
+
 @admin_bp.route('/')
 @login_required
 @admin_required
 def dashboard():
     """Admin dashboard with system status."""
-    # Get system health
-    health = get_system_health()
-
-    # Get app statistics
-    stats = get_app_statistics()
-
-    # Get recent users
-    recent_users = list(db.users.find().sort("created_at", -1).limit(10))
+    _ensure_dashboard_indexes()
 
-    # Get recent errors/warnings from tasks
-    recent_failures = list(db.tasks.find({"status": "FAILED"}).sort("updated_at", -1).limit(5))
+    # Health and statistics are fetched by the page from /api/stats once it
+    # has rendered; only the recent-users list shown in the HTML is loaded here.
+    recent_users = list(
+        db.users.find({}, RECENT_USER_FIELDS).sort("created_at", -1).limit(RECENT_USERS_SHOWN)
+    )
 
     # Get system config
     config = get_system_config()
 
     return render_template('admin/dashboard.html',
-                           health=health,
-                           stats=stats,
-                           user_count=stats.get('users', {}).get('total', 0),
-                           doc_count=stats.get('content', {}).get('documents', 0),
-                           task_count=stats.get('tasks', {}).get('completed', 0),
                            recent_users=recent_users,
-                           recent_failures=recent_failures,
                            config=config)
 
 
@@ -227,7 +441,7 @@ def toggle_user_status(user_id):
 
     status_text = 'הוסרה החסימה' if new_status else 'נחסם'
     flash(f'המשתמש {status_text} בהצלחה', 'success')
-    logger.info(f"Admin {'unbanned' if new_status else 'banned'} user {user_id}")
+    logger.info("Admin %s user %s", "unbanned" if new_status else "banned", user_id)
 
     return redirect(url_for('admin.users'))
 
@@ -244,7 +458,7 @@ def delete_user(user_id):
 
     if auth_service.delete_user(db, user_id):
         flash('המשתמש נמחק בהצלחה', 'success')
-        logger.info(f"Admin deleted user {user_id}")
+        logger.info("Admin deleted user %s", user_id)
     else:
         flash('שגיאה במחיקת המשתמש', 'error')
 
@@ -276,7 +490,7 @@ def config():
             logger.info("Admin updated system configuration")
 
         except Exception as e:
-            logger.error(f"Config update error: {e}", exc_info=True)
+            logger.error("Config update error: %s", e, exc_info=True)
             flash('שגיאה בעדכון ההגדרות', 'error')
 
         return redirect(url_for('admin.config'))
@@ -290,7 +504,7 @@ def config():
 @admin_required
 def api_stats():
     """Get system statistics as JSON."""
-    stats = get_app_statistics()
+    stats = get_stats_snapshot(_current_db())
     return jsonify(stats)
 
 
@@ -401,7 +615,7 @@ def avner_learning():
                 flash('Unknown form type.', 'error')
 
         except Exception as e:
-            logger.error(f"Error in avner_learning POST: {e}", exc_info=True)
+            logger.error("Error in avner_learning POST: %s", e, exc_info=True)
             flash('An error occurred while saving data.', 'error')
 
         return redirect(url_for('admin.avner_learning'))
@@ -412,26 +626,26 @@ def avner_learning():
     try:
         stats = admin_teaching.get_admin_dashboard_stats()
     except Exception as e:
-        logger.error(f"Error loading Avner dashboard stats: {e}", exc_info=True)
+        logger.error("Error loading Avner dashboard stats: %s", e, exc_info=True)
         stats = {}
 
     try:
         teaching_examples = admin_teaching.get_teaching_examples(category=None, tags=None)
     except Exception as e:
-        logger.error(f"Error loading teaching examples: {e}", exc_info=True)
+        logger.error("Error loading teaching examples: %s", e, exc_info=True)
         teaching_examples = []
 
     try:
         improvement_rules = admin_teaching.get_improvement_rules(rule_type=None)
     except Exception as e:
-        logger.error(f"Error loading improvement rules: {e}", exc_info=True)
+        logger.error("Error loading improvement rules: %s", e, exc_info=True)
         improvement_rules = []
 
     # Optional: basic usage patterns (e.g. which task types students use most)
     try:
         usage = usage_analytics.get_usage_patterns(filters={})
     except Exception as e:
-        logger.error(f"Error loading usage patterns: {e}", exc_info=True)
+        logger.error("Error loading usage patterns: %s", e, exc_info=True)
         usage = []
 
     return render_template(
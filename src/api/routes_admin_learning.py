@@ -78,7 +78,7 @@ def get_dashboard():
         }), 200
         
     except Exception as e:
-        logger.error(f"Dashboard error: {e}", exc_info=True)
+        logger.error("Dashboard error: %s", e, exc_info=True)
         return jsonify({"error": str(e)}), 500
 
 
@@ -113,7 +113,7 @@ def get_usage_patterns():
         }), 200
         
     except Exception as e:
-        logger.error(f"Usage patterns error: {e}", exc_info=True)
+        logger.error("Usage patterns error: %s", e, exc_info=True)
         return jsonify({"error": str(e)}), 500
 
 
@@ -165,7 +165,7 @@ def add_teaching_example():
         }), 201
         
     except Exception as e:
-        logger.error(f"Add teaching example error: {e}", exc_info=True)
+        logger.error("Add teaching example error: %s", e, exc_info=True)
         return jsonify({"error": str(e)}), 500
 
 
@@ -198,7 +198,7 @@ def get_teaching_examples():
         }), 200
         
     except Exception as e:
-        logger.error(f"Get teaching examples error: {e}", exc_info=True)
+        logger.error("Get teaching examples error: %s", e, exc_info=True)
         return jsonify({"error": str(e)}), 500
 
 
@@ -254,7 +254,7 @@ def add_improvement_rule():
         }), 201
         
     except Exception as e:
-        logger.error(f"Add improvement rule error: {e}", exc_info=True)
+        logger.error("Add improvement rule error: %s", e, exc_info=True)
         return jsonify({"error": str(e)}), 500
 
 
@@ -285,7 +285,7 @@ def get_improvement_rules():
         }), 200
         
     except Exception as e:
-        logger.error(f"Get improvement rules error: {e}", exc_info=True)
+        logger.error("Get improvement rules error: %s", e, exc_info=True)
         return jsonify({"error": str(e)}), 500
 
 
@@ -319,7 +319,7 @@ def update_improvement_rule(rule_id):
         }), 200
         
     except Exception as e:
-        logger.error(f"Update improvement rule error: {e}", exc_info=True)
+        logger.error("Update improvement rule error: %s", e, exc_info=True)
         return jsonify({"error": str(e)}), 500
 
 
@@ -349,7 +349,7 @@ def analyze_user_behavior(user_id):
         }), 200
         
     except Exception as e:
-        logger.error(f"Analyze user behavior error: {e}", exc_info=True)
+        logger.error("Analyze user behavior error: %s", e, exc_info=True)
         return jsonify({"error": str(e)}), 500
 
 
@@ -402,7 +402,7 @@ def test_enhancement():
         }), 200
         
     except Exception as e:
-        logger.error(f"Test enhancement error: {e}", exc_info=True)
+        logger.error("Test enhancement error: %s", e, exc_info=True)
         return jsonify({"error": str(e)}), 500
 
 
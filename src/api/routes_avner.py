@@ -1,9 +1,13 @@
 """Routes for the Ask Avner helper feature - Live Chat with Avner."""
+import random
+import re
+
 from flask import Blueprint, request, jsonify, url_for
 from flask_login import current_user
 
 from src.infrastructure.database import db
 from src.infrastructure.rabbitmq import publish_task
+from src.domain.models.db_models import UserRole
 from src.services import auth_service, avner_service
 from src.services.task_service import create_task
 from src.api.routes_admin import get_system_config
@@ -67,6 +71,17 @@ OFFTOPIC_KEYWORDS = ["מזג אוויר", "weather", "ספורט", "sport", "פ
                      "אוכל", "food", "מתכון", "recipe"]
 
 
+def _keyword_pattern(keywords: list) -> re.Pattern:
+    """One precompiled alternation per keyword list (substring match, like `in`)."""
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+# Compiled once at import: every /ask request runs through these before any AI call
+_OFFTOPIC_PATTERN = _keyword_pattern(OFFTOPIC_KEYWORDS)
+_APP_PATTERNS = [(key, _keyword_pattern(keywords)) for key, keywords in APP_KEYWORDS.items()]
+_LEARNING_PATTERN = _keyword_pattern(LEARNING_KEYWORDS)
+
+
 def detect_question_type(question: str) -> tuple:
     """
     Detect the type of question.
@@ -75,20 +90,17 @@ def detect_question_type(question: str) -> tuple:
     question_lower = question.lower()
 
     # Check for off-topic first
-    for keyword in OFFTOPIC_KEYWORDS:
-        if keyword in question_lower:
-            return ('offtopic', None)
+    if _OFFTOPIC_PATTERN.search(question_lower):
+        return ('offtopic', None)
 
-    # Check for app-related questions
-    for key, keywords in APP_KEYWORDS.items():
-        for keyword in keywords:
-            if keyword in question_lower:
-                return ('app', key)
+    # Check for app-related questions (APP_KEYWORDS order decides ties)
+    for key, pattern in _APP_PATTERNS:
+        if pattern.search(question_lower):
+            return ('app', key)
 
     # Check for learning questions (needs AI)
-    for keyword in LEARNING_KEYWORDS:
-        if keyword in question_lower:
-            return ('learning', None)
+    if _LEARNING_PATTERN.search(question_lower):
+        return ('learning', None)
 
     # Default to learning if unclear (but short questions might be greetings)
     if len(question) < 15:
@@ -185,26 +197,14 @@ def ask_avner():
         config = get_system_config()
         user = auth_service.get_user_by_id(db, current_user.id)
 
-        from src.domain.models.db_models import UserRole
         if user and user.role != UserRole.ADMIN and user.prompt_count >= config.max_prompts_per_day:
             return jsonify({
                 "error": f"הגעת למגבלת {config.max_prompts_per_day} שאלות ליום. נסה שוב מחר! 🦫",
                 "limit_reached": True
             }), 429
 
-        # Get course context and language
-        context = ""
-        language = "he"
-
-        if course_id:
-            context, language = avner_service.get_course_context(
-                course_id, current_user.id, db
-            )
-        
-        # Get user's general context
-        user_context = avner_service.get_user_general_context(current_user.id, db)
-        if user_context:
-            context = f"{user_context}\n\n{context}" if context else user_context
+        # Get user + course context and language
+        context, language = avner_service.get_chat_context(course_id, current_user.id, db)
 
         # Create a task for async processing
         task_id = create_task(db)
@@ -267,7 +267,6 @@ def get_study_tips():
         "📖 קרא את הכותרות והסיכום קודם"
     ]
 
-    import random
     return jsonify({"tip": random.choice(tips)})
 
 
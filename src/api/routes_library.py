@@ -17,7 +17,7 @@ from flask_login import login_required, current_user
 from src.infrastructure.database import db
 from src.domain.models.db_models import Course, UserProfile, Language, UserRole
 from src.api.routes_admin import get_system_config
-from src.services import auth_service
+from src.services import auth_service, avner_service
 from src.utils.document_chunking import smart_retrieve_chunks
 from sb_utils.logger_utils import logger
 
@@ -77,7 +77,11 @@ def get_course_context(
     except Exception as e:
         logger.warning(f"Smart retrieval failed, falling back to naive approach: {e}")
 
-        documents = db.documents.find({"course_id": course_id, "user_id": user_id})
+        # Stream just the text in small batches: the loop usually stops early
+        documents = db.documents.find(
+            {"course_id": course_id, "user_id": user_id},
+            {"_id": 0, "content_text": 1},
+        ).batch_size(16)
         context_parts: list[str] = []
         total_chars = 0
 
@@ -286,6 +290,7 @@ def course_settings(course_id):
                 "updated_at": datetime.now(timezone.utc)
             }}
         )
+        avner_service.invalidate_course_context(current_user.id, course_id)
 
         flash('הקורס עודכן בהצלחה', 'success')
         return redirect(url_for('library.course_page', course_id=course_id))
@@ -307,6 +312,7 @@ def delete_course(course_id):
     db.flashcard_sets.delete_many({"course_id": course_id, "user_id": current_user.id})
     db.assessments.delete_many({"course_id": course_id, "user_id": current_user.id})
     db.courses.delete_one({"_id": course_id, "user_id": current_user.id})
+    avner_service.invalidate_course_context(current_user.id, course_id)
 
     logger.info(f"User {current_user.id} deleted course: {course.name}")
     flash('הקורס נמחק בהצלחה', 'success')
@@ -1,4 +1,6 @@
 """OAuth routes for Google and Apple Sign-In."""
+import json
+import time
 import uuid
 from datetime import datetime, timezone
 from flask import Blueprint, redirect, url_for, flash, request
@@ -56,7 +58,6 @@ def _generate_apple_client_secret():
         return ''
 
     import jwt
-    import time
 
     headers = {
         'kid': settings.APPLE_KEY_ID,
@@ -83,7 +84,6 @@ def _extract_apple_user_name(form_data) -> str:
     if 'user' not in form_data:
         return ''
     try:
-        import json
         user_data = json.loads(form_data['user'])
         name_data = user_data.get('name', {})
         first_name = name_data.get('firstName', '')
@@ -111,6 +111,7 @@ def _get_or_create_oauth_user(email: str, name: str, provider: str):
     # Create new user (auto-verified since OAuth verified email)
     user_id = str(uuid.uuid4())
     is_admin = email.lower() == settings.ADMIN_EMAIL.lower() if settings.ADMIN_EMAIL else False
+    now = datetime.now(timezone.utc)
 
     user = User(
         _id=user_id,
@@ -119,8 +120,8 @@ def _get_or_create_oauth_user(email: str, name: str, provider: str):
         name=name or email.split('@')[0],
         role=UserRole.ADMIN if is_admin else UserRole.USER,
         is_verified=True,  # OAuth users are pre-verified
-        created_at=datetime.now(timezone.utc),
-        last_login=datetime.now(timezone.utc)
+        created_at=now,
+        last_login=now
     )
 
     db.users.insert_one(user.to_dict())
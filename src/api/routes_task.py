@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 from typing import Union, Tuple
 
 from flask import Blueprint, jsonify, render_template, Response
@@ -17,10 +18,12 @@ def get_task_status_route(task_id: str) -> Union[Response, Tuple[Response, int]]
 
     Designed primarily for HTMX.
     """
-    logger.debug(
-        "Polling task status",
-        extra={"task_id": task_id, "route": "get_task_status_route"},
-    )
+    # Polled every few seconds per open page; skip building the extra dict
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Polling task status",
+            extra={"task_id": task_id, "route": "get_task_status_route"},
+        )
 
     try:
         task = get_task(task_id)
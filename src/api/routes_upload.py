@@ -12,9 +12,22 @@ from src.infrastructure.rabbitmq import publish_task
 from src.domain.models.db_models import Document, Task, DocumentStatus
 from src.services.file_service import get_file_service
 from sb_utils.logger_utils import logger
+from sb_utils.validation import validate_upload_size
 
 upload_bp = Blueprint("upload_bp", __name__)
 
+# Per-file limit for course uploads; matches the library page's client-side check
+MAX_UPLOAD_FILE_BYTES = 50 * 1024 * 1024
+
+
+def _stream_size(file_storage) -> int:
+    """Size of an uploaded file, leaving its stream rewound."""
+    stream = file_storage.stream
+    stream.seek(0, os.SEEK_END)
+    size = stream.tell()
+    stream.seek(0)
+    return size
+
 
 def _collect_files():
     """
@@ -37,11 +50,15 @@ def upload_files_route():
     """
     Handles file uploads for a course.
 
-    For each file:
+    All files are size-checked first, so a bad file in the batch is
+    rejected before anything is stored. Then, for each file:
       - save to GridFS
       - create Document in Mongo (status=PENDING)
       - create 'file_processing' Task
       - publish task to RabbitMQ
+
+    Documents and tasks are inserted with one insert_many each rather than
+    one round trip per file; tasks are published only after their rows exist.
     """
     user_id = current_user.id
     course_id = (request.form.get("course_id") or "default").strip() or "default"
@@ -50,14 +67,53 @@ def upload_files_route():
     if not files:
         return jsonify({"error": "No files provided"}), 400
 
+    # Reject empty/oversize files before anything is written to GridFS
+    sizes = []
+    for file_storage in files:
+        file_size = _stream_size(file_storage)
+        error = validate_upload_size(file_size, MAX_UPLOAD_FILE_BYTES)
+        if error:
+            status = 413 if file_size > MAX_UPLOAD_FILE_BYTES else 400
+            return jsonify({"error": error, "filename": file_storage.filename}), status
+        sizes.append(file_size)
+
     document_repo = MongoDocumentRepository(db)
     task_repo = MongoTaskRepository(db)
     file_service = get_file_service()
 
     created_docs: list[dict] = []
     created_tasks: list[dict] = []
+    pending: list[tuple[Document, Task]] = []
 
-    for file_storage in files:
+    def _flush():
+        """Persist and publish everything prepared so far."""
+        if not pending:
+            return
+        document_repo.create_many([doc for doc, _ in pending])
+        task_repo.create_many([task for _, task in pending])
+
+        for doc, task in pending:
+            publish_task(
+                queue_name="file_processing",
+                task_body={
+                    "task_id": task.id,
+                    "user_id": user_id,
+                    "course_id": course_id,
+                    "document_id": doc.id,
+                    "gridfs_id": doc.gridfs_id,
+                    "filename": doc.filename,
+                    "content_type": doc.content_type,
+                    "file_size": doc.file_size,
+                },
+            )
+
+            created_docs.append({"document_id": doc.id, "filename": doc.filename})
+            created_tasks.append({"task_id": task.id, "document_id": doc.id})
+
+            logger.info(f"Uploaded file: {doc.filename} doc={doc.id} task={task.id}")
+        pending.clear()
+
+    for file_storage, file_size in zip(files, sizes):
         original_name = file_storage.filename or "upload"
         safe_name = secure_filename(original_name) or "upload"
         ext = os.path.splitext(safe_name)[1].lower()
@@ -68,11 +124,6 @@ def upload_files_route():
         #     return jsonify({"error": f"File type not allowed: {ext}"}), 400
 
         try:
-            # Get file size
-            file_storage.stream.seek(0, os.SEEK_END)
-            file_size = file_storage.stream.tell()
-            file_storage.stream.seek(0)  # Reset stream position
-
             # Save binary into GridFS (file_service.save_file expects FileStorage object)
             gridfs_id = file_service.save_file(
                 file_stream=file_storage,
@@ -97,7 +148,6 @@ def upload_files_route():
                 gridfs_id=gridfs_id_str,
                 status=DocumentStatus.PENDING,
             )
-            document_repo.create(doc)
 
             # Create Task
             task = Task(
@@ -108,30 +158,21 @@ def upload_files_route():
                 status="PENDING",
                 document_id=doc.id,
             )
-            task_repo.create(task)
-
-            # Publish
-            publish_task(
-                queue_name="file_processing",
-                task_body={
-                    "task_id": task.id,
-                    "user_id": user_id,
-                    "course_id": course_id,
-                    "document_id": doc.id,
-                    "gridfs_id": gridfs_id_str,
-                    "filename": safe_name,
-                    "content_type": doc.content_type,
-                    "file_size": file_size,
-                },
-            )
-
-            created_docs.append({"document_id": doc.id, "filename": safe_name})
-            created_tasks.append({"task_id": task.id, "document_id": doc.id})
-
-            logger.info(f"Uploaded file: {safe_name} doc={doc.id} task={task.id}")
+            pending.append((doc, task))
 
         except Exception as e:
             logger.error(f"Upload failed for file {original_name}: {e}", exc_info=True)
+            # Files before the failing one were stored; keep them processing
+            try:
+                _flush()
+            except Exception as flush_error:
+                logger.error(f"Failed to register earlier uploads: {flush_error}", exc_info=True)
             return jsonify({"error": f"Upload failed for {original_name}"}), 500
 
+    try:
+        _flush()
+    except Exception as e:
+        logger.error(f"Upload failed while registering files: {e}", exc_info=True)
+        return jsonify({"error": "Upload failed"}), 500
+
     return jsonify({"documents": created_docs, "tasks": created_tasks}), 201
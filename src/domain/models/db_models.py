@@ -33,6 +33,11 @@ def _utc_now():
     return datetime.now(timezone.utc)
 
 
+def _same_as_created(data: dict) -> datetime:
+    """Default updated_at to created_at, so new records don't read the clock twice."""
+    return data.get("created_at") or _utc_now()
+
+
 class UserProfile(BaseModel):
     """Extended user profile with personal and student info."""
     model_config = ConfigDict(populate_by_name=True)
@@ -73,7 +78,7 @@ class Course(BaseModel):
     assessment_count: int = 0
     # Timestamps
     created_at: datetime = Field(default_factory=_utc_now)
-    updated_at: datetime = Field(default_factory=_utc_now)
+    updated_at: datetime = Field(default_factory=_same_as_created)
 
     def to_dict(self):
         """Convert model to dictionary for MongoDB."""
@@ -204,7 +209,7 @@ class Task(BaseModel):
     course_id: Optional[str] = None  # Which course this task belongs to
     task_type: str = ""  # "summary", "flashcards", "assess", "homework"
     created_at: datetime = Field(default_factory=_utc_now)
-    updated_at: datetime = Field(default_factory=_utc_now)
+    updated_at: datetime = Field(default_factory=_same_as_created)
 
     def to_dict(self):
         """Convert model to dictionary for MongoDB."""
@@ -260,7 +265,7 @@ class TutorSession(BaseModel):
     chat_history: List[Dict] = Field(default_factory=list)  # Chat messages
     completed_steps: List[int] = Field(default_factory=list)  # Which steps are done
     created_at: datetime = Field(default_factory=_utc_now)
-    updated_at: datetime = Field(default_factory=_utc_now)
+    updated_at: datetime = Field(default_factory=_same_as_created)
 
     def to_dict(self):
         """Convert model to dictionary for MongoDB."""
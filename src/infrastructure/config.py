@@ -15,6 +15,10 @@ class Settings(BaseSettings):
     # --- Infrastructure ---
     MONGO_URI: str
     RABBITMQ_URI: str
+    MONGO_MAX_POOL_SIZE: int = 50
+    MONGO_MIN_POOL_SIZE: int = 5
+    MONGO_WAIT_QUEUE_TIMEOUT_MS: int = 5000
+    MONGO_COMPRESSORS: str = "zlib"  # wire compression, comma-separated; zstd/snappy need extra packages ("" disables)
 
     # --- AI Services ---
     OPENAI_API_KEY: str = ""
@@ -25,11 +29,18 @@ class Settings(BaseSettings):
     SB_GEMINI_MODEL: str = "gemini-1.5-flash-latest"
     SB_DEFAULT_PROVIDER: str = "gemini"
     SB_BASE_URL: str = ""
+    SB_CONTEXT_TOKEN_BUDGET: int = 12000  # cap for multi-document context (~4 chars/token)
+    SB_CONTEXT_PARALLEL_DOCS: int = 8  # documents whose context is loaded at the same time
+    SB_PREWARM_CONNECTIONS: bool = True  # open the AI provider connection at worker start-up
+    SB_RESPONSE_CACHE_SIZE: int = 256  # identical prepared prompts answered from memory (0 disables)
+    SB_RESPONSE_CACHE_TTL_SECONDS: int = 600
 
     # --- Security ---
     SESSION_COOKIE_SECURE: bool = True
     SESSION_COOKIE_HTTPONLY: bool = True
     SESSION_COOKIE_SAMESITE: str = 'Lax'
+    MAX_CONTENT_LENGTH: int = 200 * 1024 * 1024  # whole request; library uploads send several 50MB files at once
+    MAX_FORM_PARTS: int = 100  # multipart fields + files parsed per request
 
     # --- OAuth ---
     BASE_URL: str = ""  # Base URL for OAuth redirects (e.g., https://yourdomain.com)
@@ -49,6 +60,11 @@ class Settings(BaseSettings):
     MAIL_DEFAULT_SENDER: str = "noreply@studybuddy.ai"
     ADMIN_EMAIL: str = ""
 
+    # --- Health Monitoring ---
+    HEALTH_PERIODIC_CHECK_S: int = 30  # refresh interval of the cached /health/detailed snapshot
+    ALERT_COOLDOWN_SECONDS: int = 3600  # per component/status, shared via MongoDB
+    ALERT_GRACE_SECONDS: int = 120  # no alerts right after start-up
+
     # --- Logging ---
     LOG_LEVEL: str = "INFO"
 
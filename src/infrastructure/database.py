@@ -1,7 +1,38 @@
+import threading
+
 from flask import current_app, g
 from pymongo import MongoClient
 from werkzeug.local import LocalProxy
 
+from src.infrastructure.config import settings
+
+# One MongoClient per URI for the whole process. MongoClient is thread-safe
+# and pools connections itself, so app instances (e.g. the health monitor's
+# create_app() per cycle) must share it instead of opening their own.
+_clients: dict[str, MongoClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_mongo_client(uri: str) -> MongoClient:
+    """Return the shared MongoClient for ``uri``, creating it on first use."""
+    client = _clients.get(uri)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(uri)
+            if client is None:
+                options = {}
+                if settings.MONGO_COMPRESSORS:
+                    options["compressors"] = settings.MONGO_COMPRESSORS
+                client = MongoClient(
+                    uri,
+                    maxPoolSize=settings.MONGO_MAX_POOL_SIZE,
+                    minPoolSize=settings.MONGO_MIN_POOL_SIZE,
+                    waitQueueTimeoutMS=settings.MONGO_WAIT_QUEUE_TIMEOUT_MS,
+                    **options,
+                )
+                _clients[uri] = client
+    return client
+
 
 def get_db():
     """
@@ -10,7 +41,7 @@ def get_db():
     """
     if 'db' not in g:
         if 'mongo_client' not in current_app.extensions:
-            current_app.extensions['mongo_client'] = MongoClient(current_app.config['MONGO_URI'])
+            current_app.extensions['mongo_client'] = get_mongo_client(current_app.config['MONGO_URI'])
 
         # The database name is expected to be part of the MONGO_URI
         # e.g., mongodb://host:port/dbname
@@ -1,9 +1,98 @@
-import json
+import threading
+from typing import Optional
+
+import orjson
 import pika
 
 from src.infrastructure.config import settings
 from sb_utils.logger_utils import logger
 
+# Health probes must fail fast: one connection attempt and short timeouts,
+# never pika's retrying defaults. A single socket operation gets this share
+# of the probe's overall timeout.
+PROBE_SOCKET_SHARE = 0.75
+
+
+def connection_parameters(probe_timeout: Optional[float] = None) -> pika.URLParameters:
+    """
+    Build connection parameters from RABBITMQ_URI.
+
+    With ``probe_timeout`` the parameters are tuned for liveness checks that
+    should report "down" quickly: the whole connection setup is bounded by
+    ``probe_timeout`` seconds instead of waiting for the broker.
+    """
+    params = pika.URLParameters(settings.RABBITMQ_URI)
+    if probe_timeout is not None:
+        params.connection_attempts = 1
+        params.retry_delay = 0
+        params.socket_timeout = probe_timeout * PROBE_SOCKET_SHARE
+        params.stack_timeout = probe_timeout
+        params.blocked_connection_timeout = probe_timeout * PROBE_SOCKET_SHARE
+    return params
+
+
+# Shared publisher connection for this process. BlockingConnection is not
+# thread-safe, so every use goes through _publisher_lock.
+_publisher_lock = threading.Lock()
+_publisher_conn: Optional[pika.BlockingConnection] = None
+_publisher_channel = None
+_declared_queues: set[str] = set()
+
+
+def _get_publisher_channel():
+    global _publisher_conn, _publisher_channel
+    if _publisher_conn is None or not _publisher_conn.is_open:
+        _publisher_conn = pika.BlockingConnection(connection_parameters())
+        _publisher_channel = None
+        _declared_queues.clear()
+    if _publisher_channel is None or not _publisher_channel.is_open:
+        _publisher_channel = _publisher_conn.channel()
+        # Publisher confirms: basic_publish returns only once the broker has
+        # taken the message, and raises NackError if it refused it.
+        _publisher_channel.confirm_delivery()
+        _declared_queues.clear()
+    return _publisher_channel
+
+
+# Errors meaning the connection or channel went away before the publish, so
+# sending again on a fresh connection is safe. A NackError/UnroutableError is
+# the broker's answer to this very message and must not be republished.
+_RECONNECT_ERRORS = (
+    pika.exceptions.AMQPConnectionError,
+    pika.exceptions.ChannelClosed,
+    pika.exceptions.ChannelWrongStateError,
+)
+
+
+def _reset_publisher() -> None:
+    global _publisher_conn, _publisher_channel
+    if _publisher_conn is not None:
+        try:
+            _publisher_conn.close()
+        except Exception:
+            pass
+    _publisher_conn = None
+    _publisher_channel = None
+    _declared_queues.clear()
+
+
+def _publish(queue_name: str, body: bytes) -> None:
+    channel = _get_publisher_channel()
+
+    # Durable queue (declared once per channel)
+    if queue_name not in _declared_queues:
+        channel.queue_declare(queue=queue_name, durable=True)
+        _declared_queues.add(queue_name)
+
+    channel.basic_publish(
+        exchange="",
+        routing_key=queue_name,
+        body=body,
+        properties=pika.BasicProperties(
+            delivery_mode=2,  # persistent
+        ),
+    )
+
 
 def publish_task(queue_name: str, task_body: dict) -> None:
     """
@@ -11,45 +100,35 @@ def publish_task(queue_name: str, task_body: dict) -> None:
 
     - Declares the queue as durable.
     - Injects `queue_name` into the payload so the worker can route logic.
+    - Reuses one connection per process instead of connecting per task.
+    - Waits for the broker's publisher confirm, so a returned call means
+      the task was accepted.
     """
     payload = dict(task_body)
     payload["queue_name"] = queue_name  # 👈 worker relies on this
+    body = orjson.dumps(payload)
 
-    params = pika.URLParameters(settings.RABBITMQ_URI)
-    connection = None
-    try:
-        connection = pika.BlockingConnection(params)
-        channel = connection.channel()
+    with _publisher_lock:
+        try:
+            try:
+                _publish(queue_name, body)
+            except _RECONNECT_ERRORS:
+                # Idle connections get dropped by the broker; reconnect once
+                _reset_publisher()
+                _publish(queue_name, body)
 
-        # Durable queue
-        channel.queue_declare(queue=queue_name, durable=True)
+            logger.info(
+                "Published task to queue '%s' with payload keys: %s",
+                queue_name,
+                list(payload.keys()),
+            )
 
-        channel.basic_publish(
-            exchange="",
-            routing_key=queue_name,
-            body=json.dumps(payload),
-            properties=pika.BasicProperties(
-                delivery_mode=2,  # persistent
-            ),
-        )
-
-        logger.info(
-            "Published task to queue '%s' with payload keys: %s",
-            queue_name,
-            list(payload.keys()),
-        )
-
-    except Exception as e:
-        logger.error(
-            "Failed to publish task to queue '%s': %s",
-            queue_name,
-            e,
-            exc_info=True,
-        )
-        raise
-    finally:
-        if connection is not None:
-            try:
-                connection.close()
-            except Exception:
-                pass
+        except Exception as e:
+            logger.error(
+                "Failed to publish task to queue '%s': %s",
+                queue_name,
+                e,
+                exc_info=True,
+            )
+            _reset_publisher()
+            raise
@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime, timezone
-from typing import Optional, Union
+from typing import List, Optional, Union
 
 from bson import ObjectId
 from pymongo.database import Database
@@ -29,14 +29,12 @@ class MongoDocumentRepository(IDocumentRepository):
         if doc:
             return doc
 
-        # 2) Try as ObjectId
-        try:
-            oid = ObjectId(doc_id)
-            doc = self.collection.find_one({"_id": oid})
+        # 2) Try as ObjectId (checked up front: most ids are UUIDs, and
+        #    raising/catching InvalidId on every lookup is wasted work)
+        if ObjectId.is_valid(doc_id):
+            doc = self.collection.find_one({"_id": ObjectId(doc_id)})
             if doc:
                 return doc
-        except Exception:
-            pass
 
         # 3) Legacy: 'id' field
         doc = self.collection.find_one({"id": doc_id})
@@ -64,7 +62,7 @@ class MongoDocumentRepository(IDocumentRepository):
             )
             return None
 
-    def create(self, document: Document) -> None:
+    def _to_mongo(self, document: Document) -> dict:
         doc_dict = document.to_dict()
 
         # Ensure we always have a proper _id in Mongo
@@ -78,12 +76,22 @@ class MongoDocumentRepository(IDocumentRepository):
                 "MongoDocumentRepository.create.id_mismatch",
                 extra={"_id": doc_dict["_id"], "id": doc_dict["id"]},
             )
+        return doc_dict
 
+    def create(self, document: Document) -> None:
+        doc_dict = self._to_mongo(document)
         self.collection.insert_one(doc_dict)
         logger.info(
             f"Created document '{getattr(document, 'filename', '?')}' with ID: {getattr(document, 'id', doc_dict.get('_id'))}"
         )
 
+    def create_many(self, documents: List[Document]) -> None:
+        """Insert several documents in one round trip."""
+        if not documents:
+            return
+        self.collection.insert_many([self._to_mongo(d) for d in documents], ordered=False)
+        logger.info(f"Created {len(documents)} documents")
+
     def update(self, document: Document) -> None:
         """
         Update an existing document in Mongo.
@@ -98,14 +106,12 @@ class MongoDocumentRepository(IDocumentRepository):
 
         # Try to handle both string and ObjectId IDs
         query = {"_id": doc_id}
-        try:
-            # If stored as ObjectId, this will succeed
-            query_objid = {"_id": ObjectId(str(doc_id))}
-            result = self.collection.update_one(query_objid, {"$set": doc_dict})
-            if result.matched_count == 0:
-                # Fall back to plain string
-                result = self.collection.update_one(query, {"$set": doc_dict})
-        except Exception:
+        result = None
+        if ObjectId.is_valid(str(doc_id)):
+            # If stored as ObjectId, this will match
+            result = self.collection.update_one({"_id": ObjectId(str(doc_id))}, {"$set": doc_dict})
+        if result is None or result.matched_count == 0:
+            # Fall back to plain string
             result = self.collection.update_one(query, {"$set": doc_dict})
 
         if result.matched_count == 0:
@@ -204,6 +210,19 @@ class MongoTaskRepository(ITaskRepository):
         logger.info(f"Created new task with ID: {task.id}")
         return task
 
+    def create_many(self, tasks: List[Task]) -> None:
+        """Insert several ready-built tasks in one round trip."""
+        if not tasks:
+            return
+        task_dicts = []
+        for task in tasks:
+            task_dict = task.to_dict()
+            if "_id" not in task_dict:
+                task_dict["_id"] = getattr(task, "id", str(uuid.uuid4()))
+            task_dicts.append(task_dict)
+        self.collection.insert_many(task_dicts, ordered=False)
+        logger.info(f"Created {len(tasks)} tasks")
+
     def update_status(
         self,
         task_id: str,
@@ -0,0 +1,36 @@
+import orjson
+
+from sb_utils.logger_utils import logger
+
+_TOO_LARGE_BODY = orjson.dumps({"error": "הבקשה גדולה מדי. אנא העלה פחות קבצים או קבצים קטנים יותר."})
+
+
+class ContentLengthLimit:
+    """
+    WSGI middleware that rejects requests whose declared Content-Length is
+    over the limit before Flask routes the request, loads the session or
+    touches the body. Chunked requests without a Content-Length are left to
+    Werkzeug's MAX_CONTENT_LENGTH check while the form is parsed.
+    """
+
+    def __init__(self, app, max_bytes: int):
+        self.app = app
+        self.max_bytes = max_bytes
+
+    def __call__(self, environ, start_response):
+        try:
+            length = int(environ.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            length = 0
+        if length <= self.max_bytes:
+            return self.app(environ, start_response)
+
+        logger.warning("Rejected %s %s: Content-Length %d over %d",
+                       environ.get("REQUEST_METHOD"), environ.get("PATH_INFO"), length, self.max_bytes)
+        # Close the connection so the server doesn't drain the unread body
+        start_response("413 Request Entity Too Large", [
+            ("Content-Type", "application/json"),
+            ("Content-Length", str(len(_TOO_LARGE_BODY))),
+            ("Connection", "close"),
+        ])
+        return [_TOO_LARGE_BODY]
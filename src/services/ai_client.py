@@ -1,15 +1,24 @@
+import logging
 import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from hashlib import blake2b
 from typing import Optional, Literal, Dict, Any
 
 import google.generativeai as genai
+import httpx
 import openai
-from tenacity import retry, stop_after_attempt, wait_exponential
+from google.api_core import exceptions as google_exceptions
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
 
 from src.infrastructure.config import settings
 from sb_utils.logger_utils import logger
 from sb_utils.ai_safety import create_safety_guard_prompt
 from src.domain.errors import AIClientError
 from src.services.avner_learning import continuous_improvement
+from src.utils.smart_parser import estimate_tokens
 
 
 TaskType = Literal[
@@ -26,6 +35,118 @@ TaskType = Literal[
     "standard",
 ]
 
+# Tasks that always need structured JSON output (routed to OpenAI JSON mode)
+JSON_TASK_TYPES: frozenset[str] = frozenset({"quiz", "assessment", "flashcards"})
+
+# Keep-alive pool shared by all OpenAI calls of one client
+OPENAI_HTTP_LIMITS = httpx.Limits(
+    max_connections=64,
+    max_keepalive_connections=32,
+    keepalive_expiry=60,
+)
+
+
+# 4xx statuses worth retrying, for every provider: request timeout,
+# conflict and rate limit
+_TRANSIENT_CLIENT_STATUSES = frozenset({408, 409, 429})
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """
+    Whether a failed provider call is worth retrying.
+
+    Requests the provider rejected outright (bad request, auth, not found...)
+    fail the same way every time, so only rate limits, timeouts, conflicts,
+    5xx and connection errors are retried. Unknown errors are retried.
+    """
+    cause = exc.__cause__ or exc
+    if isinstance(cause, openai.APIStatusError):
+        return cause.status_code in _TRANSIENT_CLIENT_STATUSES or cause.status_code >= 500
+    if isinstance(cause, google_exceptions.ClientError):
+        return cause.code in _TRANSIENT_CLIENT_STATUSES
+    return True
+
+
+# Provider calls block the request thread between attempts: waits grow 2s, 4s
+# (capped at 10s) plus up to 1s of jitter, so requests that failed together
+# don't all retry at the same instant.
+_provider_retry = retry(
+    retry=retry_if_exception(_is_transient),
+    wait=wait_exponential_jitter(multiplier=2, max=10, jitter=1),
+    stop=stop_after_attempt(3),
+)
+
+def _fit_context(context: str) -> str:
+    """
+    Cap the material sent with a prompt at SB_CONTEXT_TOKEN_BUDGET tokens.
+
+    Multi-document contexts are packed within the budget already; this
+    catches single-document fallbacks that hand over a whole file's text.
+    """
+    max_chars = settings.SB_CONTEXT_TOKEN_BUDGET * 4
+    if len(context) <= max_chars:
+        return context
+    logger.warning(
+        "Context of ~%d tokens trimmed to the %d token budget",
+        estimate_tokens(context),
+        settings.SB_CONTEXT_TOKEN_BUDGET,
+    )
+    return context[:max_chars]
+
+
+# Prepared prompts start with the fixed safety block followed by the student's
+# material; only the task comes last. OpenAI reuses the prefill of a shared
+# prefix (from 1024 tokens, ~4 chars each) when requests with it reach the
+# same cache, and prompt_cache_key is the routing hint for that.
+_PROMPT_CACHE_PREFIX_CHARS = 4096
+
+
+def _prompt_cache_key(prompt: str) -> str:
+    """Routing key shared by requests whose prompts open with the same prefix."""
+    return blake2b(prompt[:_PROMPT_CACHE_PREFIX_CHARS].encode(), digest_size=16).hexdigest()
+
+
+# Tasks whose answer only depends on the prepared prompt, so an identical
+# request (same material, same user tweaks) can reuse the previous answer.
+# Quiz/flashcard/assessment generation is left out on purpose: asking again
+# is how students get a fresh set of questions.
+CACHEABLE_TASK_TYPES: frozenset[str] = frozenset({"summary", "glossary", "diagram"})
+
+# Answers keyed by a hash of (task, flags, prepared prompt) -> (expires_at, text)
+_responses: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+_responses_lock = threading.Lock()
+# Provider calls currently running for a cache key; identical requests that
+# arrive meanwhile wait for that answer instead of paying for their own.
+_inflight: Dict[str, Future] = {}
+
+
+def _response_key(task_type: str, require_json: bool, baby_mode: bool, prompt: str) -> str:
+    key = blake2b(digest_size=16)
+    key.update(f"{task_type}:{require_json:d}:{baby_mode:d}:".encode())
+    key.update(prompt.encode())
+    return key.hexdigest()
+
+
+def _cached_response(key: str) -> Optional[str]:
+    """Unexpired answer stored under ``key``; the caller holds _responses_lock."""
+    entry = _responses.get(key)
+    if entry is None:
+        return None
+    if entry[0] <= time.monotonic():
+        del _responses[key]
+        return None
+    _responses.move_to_end(key)
+    return entry[1]
+
+
+def _store_response(key: str, text: str) -> None:
+    with _responses_lock:
+        _responses[key] = (time.monotonic() + settings.SB_RESPONSE_CACHE_TTL_SECONDS, text)
+        _responses.move_to_end(key)
+        while len(_responses) > settings.SB_RESPONSE_CACHE_SIZE:
+            _responses.popitem(last=False)
+
+
 # Tasks where teaching-style improvements make sense
 TEACHING_TASK_TYPES: set[str] = {
     "summary",
@@ -43,6 +164,13 @@ class TripleHybridClient:
         self.provider = provider or settings.SB_DEFAULT_PROVIDER
         self._openai_initialized = False
         self._gemini_initialized = False
+        # One SDK client per AIClient: it is thread-safe and keeps its
+        # connection pool, so Flask threads and the worker share it instead
+        # of each call opening a fresh client.
+        self._openai_client: Optional[openai.OpenAI] = None
+        self._http: Optional[httpx.Client] = None
+        self._gemini_models: Dict[str, genai.GenerativeModel] = {}
+        self._client_lock = threading.Lock()
 
     # -------------------------------------------------------------------------
     # Provider init
@@ -54,6 +182,54 @@ class TripleHybridClient:
             raise ValueError("OpenAI API key is not configured.")
         self._openai_initialized = True
 
+    def _get_openai_client(self) -> openai.OpenAI:
+        if self._openai_client is not None:
+            return self._openai_client
+        with self._client_lock:
+            if self._openai_client is None:
+                self._http = httpx.Client(limits=OPENAI_HTTP_LIMITS, timeout=30.0)
+                client_args: Dict[str, Any] = {
+                    "api_key": settings.OPENAI_API_KEY,
+                    "timeout": 30.0,
+                    "http_client": self._http,
+                }
+                if getattr(settings, "SB_BASE_URL", None):
+                    client_args["base_url"] = settings.SB_BASE_URL
+                self._openai_client = openai.OpenAI(**client_args)
+        return self._openai_client
+
+    def _get_gemini_model(self, model_name: str) -> genai.GenerativeModel:
+        model = self._gemini_models.get(model_name)
+        if model is None:
+            model = self._gemini_models[model_name] = genai.GenerativeModel(model_name)
+        return model
+
+    def warm_up(self) -> None:
+        """
+        Open the OpenAI keep-alive connection in the background, so the first
+        real request doesn't pay the TCP + TLS handshake. Best-effort.
+        """
+        if not settings.SB_PREWARM_CONNECTIONS:
+            return
+        threading.Thread(target=self._warm_up, name="ai-client-warmup", daemon=True).start()
+
+    def _warm_up(self) -> None:
+        try:
+            self._ensure_openai_initialized()
+            client = self._get_openai_client()
+            self._http.head(str(client.base_url), timeout=5.0)
+            logger.debug("OpenAI connection pre-warmed")
+        except Exception as e:
+            logger.debug("OpenAI connection pre-warm skipped: %s", e)
+
+    def close(self) -> None:
+        """Release pooled HTTP connections (the client rebuilds them on next use)."""
+        if self._http is not None:
+            self._http.close()
+        self._http = None
+        self._openai_client = None
+        self._gemini_models.clear()
+
     def _ensure_gemini_initialized(self) -> None:
         if self._gemini_initialized:
             return
@@ -80,9 +256,11 @@ class TripleHybridClient:
         - `content` must already be fully prepared:
           safety-wrapped + context + any continuous-improvement tweaks.
         """
-        logger.debug(
-            f"Routing task_type='{task_type}' require_json={require_json} baby_mode={baby_mode}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Routing task_type='{task_type}' require_json={require_json} "
+                f"baby_mode={baby_mode} prompt_chars={len(content)}"
+            )
 
         # 1) Baby mode → OpenAI with baby style
         if baby_mode or task_type == "baby_capy":
@@ -90,7 +268,7 @@ class TripleHybridClient:
             return self._call_gpt_mini(content, require_json=False, baby_mode=True)
 
         # 2) JSON-structured tasks → OpenAI
-        if require_json or task_type in ["quiz", "assessment", "flashcards"]:
+        if require_json or task_type in JSON_TASK_TYPES:
             logger.info(
                 f"→ Routing to {settings.SB_OPENAI_MODEL} (JSON required for task_type={task_type})"
             )
@@ -108,7 +286,7 @@ class TripleHybridClient:
     # -------------------------------------------------------------------------
     # OpenAI path
     # -------------------------------------------------------------------------
-    @retry(wait=wait_exponential(multiplier=1, min=2, max=10), stop=stop_after_attempt(3))
+    @_provider_retry
     def _call_gpt_mini(
         self,
         prompt: str,
@@ -129,14 +307,7 @@ class TripleHybridClient:
             prompt = self._apply_baby_capy_prompt(prompt)
 
         try:
-            client_args: Dict[str, Any] = {
-                "api_key": settings.OPENAI_API_KEY,
-                "timeout": 30.0,
-            }
-            if getattr(settings, "SB_BASE_URL", None):
-                client_args["base_url"] = settings.SB_BASE_URL
-
-            client = openai.OpenAI(**client_args)
+            client = self._get_openai_client()
 
             messages = [{"role": "user", "content": prompt}]
             kwargs: Dict[str, Any] = {
@@ -144,6 +315,7 @@ class TripleHybridClient:
                 "messages": messages,
                 "max_tokens": 1500,
                 "temperature": 0.7,
+                "prompt_cache_key": _prompt_cache_key(prompt),
             }
 
             if require_json:
@@ -154,7 +326,7 @@ class TripleHybridClient:
                     )
 
             logger.debug(
-                f"Using {settings.SB_OPENAI_MODEL} (JSON: {require_json}, Baby: {baby_mode})"
+                "Using %s (JSON: %s, Baby: %s)", settings.SB_OPENAI_MODEL, require_json, baby_mode
             )
             response = client.chat.completions.create(**kwargs)
             return response.choices[0].message.content.strip()
@@ -168,7 +340,7 @@ class TripleHybridClient:
     # -------------------------------------------------------------------------
     # Gemini path
     # -------------------------------------------------------------------------
-    @retry(wait=wait_exponential(multiplier=1, min=2, max=10), stop=stop_after_attempt(3))
+    @_provider_retry
     def _call_gemini_flash(
         self,
         prompt: str,
@@ -183,9 +355,9 @@ class TripleHybridClient:
         self._ensure_gemini_initialized()
 
         try:
-            model = genai.GenerativeModel(settings.SB_GEMINI_MODEL)
+            model = self._get_gemini_model(settings.SB_GEMINI_MODEL)
             logger.debug(
-                f"Using {settings.SB_GEMINI_MODEL} (multimodal: {file_path is not None})"
+                "Using %s (multimodal: %s)", settings.SB_GEMINI_MODEL, file_path is not None
             )
 
             if file_path and os.path.exists(file_path):
@@ -223,30 +395,20 @@ class TripleHybridClient:
         return baby_prefix + prompt
 
     # -------------------------------------------------------------------------
-    # Main public entrypoint
+    # Prompt preparation
     # -------------------------------------------------------------------------
-    def generate_text(
+    def _prepare_prompt(
         self,
         prompt: str,
         context: str,
-        task_type: TaskType = "standard",
+        task_type: TaskType,
         *,
-        require_json: bool = False,
-        baby_mode: bool = False,
         user_id: Optional[str] = None,
         user_prefs: Optional[Dict[str, Any]] = None,
         use_learning: bool = True,
     ) -> str:
         """
-        Main high-level API used across the app.
-
-        - `prompt`: base task description (e.g. "Summarize...", "Create quiz...").
-        - `context`: the student's material / RAG context.
-        - `task_type`: semantic type of the task.
-        - `require_json`: enforce JSON for quiz/assessment/flashcards.
-        - `baby_mode`: Baby Avner explanation style.
-        - `user_id` / `user_prefs`: used by the continuous-improvement engine.
-        - `use_learning`: if False, skip all learning-based prompt tweaks.
+        Apply learning-based tweaks, then safety + context grounding.
         """
         effective_prompt = prompt
 
@@ -275,19 +437,90 @@ class TripleHybridClient:
             effective_prompt = prompt
 
         # 2) Safety + context grounding (single source of truth)
-        safe_full_prompt = create_safety_guard_prompt(
+        return create_safety_guard_prompt(
             prompt=effective_prompt,
-            context=context or "",
+            context=_fit_context(context or ""),
         )
 
-        # 3) Route to the right provider
-        return self.route_task(
-            task_type=task_type,
-            content=safe_full_prompt,
-            require_json=require_json,
-            baby_mode=baby_mode,
+    # -------------------------------------------------------------------------
+    # Main public entrypoint
+    # -------------------------------------------------------------------------
+    def generate_text(
+        self,
+        prompt: str,
+        context: str,
+        task_type: TaskType = "standard",
+        *,
+        require_json: bool = False,
+        baby_mode: bool = False,
+        user_id: Optional[str] = None,
+        user_prefs: Optional[Dict[str, Any]] = None,
+        use_learning: bool = True,
+    ) -> str:
+        """
+        Main high-level API used across the app.
+
+        - `prompt`: base task description (e.g. "Summarize...", "Create quiz...").
+        - `context`: the student's material / RAG context.
+        - `task_type`: semantic type of the task.
+        - `require_json`: enforce JSON for quiz/assessment/flashcards.
+        - `baby_mode`: Baby Avner explanation style.
+        - `user_id` / `user_prefs`: used by the continuous-improvement engine.
+        - `use_learning`: if False, skip all learning-based prompt tweaks.
+        """
+        safe_full_prompt = self._prepare_prompt(
+            prompt,
+            context,
+            task_type,
+            user_id=user_id,
+            user_prefs=user_prefs,
+            use_learning=use_learning,
         )
 
+        if task_type not in CACHEABLE_TASK_TYPES or settings.SB_RESPONSE_CACHE_SIZE <= 0:
+            # Route to the right provider
+            return self.route_task(
+                task_type=task_type,
+                content=safe_full_prompt,
+                require_json=require_json,
+                baby_mode=baby_mode,
+            )
+
+        cache_key = _response_key(task_type, require_json, baby_mode, safe_full_prompt)
+        # Cache lookup and in-flight claim share one lock hold: a leader stores
+        # its answer before leaving _inflight, so no request can miss both.
+        with _responses_lock:
+            cached = _cached_response(cache_key)
+            if cached is None:
+                pending = _inflight.get(cache_key)
+                leader = pending is None
+                if leader:
+                    pending = _inflight[cache_key] = Future()
+        if cached is not None:
+            logger.debug("Response cache hit for task_type=%s", task_type)
+            return cached
+        if not leader:
+            logger.debug("Joining in-flight request for task_type=%s", task_type)
+            return pending.result()
+
+        try:
+            answer = self.route_task(
+                task_type=task_type,
+                content=safe_full_prompt,
+                require_json=require_json,
+                baby_mode=baby_mode,
+            )
+            if answer:
+                _store_response(cache_key, answer)
+            pending.set_result(answer)
+            return answer
+        except BaseException as e:
+            pending.set_exception(e)
+            raise
+        finally:
+            with _responses_lock:
+                _inflight.pop(cache_key, None)
+
 
 class AIClient(TripleHybridClient):
     """Concrete client used by the rest of the app."""
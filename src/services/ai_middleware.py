@@ -16,11 +16,15 @@ Cost: ~2 small gpt-4o-mini calls (~300-500 tokens each) = $0.0002
 Benefit: 10x better UX for non-tech users + Guaranteed accuracy
 """
 
-from typing import Optional, Dict, Any
+from collections import OrderedDict
+from functools import cached_property, lru_cache
+from hashlib import blake2b
+from typing import Optional, Dict, Any, List
 from dataclasses import dataclass, asdict
 from pymongo.database import Database
 import openai
 import json
+import threading
 
 from src.infrastructure.config import settings
 from src.infrastructure.database import db as flask_db
@@ -30,6 +34,21 @@ from src.utils.ai_constraints import (
     validate_response_constraint
 )
 from sb_utils.logger_utils import logger
+from src.utils.text_cleaner import is_blank
+
+
+@lru_cache(maxsize=1)
+def _openai_client() -> openai.OpenAI:
+    """One OpenAI client (and connection pool) for both middleware calls."""
+    return openai.OpenAI(api_key=settings.OPENAI_API_KEY)
+
+
+# Optimized prompts keyed by a hash of the full meta-prompt (request + profile
+# + constraints). The optimizer runs at low temperature, so repeating the call
+# for the same input only adds latency and cost.
+_OPTIMIZED_CACHE_SIZE = 4096
+_optimized_prompts: "OrderedDict[str, Dict[str, str]]" = OrderedDict()
+_optimized_lock = threading.Lock()
 
 
 @dataclass
@@ -104,6 +123,66 @@ class UserPreferences:
             data['strong_topics'] = []
         return cls(**data)
     
+    @cached_property
+    def learning_profile(self) -> str:
+        """
+        Full learning-profile block for the prompt optimizer.
+
+        Cached because it is rebuilt from the same preferences on every
+        request; call invalidate_cached_profile() after changing fields.
+        """
+        user_profile = f"""
+USER LEARNING PROFILE (CRITICAL - Adapt to this user):
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+📚 Study Level: {self.study_level}
+🎓 Knowledge Level: {self.proficiency_level}
+🌍 Language: {self.language} (Primary)
+💡 Learning Style: {self.explanation_style}
+⏱️ Learning Pace: {self.learning_pace}
+⏰ Study Time: {self.study_time_preference} sessions
+
+LEARNING PREFERENCES:
+✓ Examples: {self.use_examples}
+✓ Analogies: {self.use_analogies}
+✓ Real-world examples: {self.use_real_world_examples}
+✓ Practice questions: {self.prefers_practice}
+✓ Summaries: {self.prefers_summary}
+✓ Format: {', '.join(self.preferred_formats)}
+"""
+
+        # Add subject-specific knowledge if available
+        if self.subject_knowledge:
+            user_profile += f"\nSubject Knowledge:\n"
+            for subject, level in self.subject_knowledge.items():
+                user_profile += f"  - {subject}: {level}\n"
+
+        # Add learning challenges if available
+        if self.difficult_topics:
+            user_profile += f"\n⚠️ Struggles with: {', '.join(self.difficult_topics)}\n"
+
+        # Add strengths if available
+        if self.strong_topics:
+            user_profile += f"✨ Strong in: {', '.join(self.strong_topics)}\n"
+
+        # Add special needs
+        special_needs = []
+        if self.baby_mode:
+            special_needs.append("Simplified explanations (Baby Mode)")
+        if self.visual_learner:
+            special_needs.append("Visual/diagram emphasis")
+        if self.needs_more_detail:
+            special_needs.append("Extra detail required")
+
+        if special_needs:
+            user_profile += f"\n🎯 Special Needs: {', '.join(special_needs)}\n"
+
+        user_profile += "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
+        return user_profile
+
+    def invalidate_cached_profile(self):
+        """Drop the cached learning_profile after the preferences change."""
+        self.__dict__.pop("learning_profile", None)
+    
     def get_profile_summary(self) -> str:
         """Get human-readable profile summary for AI prompts."""
         summary_parts = [
@@ -166,7 +245,7 @@ class PromptOptimizer:
         
         # Determine constraint level
         constraint_level = get_task_constraint_level(task_type)
-        has_document = bool(document_content and len(document_content.strip()) > 0)
+        has_document = bool(document_content) and not is_blank(document_content)
         
         # Build APP REQUIREMENTS (mandatory rules) - THESE CANNOT BE REMOVED
         app_requirements = []
@@ -192,53 +271,8 @@ class PromptOptimizer:
         # Build meta-prompt with EXPLICIT ENFORCEMENT INSTRUCTIONS
         requirements_text = "\n".join(app_requirements) if app_requirements else ""
         
-        # 🎯 BUILD COMPREHENSIVE USER PROFILE for personalization
-        user_profile = f"""
-USER LEARNING PROFILE (CRITICAL - Adapt to this user):
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-📚 Study Level: {user_prefs.study_level}
-🎓 Knowledge Level: {user_prefs.proficiency_level}
-🌍 Language: {user_prefs.language} (Primary)
-💡 Learning Style: {user_prefs.explanation_style}
-⏱️ Learning Pace: {user_prefs.learning_pace}
-⏰ Study Time: {user_prefs.study_time_preference} sessions
-
-LEARNING PREFERENCES:
-✓ Examples: {user_prefs.use_examples}
-✓ Analogies: {user_prefs.use_analogies}
-✓ Real-world examples: {user_prefs.use_real_world_examples}
-✓ Practice questions: {user_prefs.prefers_practice}
-✓ Summaries: {user_prefs.prefers_summary}
-✓ Format: {', '.join(user_prefs.preferred_formats)}
-"""
-
-        # Add subject-specific knowledge if available
-        if user_prefs.subject_knowledge:
-            user_profile += f"\nSubject Knowledge:\n"
-            for subject, level in user_prefs.subject_knowledge.items():
-                user_profile += f"  - {subject}: {level}\n"
-        
-        # Add learning challenges if available
-        if user_prefs.difficult_topics:
-            user_profile += f"\n⚠️ Struggles with: {', '.join(user_prefs.difficult_topics)}\n"
-        
-        # Add strengths if available
-        if user_prefs.strong_topics:
-            user_profile += f"✨ Strong in: {', '.join(user_prefs.strong_topics)}\n"
-        
-        # Add special needs
-        special_needs = []
-        if user_prefs.baby_mode:
-            special_needs.append("Simplified explanations (Baby Mode)")
-        if user_prefs.visual_learner:
-            special_needs.append("Visual/diagram emphasis")
-        if user_prefs.needs_more_detail:
-            special_needs.append("Extra detail required")
-        
-        if special_needs:
-            user_profile += f"\n🎯 Special Needs: {', '.join(special_needs)}\n"
-        
-        user_profile += "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
+        # 🎯 COMPREHENSIVE USER PROFILE for personalization (rendered once per prefs)
+        user_profile = user_prefs.learning_profile
         
         meta_prompt = f"""You are optimizing a prompt for educational AI.
 
@@ -289,8 +323,15 @@ OPTIMIZATION RULES:
 JSON output (constraints preserved, heavily personalized):
 {{"optimized_prompt": "Personalized prompt WITH constraints", "system_context": "System instructions WITH constraints and personalization"}}"""
 
+        cache_key = blake2b(meta_prompt.encode(), digest_size=16).hexdigest()
+        with _optimized_lock:
+            cached = _optimized_prompts.get(cache_key)
+            if cached is not None:
+                _optimized_prompts.move_to_end(cache_key)
+                return dict(cached)
+
         try:
-            client = openai.OpenAI(api_key=settings.OPENAI_API_KEY, timeout=5.0)
+            client = _openai_client().with_options(timeout=5.0)
             
             response = client.chat.completions.create(
                 model="gpt-4o-mini",
@@ -318,12 +359,17 @@ JSON output (constraints preserved, heavily personalized):
                     # Add constraint reminder to system context
                     system_context += "\n🔒 CRITICAL: Use ONLY the provided document content."
             
-            logger.debug(f"✓ Prompt optimized with {constraint_level} constraint preserved")
+            logger.debug("✓ Prompt optimized with %s constraint preserved", constraint_level)
             
-            return {
+            optimized = {
                 'optimized_prompt': optimized_prompt,
                 'system_context': system_context
             }
+            with _optimized_lock:
+                _optimized_prompts[cache_key] = optimized
+                if len(_optimized_prompts) > _OPTIMIZED_CACHE_SIZE:
+                    _optimized_prompts.popitem(last=False)
+            return dict(optimized)
             
         except Exception as e:
             logger.warning(f"Prompt optimization failed: {e}")
@@ -368,7 +414,7 @@ Style: {user_prefs.explanation_style}
 Output only adapted text."""
 
         try:
-            client = openai.OpenAI(api_key=settings.OPENAI_API_KEY, timeout=8.0)
+            client = _openai_client().with_options(timeout=8.0)
             
             # Smart sizing: don't waste tokens
             input_tokens = len(ai_response.split())
@@ -382,7 +428,7 @@ Output only adapted text."""
             )
             
             adapted = response.choices[0].message.content.strip()
-            logger.debug(f"✓ Response adapted (fast)")
+            logger.debug("✓ Response adapted (fast)")
             return adapted
             
         except Exception as e:
@@ -416,6 +462,7 @@ class PreferencesService:
     
     def save(self, prefs: UserPreferences):
         """Save preferences and update cache."""
+        prefs.invalidate_cached_profile()
         try:
             self.db.user_preferences.update_one(
                 {"user_id": prefs.user_id},
@@ -0,0 +1,110 @@
+"""
+Admin alert throttling for the health monitor.
+
+Cooldowns are tracked per (component, status) in MongoDB, so they survive
+restarts and are shared by every process/pod that talks to the same
+database: the conditional upsert in should_send() lets exactly one pod
+claim a cooldown slot (the same contract as Redis ``SET NX EX``). Each
+entry records which host claimed it. A TTL index cleans up expired entries.
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+import time
+from datetime import datetime, timedelta, timezone
+
+from pymongo.database import Database
+from pymongo.errors import DuplicateKeyError, PyMongoError
+
+from src.infrastructure.config import settings
+from src.infrastructure.database import db as flask_db
+from sb_utils.logger_utils import logger
+
+ALERTS_COLLECTION = "health_alerts"
+
+# Only these statuses are worth an email; "degraded" is visible on the dashboard.
+ALERTABLE_STATUSES = {"unhealthy"}
+
+_SENDER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+
+class AlertThrottle:
+    """
+    Decides whether an alert may be sent.
+
+    An alert goes out only if it is high-impact, the process is past its
+    start-up grace period, and no alert for the same component/status was
+    sent within the cooldown window.
+    """
+
+    def __init__(self, db_conn: Database = None):
+        self.db = db_conn if db_conn is not None else flask_db
+        self._started_at = time.monotonic()
+        self._index_ready = False
+        # Used only while MongoDB is unreachable (which may be the very thing
+        # we're alerting about), so those alerts still go out, rate-limited.
+        self._local_sent_at: dict[str, float] = {}
+
+    def _ensure_index(self) -> None:
+        if self._index_ready:
+            return
+        self.db[ALERTS_COLLECTION].create_index("expires_at", expireAfterSeconds=0)
+        self._index_ready = True
+
+    def in_grace_period(self) -> bool:
+        """True during the first ALERT_GRACE_SECONDS after start-up (boot flaps)."""
+        return time.monotonic() - self._started_at < settings.ALERT_GRACE_SECONDS
+
+    def should_send(self, component: str, status: str) -> bool:
+        """
+        Atomically claim the cooldown slot for (component, status).
+
+        Returns True if the caller should send the alert.
+        """
+        if status not in ALERTABLE_STATUSES:
+            return False
+        if self.in_grace_period():
+            logger.info("Suppressing %s alert for %s (start-up grace period)", status, component)
+            return False
+
+        now = datetime.now(timezone.utc)
+        key = f"{component}:{status}"
+
+        try:
+            self._ensure_index()
+            # Matches only an expired entry; otherwise the upsert collides
+            # with the live one on _id and we know we're inside the cooldown.
+            self.db[ALERTS_COLLECTION].update_one(
+                {"_id": key, "expires_at": {"$lte": now}},
+                {
+                    "$set": {
+                        "component": component,
+                        "status": status,
+                        "sent_at": now,
+                        "sent_by": _SENDER_ID,
+                        "expires_at": now + timedelta(seconds=settings.ALERT_COOLDOWN_SECONDS),
+                    }
+                },
+                upsert=True,
+            )
+        except DuplicateKeyError:
+            logger.info("Suppressing %s alert for %s (cooldown active)", status, component)
+            return False
+        except PyMongoError as e:
+            logger.warning("Alert throttle store unavailable, using local cooldown: %s", e)
+            return self._should_send_local(key)
+
+        return True
+
+    def _should_send_local(self, key: str) -> bool:
+        now = time.monotonic()
+        last = self._local_sent_at.get(key)
+        if last is not None and now - last < settings.ALERT_COOLDOWN_SECONDS:
+            return False
+        self._local_sent_at[key] = now
+        return True
+
+
+alert_throttle = AlertThrottle()
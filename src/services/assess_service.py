@@ -1,4 +1,6 @@
 import json
+from textwrap import dedent
+
 from pymongo.database import Database
 
 from .ai_client import ai_client
@@ -6,6 +8,19 @@ from src.infrastructure.database import db as flask_db
 from src.domain.models.db_models import Assessment, AssessmentQuestion
 from sb_utils.logger_utils import logger
 from src.utils.smart_parser import get_smart_context
+from src.utils.text_cleaner import is_blank
+
+
+ASSESSMENT_PROMPT = dedent("""
+    Based on the provided text, generate exactly {num_questions} quiz questions of type '{question_type}'.
+    For 'mcq' (multiple choice), each question must have 'options' (a list of 4 strings) and a 'correct_answer'.
+    Return the output as a valid JSON array of objects, like this:
+    [
+      {{"question": "What is the capital of France?", "options": ["Berlin", "Paris", "London", "Madrid"], "correct_answer": "Paris"}},
+      ...
+    ]
+    Do not include any other text or explanation in your response.
+    """)
 
 
 def _get_db(db_conn: Database | None = None) -> Database:
@@ -32,7 +47,7 @@ def generate_assessment(
         doc = db.documents.find_one({"_id": document_id}, {"content_text": 1})
         context = (doc or {}).get("content_text") or ""
 
-    if not context.strip():
+    if is_blank(context):
         logger.error(
             f"Could not generate assessment for doc {document_id}: "
             f"No smart or fallback context found."
@@ -41,16 +56,7 @@ def generate_assessment(
             "Could not find relevant context in the document to generate an assessment."
         )
 
-    prompt = f"""
-    Based on the provided text, generate exactly {num_questions} quiz questions of type '{question_type}'.
-    For 'mcq' (multiple choice), each question must have 'options' (a list of 4 strings) and a 'correct_answer'.
-    Return the output as a valid JSON array of objects, like this:
-    [
-      {{"question": "What is the capital of France?", "options": ["Berlin", "Paris", "London", "Madrid"], "correct_answer": "Paris"}},
-      ...
-    ]
-    Do not include any other text or explanation in your response.
-    """
+    prompt = ASSESSMENT_PROMPT.format(num_questions=num_questions, question_type=question_type)
 
     json_string = ai_client.generate_text(
         prompt=prompt, context=context, task_type="assessment", require_json=True
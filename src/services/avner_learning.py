@@ -102,7 +102,7 @@ class UsageAnalytics:
             # Update aggregated stats (very light)
             self._update_aggregated_stats(task_type, user_prefs, response_quality)
             
-            logger.debug(f"📊 Tracked interaction: {interaction_type}")
+            logger.debug("📊 Tracked interaction: %s", interaction_type)
             
         except Exception as e:
             logger.error(f"Failed to track interaction: {e}")
@@ -393,12 +393,24 @@ class AdminTeachingInterface:
             logger.error(f"Failed to get teaching examples: {e}")
             return []
     
-    def get_improvement_rules(self, rule_type: Optional[str] = None) -> List[Dict]:
-        """Get active improvement rules."""
+    def get_improvement_rules(
+        self,
+        rule_type: Optional[str] = None,
+        task_type: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Get active improvement rules.
+
+        With task_type, only rules for that task (or for any task) are
+        returned, so MongoDB does the filtering instead of a Python scan.
+        """
         try:
             query = {"active": True}
             if rule_type:
                 query["rule_type"] = rule_type
+            if task_type:
+                # None also matches rules whose condition has no task_type
+                query["condition.task_type"] = {"$in": [task_type, None]}
             
             rules = list(self.db.admin_improvement_rules.find(query))
             return rules
@@ -481,7 +493,7 @@ class ContinuousImprovement:
         
         try:
             # Apply admin improvement rules
-            rules = self.admin_interface.get_improvement_rules()
+            rules = self.admin_interface.get_improvement_rules(task_type=task_type)
             
             for rule in rules:
                 if self._rule_matches(rule["condition"], task_type, user_prefs):
@@ -1,13 +1,29 @@
 """Service for Avner chat - handles AI-powered Q&A with course context."""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 from pymongo.database import Database
 from src.infrastructure.database import db as flask_db
-from src.services.ai_client import AIClient
+from src.services.ai_client import ai_client
 from sb_utils.logger_utils import logger
 
 # Configuration constants
 MAX_CONTEXT_LENGTH = 4000  # Maximum total context length in characters
 MAX_DOCUMENT_CONTENT_LENGTH = 2000  # Maximum content per document
 
+# Course context per (user_id, course_id). Chat users ask several questions
+# in a row about the same course; documents finish processing in the worker
+# process, so the TTL bounds how stale an entry can get. Course edits made
+# through the web app invalidate it right away.
+COURSE_CONTEXT_TTL_S = 30.0
+_COURSE_CONTEXT_CACHE_MAX = 1024
+_course_context_cache: dict[tuple[str, str], tuple[float, tuple[str, str]]] = {}
+_course_context_lock = threading.Lock()
+
+# Runs the user-context lookup alongside the course-context lookup
+_context_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="avner-context")
+
 
 def _get_db(db_conn: Database = None) -> Database:
     """Returns the provided db_conn or the default Flask db proxy."""
@@ -39,6 +55,26 @@ BABY_MODE_MODIFIER = """
 """
 
 
+def _build_prompts(question: str, context: str, baby_mode: bool) -> tuple[str, str]:
+    """Build Avner's (system prompt, user prompt) pair for a question."""
+    system_prompt = AVNER_SYSTEM_PROMPT
+    if baby_mode:
+        system_prompt += "\n\n" + BABY_MODE_MODIFIER
+
+    if context:
+        user_prompt = f"""השאלה שלי: {question}
+
+חומר הקורס (ענה רק על בסיס זה):
+{context[:MAX_CONTEXT_LENGTH]}  
+"""
+    else:
+        user_prompt = f"""השאלה שלי: {question}
+
+(אין חומר קורס ספציפי - ענה באופן כללי)
+"""
+    return system_prompt, user_prompt
+
+
 def answer_question(
     question: str,
     context: str = "",
@@ -67,27 +103,9 @@ def answer_question(
     db = _get_db(db_conn)
     
     try:
-        # Build the system prompt
-        system_prompt = AVNER_SYSTEM_PROMPT
-        if baby_mode:
-            system_prompt += "\n\n" + BABY_MODE_MODIFIER
-        
-        # Build the user prompt with context
-        if context:
-            user_prompt = f"""השאלה שלי: {question}
-
-חומר הקורס (ענה רק על בסיס זה):
-{context[:MAX_CONTEXT_LENGTH]}  
-"""
-        else:
-            user_prompt = f"""השאלה שלי: {question}
+        system_prompt, user_prompt = _build_prompts(question, context, baby_mode)
 
-(אין חומר קורס ספציפי - ענה באופן כללי)
-"""
-        
-        # Use AI client - it will automatically select the best model
-        ai_client = AIClient()
-        
+        # Shared AI client - it will automatically select the best model
         # Combine system prompt and user prompt for context
         full_context = system_prompt
         
@@ -120,8 +138,34 @@ def get_course_context(course_id: str, user_id: str, db_conn: Database = None) -
     Returns:
         Tuple of (context_text, language)
     """
-    db = _get_db(db_conn)
-    
+    key = (user_id, course_id)
+    now = time.monotonic()
+    with _course_context_lock:
+        cached = _course_context_cache.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+    result = _load_course_context(course_id, user_id, _get_db(db_conn))
+    if result is not None:
+        with _course_context_lock:
+            if len(_course_context_cache) >= _COURSE_CONTEXT_CACHE_MAX:
+                for stale in [k for k, (exp, _) in _course_context_cache.items() if exp <= now]:
+                    del _course_context_cache[stale]
+                if len(_course_context_cache) >= _COURSE_CONTEXT_CACHE_MAX:
+                    _course_context_cache.clear()
+            _course_context_cache[key] = (now + COURSE_CONTEXT_TTL_S, result)
+        return result
+    return "", "he"
+
+
+def invalidate_course_context(user_id: str, course_id: str) -> None:
+    """Forget the cached chat context after a course or its documents change."""
+    with _course_context_lock:
+        _course_context_cache.pop((user_id, course_id), None)
+
+
+def _load_course_context(course_id: str, user_id: str, db: Database) -> tuple[str, str] | None:
+    """Query the course and its documents; None on database errors (not cached)."""
     try:
         # Get course
         course = db.courses.find_one({"_id": course_id, "user_id": user_id})
@@ -130,13 +174,11 @@ def get_course_context(course_id: str, user_id: str, db_conn: Database = None) -
         
         language = course.get("language", "he")
         
-        # Get course documents
-        documents = list(db.documents.find(
-            {"user_id": user_id, "course_id": course_id}
-        ).limit(5))  # Limit to 5 most recent docs to avoid huge context
-        
-        if not documents:
-            return "", language
+        # Get course documents (only the fields the context uses)
+        documents = db.documents.find(
+            {"user_id": user_id, "course_id": course_id},
+            {"_id": 0, "filename": 1, "content_text": 1},
+        ).limit(5)  # Limit to 5 most recent docs to avoid huge context
         
         # Combine document content
         context_parts = []
@@ -150,7 +192,7 @@ def get_course_context(course_id: str, user_id: str, db_conn: Database = None) -
         
     except Exception as e:
         logger.error(f"Failed to get course context: {e}", exc_info=True)
-        return "", "he"
+        return None
 
 
 def get_user_general_context(user_id: str, db_conn: Database = None) -> str:
@@ -170,3 +212,28 @@ def get_user_general_context(user_id: str, db_conn: Database = None) -> str:
     except Exception as e:
         logger.error(f"Failed to get user context: {e}", exc_info=True)
         return ""
+
+
+def get_chat_context(course_id: str, user_id: str, db_conn: Database = None) -> tuple[str, str]:
+    """
+    Get the full chat context (user's general context + course context).
+
+    The two lookups are independent, so the user lookup runs on a pool
+    thread while the course lookup runs on the caller's thread.
+
+    Returns:
+        Tuple of (context_text, language)
+    """
+    db = _get_db(db_conn)
+    # Pool threads don't share the request's app context
+    get_current = getattr(db, "_get_current_object", None)
+    if callable(get_current):
+        db = get_current()
+
+    user_future = _context_pool.submit(get_user_general_context, user_id, db)
+    context, language = get_course_context(course_id, user_id, db) if course_id else ("", "he")
+    user_context = user_future.result()
+
+    if user_context:
+        context = f"{user_context}\n\n{context}" if context else user_context
+    return context, language
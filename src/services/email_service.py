@@ -1,5 +1,6 @@
 """Email service for notifications and verification."""
 import smtplib
+from functools import lru_cache
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from typing import Optional
@@ -180,8 +181,15 @@ def send_error_notification(error_type: str, error_message: str, details: str =
     return result
 
 
+@lru_cache(maxsize=1)
 def test_email_config() -> dict:
-    """Test email configuration and return diagnostics."""
+    """
+    Test email configuration and return diagnostics.
+
+    ``settings`` is loaded once per process, so the result is computed once
+    and reused (create_app() runs this on every app instance, and the health
+    monitor builds a new app each cycle). Treat the returned dict as read-only.
+    """
     issues = []
     warnings = []
     
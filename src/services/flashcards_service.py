@@ -1,4 +1,6 @@
 import json
+from textwrap import dedent
+
 from pymongo.database import Database
 
 from .ai_client import ai_client
@@ -6,6 +8,19 @@ from src.infrastructure.database import db as flask_db
 from src.domain.models.db_models import FlashcardSet, Flashcard
 from sb_utils.logger_utils import logger
 from src.utils.smart_parser import get_smart_context
+from src.utils.text_cleaner import is_blank
+
+
+FLASHCARDS_PROMPT = dedent("""
+    Based on the provided text, generate exactly {num_cards} flashcards.
+    Each flashcard should have a 'question' and an 'answer'.
+    Return the output as a valid JSON array of objects, like this:
+    [
+      {{"question": "What is the main topic?", "answer": "The main topic is..."}},
+      {{"question": "...", "answer": "..."}}
+    ]
+    Do not include any other text or explanation in your response.
+    """)
 
 
 def _get_db(db_conn: Database | None = None) -> Database:
@@ -32,7 +47,7 @@ def generate_flashcards(
         doc = db.documents.find_one({"_id": document_id}, {"content_text": 1})
         context = (doc or {}).get("content_text") or ""
 
-    if not context.strip():
+    if is_blank(context):
         logger.error(
             f"Could not generate flashcards for doc {document_id}: "
             f"No smart or fallback context found."
@@ -41,16 +56,7 @@ def generate_flashcards(
             "Could not find relevant context in the document to generate flashcards."
         )
 
-    prompt = f"""
-    Based on the provided text, generate exactly {num_cards} flashcards.
-    Each flashcard should have a 'question' and an 'answer'.
-    Return the output as a valid JSON array of objects, like this:
-    [
-      {{"question": "What is the main topic?", "answer": "The main topic is..."}},
-      {{"question": "...", "answer": "..."}}
-    ]
-    Do not include any other text or explanation in your response.
-    """
+    prompt = FLASHCARDS_PROMPT.format(num_cards=num_cards)
 
     json_string = ai_client.generate_text(
         prompt=prompt, context=context, task_type="flashcards", require_json=True
@@ -1,10 +1,24 @@
 import json
+from textwrap import dedent
+
 from pymongo.database import Database
 
 from .ai_client import ai_client
 from src.infrastructure.database import db as flask_db
 from sb_utils.logger_utils import logger
 from src.utils.smart_parser import get_smart_context
+from src.utils.text_cleaner import is_blank
+
+
+GLOSSARY_PROMPT = dedent("""
+    Based on the provided text, identify and extract key terms and their definitions.
+    Return the output as a valid JSON array of objects, like this:
+    [
+      {"term": "Photosynthesis", "definition": "The process by which green plants use sunlight to synthesize foods."},
+      {"term": "Gravity", "definition": "The force that attracts a body toward the center of the earth."}
+    ]
+    Only extract terms explicitly defined in the text. Do not include any other text in your response.
+    """)
 
 
 def _get_db(db_conn: Database | None = None) -> Database:
@@ -34,7 +48,7 @@ def extract_terms_from_content(
         doc = db.documents.find_one({"_id": document_id}, {"content_text": 1})
         context = (doc or {}).get("content_text") or ""
 
-    if not context.strip():
+    if is_blank(context):
         logger.error(
             f"Could not extract terms for doc {document_id}: "
             f"No smart or fallback context found."
@@ -42,15 +56,7 @@ def extract_terms_from_content(
         return
     # --- END ---
 
-    prompt = """
-    Based on the provided text, identify and extract key terms and their definitions.
-    Return the output as a valid JSON array of objects, like this:
-    [
-      {"term": "Photosynthesis", "definition": "The process by which green plants use sunlight to synthesize foods."},
-      {"term": "Gravity", "definition": "The force that attracts a body toward the center of the earth."}
-    ]
-    Only extract terms explicitly defined in the text. Do not include any other text in your response.
-    """
+    prompt = GLOSSARY_PROMPT
 
     try:
         json_string = ai_client.generate_text(
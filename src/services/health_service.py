@@ -1,22 +1,35 @@
-"""Comprehensive health monitoring service for StudyBuddy AI."""
+"""
+Comprehensive health monitoring service for StudyBuddy AI.
+
+A health check should return immediately: each check probes once with a
+short timeout and reports "unhealthy" rather than retrying until the
+dependency comes back. Retrying is the caller's business (the monitoring
+daemon counts consecutive failures before acting).
+"""
 
 from __future__ import annotations
 
+import hashlib
 import os
 import shutil
 import subprocess
 import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any
+from functools import partial
+from typing import Optional, Dict, Any, Callable, Final
 
 from pymongo.database import Database
 import pymongo
 import pika
-from tenacity import retry, stop_after_attempt, wait_fixed
+import orjson
 
 from src.infrastructure.config import settings
 from src.infrastructure.database import db as flask_db
-from src.services.ai_client import AIClient
+from src.infrastructure.rabbitmq import connection_parameters
+from src.services.ai_client import ai_client
 from sb_utils.logger_utils import logger
 
 
@@ -24,10 +37,35 @@ from sb_utils.logger_utils import logger
 # Helpers
 # ---------------------------------------------------------------------------
 
+# Per-component I/O timeout. A down dependency must fail fast instead of
+# waiting on driver defaults (30s server selection in PyMongo).
+HEALTH_CHECK_TIMEOUT_S: Final = 2.0
+
+# Upper bound for the whole aggregated report; checks still running past this
+# are reported as unhealthy instead of holding up the caller.
+HEALTH_CHECK_BUDGET_S = 5.0
+
+
 def _get_db(db_conn: Optional[Database] = None) -> Database:
     return db_conn if db_conn is not None else flask_db
 
 
+def _resolve_db(db_conn: Optional[Database] = None) -> Database:
+    """
+    Unwrap the Flask LocalProxy so the database can be used from worker
+    threads, which do not share the caller's application context.
+    """
+    db = _get_db(db_conn)
+    get_current = getattr(db, "_get_current_object", None)
+    if not callable(get_current):
+        return db
+    try:
+        return get_current()
+    except RuntimeError:
+        # No app context: let check_mongodb report the failure
+        return db
+
+
 # ---------------------------------------------------------------------------
 # MongoDB health
 # ---------------------------------------------------------------------------
@@ -37,7 +75,9 @@ def check_mongodb(db_conn: Optional[Database] = None) -> Dict[str, Any]:
     db = _get_db(db_conn)
     try:
         client: pymongo.MongoClient = db.client  # type: ignore[assignment]
-        client.admin.command("ping")
+        # Bounds server selection as well as the command itself
+        with pymongo.timeout(HEALTH_CHECK_TIMEOUT_S):
+            client.admin.command("ping")
         logger.info("MongoDB health check passed")
         return {"status": "healthy"}
     except Exception as e:  # noqa: BLE001
@@ -49,52 +89,120 @@ def check_mongodb(db_conn: Optional[Database] = None) -> Dict[str, Any]:
 # RabbitMQ health
 # ---------------------------------------------------------------------------
 
-@retry(wait=wait_fixed(5), stop=stop_after_attempt(3))
-def check_rabbitmq() -> Dict[str, Any]:
-    """
-    Check RabbitMQ:
-    - Connects successfully
-    - Ensures all required queues exist
-    - Returns simple queue depth info
-    """
-    connection: Optional[pika.BlockingConnection] = None
+def _rabbitmq_connection() -> pika.BlockingConnection:
+    """Open a single-attempt RabbitMQ connection with probe timeouts."""
+    return pika.BlockingConnection(connection_parameters(probe_timeout=HEALTH_CHECK_TIMEOUT_S))
+
+
+# Long-lived connection/channel reused across probes; BlockingConnection is
+# not thread-safe, so every use goes through _rabbitmq_lock.
+_rabbitmq_lock = threading.Lock()
+_rabbitmq_conn: Optional[pika.BlockingConnection] = None
+_rabbitmq_channel: Optional[Any] = None
+
+_RABBITMQ_QUEUES: Final[tuple[str, ...]] = (
+    "file_processing",
+    "summarize",
+    "flashcards",
+    "assess",
+    "homework",
+    "avner_chat",
+)
+
+
+def _get_rabbitmq_channel():
+    global _rabbitmq_conn, _rabbitmq_channel
+    if _rabbitmq_conn is None or not _rabbitmq_conn.is_open:
+        _rabbitmq_conn = _rabbitmq_connection()
+        _rabbitmq_channel = None
+    if _rabbitmq_channel is None or not _rabbitmq_channel.is_open:
+        _rabbitmq_channel = _rabbitmq_conn.channel()
+    return _rabbitmq_channel
+
+
+def _reset_rabbitmq_connection() -> None:
+    global _rabbitmq_conn, _rabbitmq_channel
+    if _rabbitmq_conn is not None and _rabbitmq_conn.is_open:
+        try:
+            _rabbitmq_conn.close()
+        except Exception:  # noqa: BLE001
+            pass
+    _rabbitmq_conn = None
+    _rabbitmq_channel = None
+
+
+def _probe_queues() -> Dict[str, Any]:
     details: Dict[str, Any] = {"queues": {}}
     status = "healthy"
 
-    queues = [
-        "file_processing",
-        "summarize",
-        "flashcards",
-        "assess",
-        "homework",
-        "avner_chat",
-    ]
+    for queue_name in _RABBITMQ_QUEUES:
+        channel = _get_rabbitmq_channel()
+        try:
+            # Passive: only checks the queue exists, never creates it
+            q = channel.queue_declare(queue=queue_name, durable=True, passive=True)
+        except pika.exceptions.ChannelClosedByBroker as e:
+            # 404 closes the channel; it is reopened for the next queue
+            details["queues"][queue_name] = {"error": e.reply_text}
+            status = "degraded"
+            continue
 
-    try:
-        connection = pika.BlockingConnection(pika.URLParameters(settings.RABBITMQ_URI))
-        channel = connection.channel()
+        message_count = q.method.message_count
+        details["queues"][queue_name] = {"message_count": message_count}
 
-        for queue_name in queues:
-            # Idempotent: creates queue if needed, OK if it already exists
-            q = channel.queue_declare(queue=queue_name, durable=True)
-            message_count = q.method.message_count
+        if message_count > 100:
+            status = "degraded"
 
-            details["queues"][queue_name] = {"message_count": message_count}
+    return {"status": status, "details": details}
 
-            if message_count > 100:
-                status = "degraded"
+
+def _probe_connection() -> Dict[str, Any]:
+    _get_rabbitmq_channel()
+    # Services pending I/O (incl. heartbeats); raises if the socket is dead
+    _rabbitmq_conn.process_data_events(time_limit=0)
+    return {"status": "healthy"}
+
+
+def _run_rabbitmq_probe(probe: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    if not _rabbitmq_lock.acquire(timeout=HEALTH_CHECK_TIMEOUT_S):
+        return {"status": "unhealthy", "error": "previous RabbitMQ check still running"}
+
+    try:
+        try:
+            result = probe()
+        except pika.exceptions.AMQPError:
+            # The cached connection may have gone stale; rebuild it once
+            _reset_rabbitmq_connection()
+            result = probe()
 
         logger.info("RabbitMQ health check passed")
-        return {"status": status, "details": details}
+        return result
 
     except Exception as e:  # noqa: BLE001
         logger.error("RabbitMQ health check failed: %s", e, exc_info=True)
-        # Let tenacity handle retries by re-raising
-        raise
+        _reset_rabbitmq_connection()
+        return {"status": "unhealthy", "error": str(e)}
     finally:
-        if connection and connection.is_open:
-            connection.close()
-            logger.debug("RabbitMQ health check connection closed.")
+        _rabbitmq_lock.release()
+
+
+def check_rabbitmq() -> Dict[str, Any]:
+    """
+    Liveness check for RabbitMQ: is the (reused) connection up?
+
+    Queue depth is a load metric, not liveness, so it is left to
+    check_rabbitmq_depths() on the monitoring daemon's deep run.
+    """
+    return _run_rabbitmq_probe(_probe_connection)
+
+
+def check_rabbitmq_depths() -> Dict[str, Any]:
+    """
+    Check RabbitMQ:
+    - Connects successfully (reusing the connection from the previous probe)
+    - Ensures all required queues exist
+    - Returns simple queue depth info
+    """
+    return _run_rabbitmq_probe(_probe_queues)
 
 
 # ---------------------------------------------------------------------------
@@ -104,16 +212,18 @@ def check_rabbitmq() -> Dict[str, Any]:
 def check_ai_models() -> Dict[str, Any]:
     """
     Basic AI health:
-    - Can we construct AIClient?
+    - Is the shared AIClient available?
     - Are primary/fallback/available models configured (if exposed)?
+
+    Reads the process-wide ``ai_client`` instead of building a new client
+    (and SDK state) on every probe.
     """
     try:
-        client = AIClient()
         models_info: Dict[str, Any] = {}
 
         for attr in ("primary_model", "fallback_model", "available_models"):
-            if hasattr(client, attr):
-                models_info[attr] = getattr(client, attr)
+            if hasattr(ai_client, attr):
+                models_info[attr] = getattr(ai_client, attr)
 
         logger.info("AI models health check passed")
         return {"status": "healthy", "models": models_info}
@@ -128,23 +238,30 @@ def check_ai_models() -> Dict[str, Any]:
 
 def check_file_upload() -> Dict[str, Any]:
     """
-    Check that we can:
-    - Create a temporary directory.
-    - Write & read a text file.
-    - Write & read a tiny PDF file.
-
-    This is a lightweight check, separate from the deep test in health_monitor.
+    Cheap writability probe for the temp dir, used on the HTTP path:
+    one small write + unlink, no directory churn.
     """
+    tmp_path = os.path.join(
+        tempfile.gettempdir(),
+        f".studybuddy_health_{os.getpid()}_{threading.get_ident()}",
+    )
     try:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # 1. Text file
-            txt_path = os.path.join(tmpdir, "health_check.txt")
-            with open(txt_path, "w", encoding="utf-8") as f:
-                f.write("studybuddy health check\n")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            os.write(fd, b"ok")
+        finally:
+            os.close(fd)
+        os.unlink(tmp_path)
+
+        logger.debug("File upload health check passed (temp dir writable)")
+        return {"status": "healthy", "details": "Temp directory is writable"}
+    except Exception as e:  # noqa: BLE001
+        logger.error("File upload health check failed: %s", e, exc_info=True)
+        return {"status": "unhealthy", "error": str(e)}
 
-            # 2. Small PDF
-            pdf_path = os.path.join(tmpdir, "health_check.pdf")
-            pdf_bytes = b"""%PDF-1.4
+
+# Minimal one-page PDF written by the deep file check
+_HEALTH_PDF_BYTES: Final[bytes] = b"""%PDF-1.4
 1 0 obj
 << /Type /Catalog /Pages 2 0 R >>
 endobj
@@ -173,8 +290,28 @@ startxref
 320
 %%EOF
 """
+
+
+def check_file_upload_deep() -> Dict[str, Any]:
+    """
+    Check that we can:
+    - Create a temporary directory.
+    - Write & read a text file.
+    - Write & read a tiny PDF file.
+
+    Too heavy for every probe; only the monitoring daemon runs it.
+    """
+    try:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # 1. Text file
+            txt_path = os.path.join(tmpdir, "health_check.txt")
+            with open(txt_path, "w", encoding="utf-8") as f:
+                f.write("studybuddy health check\n")
+
+            # 2. Small PDF
+            pdf_path = os.path.join(tmpdir, "health_check.pdf")
             with open(pdf_path, "wb") as f:
-                f.write(pdf_bytes)
+                f.write(_HEALTH_PDF_BYTES)
 
             # Read both files back
             with open(txt_path, "r", encoding="utf-8") as f:
@@ -208,6 +345,7 @@ def check_git_connectivity() -> Dict[str, Any]:
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True,
+            timeout=HEALTH_CHECK_TIMEOUT_S,
         )
         status = subprocess.run(
             ["git", "status", "-sb"],
@@ -215,6 +353,7 @@ def check_git_connectivity() -> Dict[str, Any]:
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True,
+            timeout=HEALTH_CHECK_TIMEOUT_S,
         )
         logger.info("Git connectivity check passed")
         return {"status": "healthy", "summary": status.stdout.strip()}
@@ -232,10 +371,11 @@ def check_git_connectivity() -> Dict[str, Any]:
 # ---------------------------------------------------------------------------
 # Aggregation
 # ---------------------------------------------------------------------------
-
-def get_comprehensive_health(db_conn: Database = None) -> Dict[str, Any]:
+def get_comprehensive_health(db_conn: Database = None, deep: bool = False) -> Dict[str, Any]:
     """
-    Run all health checks and return a structured report:
+    Run all health checks and return a structured report.
+    With ``deep=True`` the file check also round-trips text and PDF files
+    and the RabbitMQ check reports queue depths:
 
     {
         "timestamp": "...",
@@ -257,19 +397,35 @@ def get_comprehensive_health(db_conn: Database = None) -> Dict[str, Any]:
 
     logger.info("Running comprehensive health checks...")
 
-    health_report["components"]["mongodb"] = check_mongodb(db_conn)
+    checks: Dict[str, Callable[[], Dict[str, Any]]] = {
+        "mongodb": partial(check_mongodb, _resolve_db(db_conn)),
+        "rabbitmq": check_rabbitmq_depths if deep else check_rabbitmq,
+        "ai_models": check_ai_models,
+        "file_upload": check_file_upload_deep if deep else check_file_upload,
+        "git": check_git_connectivity,
+    }
 
+    # All checks are I/O bound, so run them side by side: the report takes as
+    # long as the slowest component instead of the sum of all of them.
+    pool = ThreadPoolExecutor(max_workers=len(checks), thread_name_prefix="health-check")
     try:
-        health_report["components"]["rabbitmq"] = check_rabbitmq()
-    except Exception as e:  # noqa: BLE001
-        health_report["components"]["rabbitmq"] = {
-            "status": "unhealthy",
-            "error": str(e),
-        }
-
-    health_report["components"]["ai_models"] = check_ai_models()
-    health_report["components"]["file_upload"] = check_file_upload()
-    health_report["components"]["git"] = check_git_connectivity()
+        futures = {name: pool.submit(fn) for name, fn in checks.items()}
+        wait(futures.values(), timeout=HEALTH_CHECK_BUDGET_S)
+
+        for name, future in futures.items():
+            if not future.done():
+                future.cancel()
+                logger.error("Health check '%s' timed out after %ss", name, HEALTH_CHECK_BUDGET_S)
+                health_report["components"][name] = {"status": "unhealthy", "error": "timeout"}
+                continue
+            try:
+                health_report["components"][name] = future.result()
+            except Exception as e:  # noqa: BLE001
+                logger.error("Health check '%s' raised: %s", name, e, exc_info=True)
+                health_report["components"][name] = {"status": "unhealthy", "error": str(e)}
+    finally:
+        # Don't block on a check that is stuck in a socket call
+        pool.shutdown(wait=False)
 
     # Compute overall status from the 5 tracked components
     statuses = [
@@ -286,3 +442,89 @@ def get_comprehensive_health(db_conn: Database = None) -> Dict[str, Any]:
 
     logger.info("Health check complete: %s", health_report["overall_status"])
     return health_report
+
+
+# ---------------------------------------------------------------------------
+# Cached snapshot (HTTP path)
+# ---------------------------------------------------------------------------
+
+# Until the first background run finishes we must not report a false "healthy".
+_cached_report: Dict[str, Any] = {
+    "timestamp": datetime.now(timezone.utc).isoformat(),
+    "overall_status": "unhealthy",
+    "components": {},
+    "error": "Health snapshot not available yet",
+}
+_cached_report_json: bytes = orjson.dumps(_cached_report)
+_cached_report_etag: str = hashlib.blake2b(_cached_report_json, digest_size=16).hexdigest()
+_cache_lock = threading.Lock()
+_refresher: Optional[threading.Thread] = None
+
+
+def _refresh_snapshot(db_conn: Database) -> None:
+    global _cached_report, _cached_report_json, _cached_report_etag
+    try:
+        report = get_comprehensive_health(db_conn)
+    except Exception as e:  # noqa: BLE001
+        logger.error("Background health refresh failed: %s", e, exc_info=True)
+        report = {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "overall_status": "unhealthy",
+            "components": {},
+            "error": str(e),
+        }
+    report_json = orjson.dumps(report, default=str)
+    report_etag = hashlib.blake2b(report_json, digest_size=16).hexdigest()
+    with _cache_lock:
+        _cached_report = report
+        _cached_report_json = report_json
+        _cached_report_etag = report_etag
+
+
+def _periodic_refresh(db_conn: Database) -> None:
+    while True:
+        _refresh_snapshot(db_conn)
+        time.sleep(settings.HEALTH_PERIODIC_CHECK_S)
+
+
+def _ensure_refresher(db_conn: Optional[Database] = None) -> None:
+    global _refresher
+    if _refresher is not None:
+        return
+    with _cache_lock:
+        if _refresher is not None:
+            return
+        _refresher = threading.Thread(
+            target=_periodic_refresh,
+            args=(_resolve_db(db_conn),),
+            name="health-refresher",
+            daemon=True,
+        )
+        _refresher.start()
+        logger.info("Started background health refresher (every %ss)", settings.HEALTH_PERIODIC_CHECK_S)
+
+
+def get_cached_health(db_conn: Database = None) -> Dict[str, Any]:
+    """
+    Return the latest health report produced by the background refresher.
+
+    Probes never touch MongoDB/RabbitMQ themselves; the refresher thread is
+    started on first use and re-runs get_comprehensive_health every
+    HEALTH_PERIODIC_CHECK_S seconds. get_comprehensive_health stays the
+    entry point for the monitoring daemon, which wants fresh results.
+    """
+    _ensure_refresher(db_conn)
+    with _cache_lock:
+        return _cached_report
+
+
+def get_cached_health_json(db_conn: Database = None) -> tuple[bytes, str, str]:
+    """
+    Same snapshot as get_cached_health, pre-serialized for the HTTP route.
+
+    Returns ``(json_bytes, overall_status, etag)``. The body only changes
+    when the refresher runs, so the ETag lets probes get a 304 in between.
+    """
+    _ensure_refresher(db_conn)
+    with _cache_lock:
+        return _cached_report_json, _cached_report["overall_status"], _cached_report_etag
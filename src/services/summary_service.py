@@ -1,10 +1,12 @@
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
 from pymongo.database import Database
 
 from .ai_client import ai_client
+from src.infrastructure.config import settings
 from src.infrastructure.database import db as flask_db
 from sb_utils.logger_utils import logger
-from src.utils.smart_parser import get_smart_context
+from src.utils.smart_parser import get_smart_chunks, get_smart_context, pack_context
 from src.domain.models.db_models import DocumentStatus
 
 
@@ -27,21 +29,27 @@ def _get_course_smart_context(course_id: str, query: str, db: Database) -> Optio
         {"_id": 1, "content_text": 1},
     )
 
-    all_chunks: list[str] = []
+    docs = list(docs_cursor)
+    if not docs:
+        return None
 
-    for doc in docs_cursor:
-        doc_id = str(doc["_id"])
+    def _doc_chunks(doc: Dict[str, Any]) -> List[str]:
         # 1) ניסיון להביא smart context
-        ctx = get_smart_context(doc_id, query=query)
-        if ctx:
-            all_chunks.append(ctx)
-            continue
-
+        chunks = get_smart_chunks(str(doc["_id"]), query=query)
+        if chunks:
+            return chunks
         # 2) fallback ל-content_text
         fallback_text = (doc.get("content_text") or "").strip()
-        if fallback_text:
-            all_chunks.append(fallback_text)
+        return [fallback_text] if fallback_text else []
+
+    # Each lookup is disk + unpickle work, so documents are loaded side by
+    # side; map() keeps the course's document order.
+    with ThreadPoolExecutor(max_workers=min(settings.SB_CONTEXT_PARALLEL_DOCS, len(docs))) as pool:
+        doc_chunks = list(pool.map(_doc_chunks, docs))
 
+    # Round-robin across documents within the token budget, so every
+    # document contributes instead of the first few filling the prompt.
+    all_chunks = pack_context(doc_chunks, settings.SB_CONTEXT_TOKEN_BUDGET)
     if not all_chunks:
         return None
 
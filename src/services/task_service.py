@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import threading
 import uuid
+from collections import OrderedDict
 from datetime import datetime, timezone
 from typing import Optional
 
@@ -11,6 +13,14 @@ from src.domain.models.db_models import Task, TaskStatus
 from sb_utils.logger_utils import logger
 
 
+# Tasks in a terminal state never change again, so status polling for them
+# can be answered from memory instead of hitting MongoDB every second.
+_TERMINAL_STATUSES = frozenset({TaskStatus.COMPLETED, TaskStatus.FAILED})
+_TERMINAL_CACHE_SIZE = 1024
+_terminal_tasks: "OrderedDict[str, Task]" = OrderedDict()
+_terminal_lock = threading.Lock()
+
+
 def _get_db(db_conn: Optional[Database] = None) -> Database:
     """
     Resolve the MongoDB connection.
@@ -61,10 +71,18 @@ def get_task(task_id: str, db_conn: Optional[Database] = None) -> Optional[Task]
     """
     Retrieve a task by ID.
 
+    Completed/failed tasks are served from a small in-process LRU cache.
+
     :param task_id: Task identifier (UUID string).
     :param db_conn: Optional explicit DB connection.
     :return: Task instance, or None if not found.
     """
+    with _terminal_lock:
+        cached = _terminal_tasks.get(task_id)
+        if cached is not None:
+            _terminal_tasks.move_to_end(task_id)
+            return cached
+
     db = _get_db(db_conn)
     task_data = db.tasks.find_one({"_id": task_id})
 
@@ -79,6 +97,13 @@ def get_task(task_id: str, db_conn: Optional[Database] = None) -> Optional[Task]
     #   - status as a string (e.g. "PENDING", "COMPLETED", ...)
     #   - _id as the primary identifier
     task = Task(**task_data)
+
+    if task.status in _TERMINAL_STATUSES:
+        with _terminal_lock:
+            _terminal_tasks[task_id] = task
+            if len(_terminal_tasks) > _TERMINAL_CACHE_SIZE:
+                _terminal_tasks.popitem(last=False)
+
     return task
 
 
@@ -2,14 +2,18 @@
 Service for handling the AI Tutor chat functionality.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 from pymongo.database import Database
 
 from .ai_client import ai_client
+from src.infrastructure.config import settings
 from src.infrastructure.database import db as flask_db
 from src.infrastructure.repositories import MongoDocumentRepository
 from src.domain.models.db_models import DocumentStatus
 from sb_utils.logger_utils import logger
-from src.utils.smart_parser import get_smart_context  # centralized utility
+from src.utils.smart_parser import get_smart_chunks, pack_context  # centralized utility
+from src.utils.text_cleaner import is_blank
 
 
 def _get_db(db_conn: Database | None = None) -> Database:
@@ -45,14 +49,18 @@ def answer_tutor_question(
         if getattr(doc, "status", DocumentStatus.READY) == DocumentStatus.READY
     ]
 
-    # 2. Smart retrieval per document
-    smart_contexts: list[str] = []
-    for doc in course_documents:
-        context_chunk = get_smart_context(doc.id, query=question)
-        if context_chunk:
-            smart_contexts.append(f"קטע מתוך '{doc.filename}':\n{context_chunk}")
-
-    # 3. Aggregate or fallback
+    # 2. Smart retrieval per document (disk + unpickle each, so side by side;
+    #    map() keeps the document order)
+    doc_chunks: list[list[str]] = []
+    if course_documents:
+        with ThreadPoolExecutor(max_workers=min(settings.SB_CONTEXT_PARALLEL_DOCS, len(course_documents))) as pool:
+            results = pool.map(lambda d: get_smart_chunks(d.id, query=question), course_documents)
+            for doc, chunks in zip(course_documents, results):
+                if chunks:
+                    doc_chunks.append([f"קטע מתוך '{doc.filename}':\n{chunk}" for chunk in chunks])
+
+    # 3. Aggregate within the token budget (round-robin across documents) or fallback
+    smart_contexts = pack_context(doc_chunks, settings.SB_CONTEXT_TOKEN_BUDGET)
     if smart_contexts:
         logger.info(
             f"Found {len(smart_contexts)} relevant smart chunks for tutor question."
@@ -64,13 +72,15 @@ def answer_tutor_question(
             f"Falling back to full document text for course {course_id}."
         )
         full_texts = [
-            (doc.content_text or "")
+            [doc.content_text]
             for doc in course_documents
-            if (doc.content_text or "").strip()
+            if not is_blank(doc.content_text or "")
         ]
-        final_context = "\n--- \n".join(full_texts)
+        final_context = "\n--- \n".join(
+            pack_context(full_texts, settings.SB_CONTEXT_TOKEN_BUDGET)
+        )
 
-    if not final_context.strip():
+    if is_blank(final_context):
         return (
             "מצטער, לא מצאתי חומר לימוד רלוונטי בקורס הזה כדי לענות על השאלה. "
             "אולי כדאי להעלות קודם כמה קבצים?"
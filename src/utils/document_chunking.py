@@ -101,7 +101,8 @@ def chunk_text_by_paragraphs(text: str, max_chunk_size: int = 1000, overlap: int
 
 
 def create_chunk_metadata(chunk: str, chunk_index: int, total_chunks: int, 
-                         document_id: str, filename: str) -> Dict:
+                         document_id: str, filename: str,
+                         created_at: Optional[datetime] = None) -> Dict:
     """
     Create metadata for a text chunk.
     
@@ -111,6 +112,7 @@ def create_chunk_metadata(chunk: str, chunk_index: int, total_chunks: int,
         total_chunks: Total number of chunks in the document
         document_id: ID of the parent document
         filename: Original filename
+        created_at: Timestamp shared by a batch of chunks (defaults to now)
         
     Returns:
         Dictionary with chunk metadata
@@ -139,7 +141,7 @@ def create_chunk_metadata(chunk: str, chunk_index: int, total_chunks: int,
         'preview': chunk[:200],  # First 200 chars for quick preview
         'document_id': document_id,
         'filename': filename,
-        'created_at': datetime.now(timezone.utc)
+        'created_at': created_at or datetime.now(timezone.utc)
     }
 
 
@@ -258,8 +260,9 @@ def index_document_chunks(db, document_id: str, filename: str, text: str,
     
     # Create metadata and insert chunks
     chunk_docs = []
+    now = datetime.now(timezone.utc)
     for idx, chunk in enumerate(chunks):
-        metadata = create_chunk_metadata(chunk, idx, len(chunks), document_id, filename)
+        metadata = create_chunk_metadata(chunk, idx, len(chunks), document_id, filename, now)
         
         chunk_doc = {
             'document_id': document_id,
@@ -1,3 +1,9 @@
+import io
+import mmap
+import os
+from functools import lru_cache
+from typing import Optional
+
 import magic
 from werkzeug.datastructures import FileStorage
 from .pdf_utils import extract_text_from_pdf
@@ -8,16 +14,131 @@ from .image_utils import extract_text_from_image
 from sb_utils.logger_utils import logger
 
 
+@lru_cache(maxsize=1)
+def _mime_detector() -> magic.Magic:
+    """One libmagic handle per process; loading the magic database is slow."""
+    return magic.Magic(mime=True)
+
+
+def _detect_mime(header: bytes) -> str:
+    """MIME type of a file from its first bytes."""
+    return _mime_detector().from_buffer(header)
+
+
+# Types with a dedicated extractor below, by file extension. When an upload
+# declares one of these types, or has one of these extensions, and its first
+# bytes agree, libmagic is not consulted.
+_MIME_BY_EXTENSION = {
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.pdf': 'application/pdf',
+    '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    '.pptx': 'application/vnd.openxmlformats-officedocument.presentationml.presentation',
+    '.html': 'text/html',
+    '.htm': 'text/html',
+    '.txt': 'text/plain',
+}
+_EXTRACTABLE_MIME_TYPES = frozenset(_MIME_BY_EXTENSION.values())
+
+
+# Leading bytes every file of a binary type starts with (docx/pptx are zip archives)
+_MAGIC_BYTES = {
+    'image/png': b'\x89PNG\r\n\x1a\n',
+    'image/jpeg': b'\xff\xd8\xff',
+    'application/pdf': b'%PDF',
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document': b'PK\x03\x04',
+    'application/vnd.openxmlformats-officedocument.presentationml.presentation': b'PK\x03\x04',
+}
+_BINARY_MAGIC = tuple(set(_MAGIC_BYTES.values()))
+
+
+def _header_matches(mime_type: str, header: bytes) -> bool:
+    """Whether a file's first bytes are consistent with ``mime_type``."""
+    magic_bytes = _MAGIC_BYTES.get(mime_type)
+    if magic_bytes is not None:
+        return header.startswith(magic_bytes)
+    # Text has no signature; it only must not look like a binary file
+    return b'\x00' not in header and not header.startswith(_BINARY_MAGIC)
+
+
+def _known_mime(declared: Optional[str], filename: Optional[str], header: bytes) -> Optional[str]:
+    """
+    Extractable type from the declared MIME type or the extension, if the
+    file's first bytes confirm it. Both come from the client, so a
+    mislabelled file falls through to libmagic.
+    """
+    candidates = (
+        declared if declared in _EXTRACTABLE_MIME_TYPES else None,
+        _MIME_BY_EXTENSION.get(os.path.splitext(filename or "")[1].lower()),
+    )
+    for mime_type in candidates:
+        if mime_type is not None and _header_matches(mime_type, header):
+            return mime_type
+    return None
+
+
+_SNIFF_BYTES = 2048
+
+
+def _sniff_header(file) -> bytes:
+    """
+    First bytes of an upload without moving its position.
+
+    Buffered streams are peeked; anything else is read and rewound.
+    """
+    peek = getattr(getattr(file, "stream", file), "peek", None)
+    if peek is not None:
+        header = peek(_SNIFF_BYTES)
+        # peek() returns whatever is buffered, which may be short of a full header
+        if len(header) >= _SNIFF_BYTES:
+            return header[:_SNIFF_BYTES]
+    header = file.read(_SNIFF_BYTES)
+    file.seek(0)
+    return header
+
+
+def _read_text(binary) -> str:
+    """
+    Decode a UTF-8 binary stream chunk by chunk, so the whole file is never
+    held as bytes and str at the same time. Undecodable bytes are dropped.
+    """
+    try:
+        reader = io.TextIOWrapper(binary, encoding='utf-8', errors='ignore', newline='')
+    except (AttributeError, io.UnsupportedOperation):
+        return binary.read().decode('utf-8', errors='ignore')
+    try:
+        return reader.read()
+    finally:
+        # leave the underlying stream open for the caller
+        reader.detach()
+
+
+def _read_text_file(f) -> str:
+    """
+    Decode an open file on disk straight from a read-only memory map: the
+    kernel pages the bytes in and no intermediate bytes copy is made.
+    """
+    try:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (ValueError, OSError):
+        # empty file (can't be mapped) or not a regular file
+        return _read_text(f)
+    with mapped:
+        return str(mapped, 'utf-8', 'ignore')
+
+
 def process_uploaded_file(file: FileStorage) -> str:
     """
     Detects file type and extracts text content from an uploaded file.
     Supports images (PNG, JPEG), PDF, DOCX, PPTX, HTML, and plain text.
     """
     try:
-        file_content_chunk = file.read(2048)
-        file.seek(0)
-
-        mime_type = magic.from_buffer(file_content_chunk, mime=True)
+        header = _sniff_header(file)
+        mime_type = (
+            _known_mime(getattr(file, "mimetype", None), getattr(file, "filename", None), header)
+            or _detect_mime(header)
+        )
         logger.info(f"Processing file '{file.filename}' with detected MIME type '{mime_type}'.")
 
         if mime_type.startswith('image/'):
@@ -33,11 +154,10 @@ def process_uploaded_file(file: FileStorage) -> str:
             return extract_text_from_pptx(file)
 
         elif mime_type == 'text/html':
-            html_content = file.read().decode('utf-8', errors='ignore')
-            return convert_html_to_text(html_content)
+            return convert_html_to_text(_read_text(getattr(file, "stream", file)))
 
         elif mime_type.startswith('text/'):
-            return file.read().decode('utf-8', errors='ignore')
+            return _read_text(getattr(file, "stream", file))
 
         else:
             logger.warning(f"Unsupported file type '{mime_type}' for file '{file.filename}'.")
@@ -55,11 +175,10 @@ def process_file_from_path(file_path: str, filename: str) -> str:
     Supports images (PNG, JPEG), PDF, DOCX, PPTX, HTML, and plain text.
     """
     try:
-        # Read file header to detect MIME type
+        # Read file header to confirm or detect the MIME type
         with open(file_path, 'rb') as f:
-            file_content_chunk = f.read(2048)
-        
-        mime_type = magic.from_buffer(file_content_chunk, mime=True)
+            header = f.read(_SNIFF_BYTES)
+        mime_type = _known_mime(None, filename, header) or _detect_mime(header)
         logger.info(f"Processing file '{filename}' from path with detected MIME type '{mime_type}'.")
 
         # Open file and process based on MIME type
@@ -77,11 +196,10 @@ def process_file_from_path(file_path: str, filename: str) -> str:
                 return extract_text_from_pptx(f)
 
             elif mime_type == 'text/html':
-                html_content = f.read().decode('utf-8', errors='ignore')
-                return convert_html_to_text(html_content)
+                return convert_html_to_text(_read_text_file(f))
 
             elif mime_type.startswith('text/'):
-                return f.read().decode('utf-8', errors='ignore')
+                return _read_text_file(f)
 
             else:
                 logger.warning(f"Unsupported file type '{mime_type}' for file '{filename}'.")
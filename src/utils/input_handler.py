@@ -16,6 +16,7 @@ import os
 from dataclasses import dataclass
 
 from sb_utils.logger_utils import logger
+from src.utils.text_cleaner import is_blank
 
 
 @dataclass
@@ -36,7 +37,7 @@ class ProcessedInput:
     
     def is_valid(self) -> bool:
         """Check if input is valid for AI processing."""
-        return self.success and bool(self.content.strip())
+        return self.success and not is_blank(self.content)
     
     def get_display_info(self) -> str:
         """Get user-friendly description of input."""
@@ -126,7 +127,7 @@ class InputNormalizer:
             user_id=user_id,
             language=language,
             encoding='utf-8',
-            success=bool(text.strip()),
+            success=not is_blank(text),
             warnings=warnings
         )
     
@@ -274,7 +275,7 @@ class InputNormalizer:
             user_id=user_id,
             language=language,
             encoding='utf-8',
-            success=bool(combined_content.strip()),
+            success=not is_blank(combined_content),
             warnings=warnings
         )
     
@@ -335,7 +336,7 @@ class InputValidator:
         }
         
         # Check if empty
-        if not processed_input.content.strip():
+        if is_blank(processed_input.content):
             validation['is_valid'] = False
             validation['quality'] = 'invalid'
             validation['messages'].append("⚠️ הקלט ריק - אנא הוסף תוכן")
@@ -1,11 +1,21 @@
 import os
 import re
 import pickle
-from typing import List, Dict, Optional
+import threading
+from collections import OrderedDict
+from itertools import zip_longest
+from typing import Dict, Iterable, List, Optional, Sequence
 from sb_utils.logger_utils import logger
 
 SMART_REPO_CACHE_DIR = "smart_repo_cache"
 
+# Unpickled chunk lists keyed by (path, mtime_ns, size): follow-up questions on
+# the same documents skip the disk read + unpickle, and a rewritten
+# repository gets a new key. Cached lists are shared, so treat them as read-only.
+_CHUNK_CACHE_SIZE = 256
+_chunk_cache: "OrderedDict[tuple[str, int, int], List[Dict[str, str]]]" = OrderedDict()
+_chunk_cache_lock = threading.Lock()
+
 def _parse_text_to_chunks(text: str) -> List[Dict[str, str]]:
     """
     A simple structural parser to split text into chunks based on headings.
@@ -63,41 +73,145 @@ def create_smart_repository(document_id: str, text_content: str) -> Optional[str
         logger.error(f"Failed to create smart repository for document {document_id}: {e}", exc_info=True)
         return None
 
-def get_smart_context(document_id: str, query: str, max_len: int = 4000) -> Optional[str]:
+def _load_chunks(pickle_path: str) -> Optional[List[Dict[str, str]]]:
+    """Load a pickled chunk list through the in-process cache."""
+    try:
+        st = os.stat(pickle_path)
+    except FileNotFoundError:
+        return None
+
+    key = (pickle_path, st.st_mtime_ns, st.st_size)
+    with _chunk_cache_lock:
+        chunks = _chunk_cache.get(key)
+        if chunks is not None:
+            _chunk_cache.move_to_end(key)
+            return chunks
+
+    with open(pickle_path, "rb") as f:
+        chunks = pickle.load(f)
+
+    with _chunk_cache_lock:
+        _chunk_cache[key] = chunks
+        if len(_chunk_cache) > _CHUNK_CACHE_SIZE:
+            _chunk_cache.popitem(last=False)
+    return chunks
+
+def _select_chunks(document_id: str, query: str) -> Optional[List[Dict[str, str]]]:
+    """Load the document's smart repository and pick the chunks relevant to the query."""
+    pickle_path = os.path.join(SMART_REPO_CACHE_DIR, document_id, "chunks.pkl")
+    chunks = _load_chunks(pickle_path)
+    if chunks is None:
+        return None
+
+    # If query is generic, just use the first few chunks.
+    if "general" in query.lower() or not query:
+        relevant_chunks = chunks[:3] # Return first 3 chunks for a generic summary
+    else:
+        # Simple keyword search. A real RAG would use vector search here.
+        # Lowercase each chunk once, not once per query word.
+        query_words = set(query.lower().split())
+        relevant_chunks = [
+            chunk
+            for chunk, content in zip(chunks, (c["content"].lower() for c in chunks))
+            if any(word in content for word in query_words)
+        ]
+
+    if not relevant_chunks:
+        logger.warning(f"Smart repo for doc {document_id} exists, but no relevant chunks found for query: '{query}'.")
+        return None
+    return relevant_chunks
+
+
+def _format_chunk(chunk: Dict[str, str]) -> str:
+    return f"Context from section '{chunk['heading']}':\\n{chunk['content']}\\n\\n"
+
+
+def _take_within(chunk_texts: Iterable[str], max_len: int) -> List[str]:
+    """Leading chunks whose combined length stays within max_len."""
+    parts: List[str] = []
+    used = 0
+    for chunk_text in chunk_texts:
+        used += len(chunk_text)
+        if used > max_len:
+            break
+        parts.append(chunk_text)
+    return parts
+
+
+def get_smart_chunks(document_id: str, query: str, max_len: int = 4000) -> Optional[List[str]]:
     """
-    "Sniper Retrieval" - Retrieves the most relevant chunks for a given query.
-    If no specific query is given, it returns a general context.
+    Like get_smart_context, but returns the relevant chunks as separate
+    strings so callers can pack several documents together. The same
+    per-document max_len applies, so one document's matches can't grow
+    without bound before packing.
     """
     try:
-        pickle_path = os.path.join(SMART_REPO_CACHE_DIR, document_id, "chunks.pkl")
-        if not os.path.exists(pickle_path):
+        relevant_chunks = _select_chunks(document_id, query)
+        if not relevant_chunks:
             return None
+        return _take_within(map(_format_chunk, relevant_chunks), max_len) or None
+    except Exception as e:
+        logger.error(f"Failed to retrieve from smart repository for doc {document_id}: {e}", exc_info=True)
+        return None
 
-        with open(pickle_path, "rb") as f:
-            chunks: List[Dict[str, str]] = pickle.load(f)
-        
-        # If query is generic, just use the first few chunks.
-        if "general" in query.lower() or not query:
-            relevant_chunks = chunks[:3] # Return first 3 chunks for a generic summary
-        else:
-            # Simple keyword search. A real RAG would use vector search here.
-            query_words = set(query.lower().split())
-            relevant_chunks = [
-                chunk for chunk in chunks 
-                if any(word in chunk["content"].lower() for word in query_words)
-            ]
 
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token)."""
+    return len(text) // 4
+
+
+def pack_context(doc_chunks: Iterable[Sequence[str]], max_tokens: int) -> List[str]:
+    """
+    Pick chunks from several documents round-robin until max_tokens is used.
+
+    Taking one chunk per document per round keeps material from every
+    document instead of filling the budget from the first one. A chunk
+    longer than its document's share of the budget (max_tokens divided by
+    the number of documents) is cut to that share, so a whole-document
+    fallback can't take the entire budget. Once a document's next chunk
+    doesn't fit, the rest of that document is skipped and the other
+    documents carry on. Repeated chunks are sent once.
+    """
+    docs = [chunks for chunks in doc_chunks if chunks]
+    if not docs:
+        return []
+
+    share_chars = max_tokens // len(docs) * 4
+    packed: List[str] = []
+    seen: set[str] = set()
+    full: set[int] = set()  # documents whose next chunk didn't fit
+    remaining = max_tokens
+
+    for round_chunks in zip_longest(*docs):
+        for doc_index, chunk in enumerate(round_chunks):
+            if doc_index in full or not chunk or chunk in seen:
+                continue
+            seen.add(chunk)
+
+            chunk = chunk[:share_chars]
+            cost = estimate_tokens(chunk)
+            if not chunk or cost > remaining:
+                full.add(doc_index)
+                continue
+            packed.append(chunk)
+            remaining -= cost
+
+    return packed
+
+
+def get_smart_context(document_id: str, query: str, max_len: int = 4000) -> Optional[str]:
+    """
+    "Sniper Retrieval" - Retrieves the most relevant chunks for a given query.
+    If no specific query is given, it returns a general context.
+    """
+    try:
+        relevant_chunks = _select_chunks(document_id, query)
         if not relevant_chunks:
-            logger.warning(f"Smart repo for doc {document_id} exists, but no relevant chunks found for query: '{query}'.")
             return None
 
         # Combine chunks into a single context string, respecting max_len
-        final_context = ""
-        for chunk in relevant_chunks:
-            chunk_text = f"Context from section '{chunk['heading']}':\\n{chunk['content']}\\n\\n"
-            if len(final_context) + len(chunk_text) > max_len:
-                break
-            final_context += chunk_text
+        # (collected and joined once instead of re-copying the string per chunk)
+        final_context = "".join(_take_within(map(_format_chunk, relevant_chunks), max_len))
         
         logger.info(f"Smart retrieval successful for doc {document_id}. Using {len(relevant_chunks)} chunks.")
         return final_context.strip()
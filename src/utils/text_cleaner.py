@@ -1,5 +1,7 @@
 import re
 
+_NON_BLANK = re.compile(r'\S')
+
 
 def clean_text(text: str) -> str:
     """
@@ -12,3 +14,12 @@ def clean_text(text: str) -> str:
     # Replace multiple whitespace chars (space, tab, newline) with a single space
     cleaned_text = re.sub(r'\s+', ' ', text)
     return cleaned_text.strip()
+
+
+def is_blank(text: str) -> bool:
+    """
+    True if text is empty or only whitespace.
+    Stops at the first non-whitespace character instead of building a
+    stripped copy, which matters for whole-document contexts.
+    """
+    return _NON_BLANK.search(text) is None
@@ -122,7 +122,8 @@ class CacheManager:
         """Cache a result."""
         try:
             cache_key = self._generate_cache_key(operation, content, user_prefs)
-            expires_at = datetime.now(timezone.utc) + timedelta(hours=self.cache_ttl_hours)
+            now = datetime.now(timezone.utc)
+            expires_at = now + timedelta(hours=self.cache_ttl_hours)
             
             self.db.ai_cache.update_one(
                 {"cache_key": cache_key},
@@ -130,14 +131,14 @@ class CacheManager:
                     "$set": {
                         "operation": operation,
                         "result": result,
-                        "created_at": datetime.now(timezone.utc).isoformat(),
+                        "created_at": now.isoformat(),
                         "expires_at": expires_at.isoformat()
                     }
                 },
                 upsert=True
             )
             
-            logger.debug(f"💰 Cached result for {operation}")
+            logger.debug("💰 Cached result for %s", operation)
             
         except Exception as e:
             logger.error(f"Cache set error: {e}")
@@ -184,7 +185,7 @@ class TokenTracker:
                 "timestamp": datetime.now(timezone.utc).isoformat()
             })
             
-            logger.debug(f"💰 {layer}: {tokens_used} tokens, ${cost:.6f}")
+            logger.debug("💰 %s: %s tokens, $%.6f", layer, tokens_used, cost)
             
         except Exception as e:
             logger.error(f"Token tracking error: {e}")
@@ -398,8 +399,9 @@ def make_cost_effective_call(
             ai_function=ai_client.generate_text
         )
     """
-    # 1. CHECK CACHE
-    if cost_optimizer.should_use_cache(task_type, len(document_content)):
+    # 1. CHECK CACHE (decided once; reused when storing the result)
+    use_cache = cost_optimizer.should_use_cache(task_type, len(document_content))
+    if use_cache:
         cached = cache_manager.get_cached(task_type, document_content, user_prefs)
         if cached:
             return cached  # 💰 SAVED: Entire AI call!
@@ -485,7 +487,7 @@ def make_cost_effective_call(
         final_response = ai_response
     
     # 7. CACHE RESULT
-    if cost_optimizer.should_use_cache(task_type, len(document_content)):
+    if use_cache:
         cache_manager.set_cached(
             task_type, document_content, user_prefs, final_response
         )
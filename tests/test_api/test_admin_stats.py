@@ -0,0 +1,203 @@
+"""Tests for the admin dashboard statistics helpers."""
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import mongomock
+import pytest
+
+from src.api import routes_admin
+
+
+@pytest.fixture(autouse=True)
+def fresh_ttl_cache():
+    """Health/statistics results must not leak between tests."""
+    with patch.object(routes_admin, "_ttl_cache", {}):
+        yield
+
+
+@pytest.fixture
+def stats_db():
+    """In-memory database patched into the admin routes."""
+    database = mongomock.MongoClient().db
+    with patch.object(routes_admin, "db", database), \
+            patch.object(routes_admin, "_config_cache", None):
+        yield database
+
+
+def test_user_counts_come_from_one_aggregation(stats_db):
+    """Every user count is computed, including ones with no matches."""
+    now = datetime.now(timezone.utc)
+    stats_db.users.insert_many([
+        {"is_verified": True, "is_active": True, "role": "admin", "created_at": now},
+        {"is_verified": False, "is_active": True, "role": "user", "created_at": now - timedelta(days=3)},
+        {"is_verified": True, "is_active": False, "role": "user", "created_at": now - timedelta(days=3)},
+    ])
+
+    with patch.object(stats_db.users, "count_documents") as mock_count:
+        users = routes_admin.get_app_statistics()["users"]
+
+    mock_count.assert_not_called()
+    assert users == {"total": 3, "verified": 2, "active": 2, "admins": 1, "today": 1}
+
+
+def test_task_counts_come_from_one_group(stats_db):
+    """The total covers every status; listed statuses without tasks count 0."""
+    stats_db.tasks.insert_many([
+        {"status": "PENDING"}, {"status": "COMPLETED"}, {"status": "COMPLETED"}, {"status": "CANCELLED"},
+    ])
+
+    with patch.object(stats_db.tasks, "count_documents") as mock_count:
+        tasks = routes_admin.get_app_statistics()["tasks"]
+
+    mock_count.assert_not_called()
+    assert tasks == {"total": 4, "pending": 1, "processing": 0, "completed": 2, "failed": 0}
+
+
+def test_facet_counts_handle_empty_results():
+    """$count emits no document for an empty match; that is reported as 0."""
+    collection = mongomock.MongoClient().db.empty
+    with patch.object(collection, "aggregate", return_value=iter([{"total": [], "admins": []}])):
+        assert routes_admin._facet_counts(collection, {"total": {}, "admins": {"role": "admin"}}) == {
+            "total": 0,
+            "admins": 0,
+        }
+
+
+def test_system_health_reads_sampled_cpu(stats_db):
+    """Health requests use the sampler's value instead of blocking on psutil."""
+    with patch.object(routes_admin, "_cpu_sampler", object()), \
+            patch.object(routes_admin, "_cpu_percent", 42.0), \
+            patch.object(routes_admin.psutil, "cpu_percent") as mock_cpu:
+        health = routes_admin.get_system_health()
+
+    mock_cpu.assert_not_called()
+    assert health["metrics"]["cpu"]["percent"] == 42.0
+
+
+def test_system_health_reuses_platform_snapshot(stats_db):
+    """Host details and core count are read once at import, not on every health poll."""
+    with patch.object(routes_admin, "_cpu_sampler", object()), \
+            patch.object(routes_admin, "_cpu_percent", 1.0), \
+            patch.object(routes_admin.platform, "version") as mock_version, \
+            patch.object(routes_admin.psutil, "boot_time") as mock_boot, \
+            patch.object(routes_admin.psutil, "cpu_count") as mock_cpu_count:
+        metrics = routes_admin.get_system_health()["metrics"]
+    system = metrics["system"]
+
+    mock_version.assert_not_called()
+    mock_boot.assert_not_called()
+    mock_cpu_count.assert_not_called()
+    assert metrics["cpu"]["cores"] == routes_admin._CPU_COUNT
+    assert system["hostname"] == routes_admin._PLATFORM_INFO["hostname"]
+    assert system["uptime_hours"] >= 0
+
+
+def test_system_config_cached_until_updated(stats_db):
+    """Repeat reads reuse the parsed config; updates from any worker are seen."""
+    routes_admin.get_system_config()  # creates the default document
+    first = routes_admin.get_system_config()
+    assert routes_admin.get_system_config() is first
+
+    routes_admin.update_system_config({"max_prompts_per_day": 7})
+    assert routes_admin.get_system_config().max_prompts_per_day == 7
+
+    # Another worker's update bumps updated_at in the shared document; it is
+    # picked up once the recheck delay has passed
+    stats_db.system_config.update_one(
+        {"_id": "system_config"},
+        {"$set": {"max_prompts_per_day": 9, "updated_at": datetime.now(timezone.utc) + timedelta(seconds=1)}},
+    )
+    assert routes_admin.get_system_config().max_prompts_per_day == 7
+    with patch.object(routes_admin, "CONFIG_RECHECK_S", 0):
+        assert routes_admin.get_system_config().max_prompts_per_day == 9
+
+
+def test_system_config_not_rechecked_within_delay(stats_db):
+    """Reads inside CONFIG_RECHECK_S make no database round trip."""
+    routes_admin.get_system_config()  # creates the default document
+    routes_admin.get_system_config()
+
+    with patch.object(stats_db.system_config, "find_one") as mock_find:
+        routes_admin.get_system_config()
+
+    mock_find.assert_not_called()
+
+
+def test_dashboard_indexes_created_once(stats_db):
+    """The dashboard indexes are created on first use and not re-sent afterwards."""
+    with patch.object(routes_admin, "_indexes_ready", False):
+        routes_admin._ensure_dashboard_indexes()
+        with patch.object(stats_db.users, "create_index") as mock_create:
+            routes_admin._ensure_dashboard_indexes()
+
+    mock_create.assert_not_called()
+    assert "created_at_-1" in stats_db.users.index_information()
+    assert "status_1" in stats_db.tasks.index_information()
+
+
+def test_helpers_use_the_database_they_are_given():
+    """The stats refresher thread passes the unwrapped database in; no app context needed."""
+    database = mongomock.MongoClient().db
+    database.tasks.insert_one({"status": "FAILED"})
+
+    with patch.object(routes_admin, "_cpu_sampler", object()), \
+            patch.object(routes_admin, "_cpu_percent", 1.0):
+        health = routes_admin.get_system_health(database)
+    stats = routes_admin.get_app_statistics(database)
+
+    assert health["status"] != "error"
+    assert stats["tasks"]["failed"] == 1
+
+
+def test_stats_snapshot_served_from_stored_document(stats_db):
+    """Polls read the stored snapshot; a fresh snapshot is not recomputed."""
+    stats_db.users.insert_one({"role": "user"})
+    with patch.object(routes_admin, "_stats_refresher", object()):
+        assert routes_admin.get_stats_snapshot(stats_db)["users"]["total"] == 1  # computed inline
+
+        routes_admin._refresh_stats_snapshot(stats_db)
+        stats_db.users.insert_one({"role": "user"})
+        routes_admin._refresh_stats_snapshot(stats_db)  # still fresh, skipped
+
+        assert routes_admin.get_stats_snapshot(stats_db)["users"]["total"] == 1
+
+
+def test_statistics_reused_within_ttl(stats_db):
+    """Polls inside the TTL reuse the last result instead of re-counting."""
+    stats_db.tasks.insert_one({"status": "FAILED"})
+    assert routes_admin.get_app_statistics()["tasks"]["failed"] == 1
+
+    stats_db.tasks.insert_one({"status": "FAILED"})
+    assert routes_admin.get_app_statistics()["tasks"]["failed"] == 1
+
+    routes_admin._ttl_cache.clear()  # as if the TTL had expired
+    assert routes_admin.get_app_statistics()["tasks"]["failed"] == 2
+
+
+def test_recent_users_projection_matches_template():
+    """The recent-users query fetches only the fields the dashboard renders."""
+    import re
+    from pathlib import Path
+
+    template = Path(routes_admin.__file__).parents[2] / "ui" / "templates" / "admin" / "dashboard.html"
+    rendered = set(re.findall(r"user\.get\('(\w+)'\)", template.read_text(encoding="utf-8")))
+
+    projected = {field for field, include in routes_admin.RECENT_USER_FIELDS.items() if include}
+    assert rendered == projected
+
+
+def test_statistics_skip_list_collections(stats_db):
+    """Missing collections count as 0 without a listCollections round trip."""
+    with patch.object(stats_db, "list_collection_names") as mock_list:
+        content = routes_admin.get_app_statistics()["content"]
+
+    mock_list.assert_not_called()
+    assert content["courses"] == 0 and content["summaries"] == 0
+
+
+def test_users_created_at_midnight_count_as_today(stats_db):
+    """The day starts at 00:00:00.000000, not at the current microsecond."""
+    midnight = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    stats_db.users.insert_one({"role": "user", "created_at": midnight})
+
+    assert routes_admin.get_app_statistics()["users"]["today"] == 1
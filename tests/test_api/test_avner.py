@@ -0,0 +1,19 @@
+import pytest
+
+from src.api.routes_avner import detect_question_type
+
+
+@pytest.mark.parametrize("question, expected", [
+    ("what's the weather tomorrow?", ('offtopic', None)),
+    ("How do I upload a file?", ('app', 'upload')),
+    ("flashcards summary please", ('app', 'summary')),
+    ("איך יוצרים כרטיסיות?", ('app', 'flashcards')),
+    ("Explain photosynthesis in simple words", ('learning', None)),
+    ("היי", ('greeting', None)),
+    ("Mitochondria produce energy for the cell", ('learning', None)),
+])
+def test_detect_question_type(question, expected):
+    """
+    Test the keyword prefilter that answers locally before any AI call.
+    """
+    assert detect_question_type(question) == expected
@@ -19,7 +19,7 @@ def test_upload_file_success(client: FlaskClient):
         assert response.status_code == 201
         assert 'document_id' in response.json
         assert response.json['filename'] == 'test.txt'
-        mock_repo_instance.create.assert_called_once()
+        mock_repo_instance.create_many.assert_called_once()
 
 
 def test_upload_no_file(client: FlaskClient):
@@ -64,3 +64,42 @@ def test_ai_client_initialization():
     # This should not raise AttributeError anymore
     client = AIClient(provider=settings.SB_DEFAULT_PROVIDER)
     assert client.provider == "gemini", "Client provider should be gemini"
+
+
+def test_content_length_limit_rejects_before_app():
+    """Requests declaring a body over the limit never reach the wrapped app."""
+    from werkzeug.test import Client
+    from werkzeug.wrappers import Response
+    from src.infrastructure.request_limits import ContentLengthLimit
+
+    calls = []
+
+    def app(environ, start_response):
+        calls.append(environ["PATH_INFO"])
+        return Response("ok")(environ, start_response)
+
+    client = Client(ContentLengthLimit(app, max_bytes=10))
+
+    assert client.post("/small", data=b"x" * 10).status_code == 200
+    response = client.post("/big", data=b"x" * 11)
+    assert response.status_code == 413
+    assert response.headers["Connection"] == "close"
+    assert "error" in response.json
+    assert calls == ["/small"]
+
+
+def test_mongo_client_uses_pool_and_compression_settings():
+    """The shared client is built once per URI from the MONGO_* settings."""
+    from unittest.mock import patch
+    from src.infrastructure import database
+
+    with patch.object(database, "_clients", {}), \
+            patch.object(database, "MongoClient") as mock_client, \
+            patch.object(database.settings, "MONGO_COMPRESSORS", "zlib"):
+        client = database.get_mongo_client("mongodb://localhost/test")
+        assert database.get_mongo_client("mongodb://localhost/test") is client
+
+    mock_client.assert_called_once()
+    kwargs = mock_client.call_args.kwargs
+    assert kwargs["maxPoolSize"] == database.settings.MONGO_MAX_POOL_SIZE
+    assert kwargs["compressors"] == "zlib"
@@ -0,0 +1,111 @@
+"""Tests for upload type detection and text extraction."""
+import io
+from unittest.mock import MagicMock, patch
+
+from werkzeug.datastructures import FileStorage
+
+from src.utils import file_processing
+from src.utils.file_processing import process_file_from_path, process_uploaded_file
+
+
+def _upload(data: bytes, filename: str, content_type: str = "application/octet-stream") -> FileStorage:
+    return FileStorage(stream=io.BytesIO(data), filename=filename, content_type=content_type)
+
+
+def test_plain_text_upload_is_decoded():
+    """Text uploads come back as their decoded content."""
+    assert process_uploaded_file(_upload("שלום world".encode("utf-8"), "notes")) == "שלום world"
+
+
+def test_text_file_from_path_is_decoded(tmp_path):
+    """Workers read text files straight from disk."""
+    path = tmp_path / "notes"
+    path.write_bytes(b"cells divide")
+
+    assert process_file_from_path(str(path), "notes") == "cells divide"
+
+
+def test_libmagic_handle_is_shared():
+    """Detection reuses one libmagic handle across files."""
+    file_processing._mime_detector.cache_clear()
+    with patch("src.utils.file_processing.magic.Magic", wraps=file_processing.magic.Magic) as mock_magic:
+        process_uploaded_file(_upload(b"first", "a"))
+        process_uploaded_file(_upload(b"second", "b"))
+
+    mock_magic.assert_called_once_with(mime=True)
+
+
+def test_declared_extractable_type_skips_libmagic():
+    """A declared type we can extract is trusted; generic ones are sniffed."""
+    with patch("src.utils.file_processing._detect_mime") as mock_detect:
+        assert process_uploaded_file(_upload(b"declared", "a.txt", "text/plain")) == "declared"
+    mock_detect.assert_not_called()
+
+    with patch("src.utils.file_processing._detect_mime", return_value="text/plain") as mock_detect:
+        process_uploaded_file(_upload(b"sniffed", "a.bin"))
+    mock_detect.assert_called_once_with(b"sniffed")
+
+
+def test_mislabelled_file_is_sniffed(tmp_path):
+    """A declared type or extension the first bytes contradict goes to libmagic."""
+    data = b"%PDF-1.4 fake pdf bytes\x00\x01"
+    path = tmp_path / "notes.txt"
+    path.write_bytes(data)
+
+    with patch("src.utils.file_processing.extract_text_from_pdf", return_value="pdf text") as mock_pdf:
+        assert process_uploaded_file(_upload(data, "notes.txt", "text/plain")) == "pdf text"
+        assert process_file_from_path(str(path), "notes.txt") == "pdf text"
+    assert mock_pdf.call_count == 2
+
+    # A real PDF named .pdf is dispatched without sniffing
+    with patch("src.utils.file_processing._detect_mime") as mock_detect, \
+            patch("src.utils.file_processing.extract_text_from_pdf", return_value="pdf text"):
+        assert process_uploaded_file(_upload(data, "notes.pdf")) == "pdf text"
+    mock_detect.assert_not_called()
+
+
+def test_buffered_stream_is_peeked_not_rewound():
+    """Buffered uploads are sniffed with peek(); short peeks fall back to read + seek."""
+    stream = MagicMock()
+    stream.peek.return_value = b"%PDF" + b"x" * 4000
+
+    assert file_processing._sniff_header(FileStorage(stream=stream)) == (b"%PDF" + b"x" * 4000)[:2048]
+    stream.read.assert_not_called()
+    stream.seek.assert_not_called()
+
+    stream.peek.return_value = b"%PDF"
+    stream.read.return_value = b"%PDF-1.4"
+    assert file_processing._sniff_header(FileStorage(stream=stream)) == b"%PDF-1.4"
+    stream.seek.assert_called_once_with(0)
+
+
+def test_text_decoding_matches_bytes_decode():
+    """Chunked decoding keeps line endings and drops invalid bytes like bytes.decode."""
+    data = ("שורה\r\n" * 3000).encode("utf-8") + b"\xff tail"
+    upload = _upload(data, "notes.txt", "text/plain")
+
+    assert process_uploaded_file(upload) == data.decode("utf-8", errors="ignore")
+    assert not upload.stream.closed
+
+
+def test_known_extension_skips_libmagic(tmp_path):
+    """Files with an extractable extension are dispatched without sniffing."""
+    path = tmp_path / "notes.txt"
+    path.write_bytes(b"from disk")
+
+    with patch("src.utils.file_processing._detect_mime") as mock_detect:
+        assert process_uploaded_file(_upload(b"from upload", "Notes.TXT")) == "from upload"
+        assert process_file_from_path(str(path), "notes.txt") == "from disk"
+    mock_detect.assert_not_called()
+
+
+def test_text_file_from_path_decodes_mapped_bytes(tmp_path):
+    """Files on disk decode like bytes.decode, including empty files."""
+    data = "סיכום\r\nline two ".encode("utf-8") + b"\xff" + b"tail"
+    path = tmp_path / "notes.txt"
+    path.write_bytes(data)
+    empty = tmp_path / "empty.txt"
+    empty.write_bytes(b"")
+
+    assert process_file_from_path(str(path), "notes.txt") == data.decode("utf-8", errors="ignore")
+    assert process_file_from_path(str(empty), "empty.txt") == ""
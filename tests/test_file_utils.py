@@ -0,0 +1,118 @@
+"""Tests for upload filename handling and temp storage."""
+import io
+import os
+
+import pytest
+
+from sb_utils import file_utils
+from sb_utils.file_utils import clean_temp_path, digest_name, save_stream_to_temp, secure_name
+
+
+@pytest.fixture
+def temp_root(tmp_path, monkeypatch):
+    """Upload temp directories are created under tmp_path."""
+    monkeypatch.setattr("tempfile.tempdir", str(tmp_path))
+    return tmp_path
+
+
+def _files_under(root):
+    return [p for p in root.rglob("*") if p.is_file()]
+
+
+def test_secure_name_strips_path_and_unsafe_characters():
+    """Directory parts, punctuation and null bytes are dropped."""
+    assert secure_name("../../etc/pass\x00wd;rm -rf.txt") == "passwdrm -rf.txt"
+
+
+def test_secure_name_keeps_hebrew_letters():
+    """Non-ASCII letters and digits are kept, like str.isalnum()."""
+    assert secure_name("סיכום שיעור 3 (final).pdf") == "סיכום שיעור 3 final.pdf"
+
+
+def test_secure_name_limits_length():
+    """Names are capped at 200 characters."""
+    assert len(secure_name("a" * 500)) == 200
+
+
+def test_digest_name_is_deterministic_and_keeps_extension():
+    """The same upload name always maps to the same short hashed name."""
+    name = digest_name("Lecture 1.pdf")
+
+    assert name == digest_name("Lecture 1.pdf")
+    assert name != digest_name("Lecture 2.pdf")
+    assert name.startswith("Lecture 1-") and name.endswith(".pdf")
+    assert len(name) == len("Lecture 1-") + 12 + len(".pdf")
+
+
+def test_save_stream_to_temp_round_trip(temp_root):
+    """The upload is written in full and cleanup removes it."""
+    data = os.urandom(3 * 1024 * 1024 + 17)
+
+    uploaded = save_stream_to_temp(io.BytesIO(data), "notes.pdf")
+    try:
+        assert uploaded.size == len(data)
+        assert uploaded.content_type == "application/pdf"
+        with open(uploaded.temp_path, "rb") as f:
+            assert f.read() == data
+    finally:
+        clean_temp_path(uploaded.temp_path)
+
+    assert _files_under(temp_root) == []
+
+
+def test_save_stream_to_temp_rejects_oversize(temp_root):
+    """Uploads over max_size raise and leave nothing behind."""
+    with pytest.raises(ValueError, match="oversize"):
+        save_stream_to_temp(io.BytesIO(b"x" * 101), "big.txt", max_size=100)
+
+    assert _files_under(temp_root) == []
+
+
+def test_uploads_of_the_same_name_get_separate_dirs(temp_root):
+    """Temp names are deterministic, so each upload needs its own directory."""
+    first = save_stream_to_temp(io.BytesIO(b"a"), "same.txt")
+    second = save_stream_to_temp(io.BytesIO(b"b"), "same.txt")
+    assert os.path.dirname(first.temp_path) != os.path.dirname(second.temp_path)
+
+    clean_temp_path(first.temp_path)
+    clean_temp_path(first.temp_path)  # cleaning twice is harmless
+    clean_temp_path(second.temp_path)
+    assert list(temp_root.iterdir()) == []
+
+
+def test_validate_upload_checks_in_order():
+    """Empty, oversize and unsupported uploads get their own messages."""
+    from sb_utils.validation import HEBREW_ERRORS, validate_upload
+
+    assert validate_upload("application/pdf", 0) == HEBREW_ERRORS["no_input"]
+    assert validate_upload("application/zip", file_utils.MAX_FILE_SIZE_BYTES + 1) == HEBREW_ERRORS["too_large"]
+    assert validate_upload("application/zip", 10) == HEBREW_ERRORS["bad_type"]
+    assert validate_upload("application/pdf", 10) is None
+
+
+def test_validate_upload_size_ignores_type():
+    """The pre-storage check rejects empty/oversize files of any type."""
+    from sb_utils.validation import HEBREW_ERRORS, validate_upload_size
+
+    assert validate_upload_size(0) == HEBREW_ERRORS["no_input"]
+    assert validate_upload_size(file_utils.MAX_FILE_SIZE_BYTES + 1) == HEBREW_ERRORS["too_large"]
+    assert validate_upload_size(file_utils.MAX_FILE_SIZE_BYTES) is None
+
+
+def test_validate_upload_size_with_custom_limit():
+    """Callers with a larger limit get a message quoting that limit."""
+    from sb_utils.validation import validate_upload_size
+
+    limit = 50 * 1024 * 1024
+    assert validate_upload_size(file_utils.MAX_FILE_SIZE_BYTES + 1, limit) is None
+    assert "50MB" in validate_upload_size(limit + 1, limit)
+
+
+def test_uploaded_file_has_no_instance_dict():
+    """UploadedFile uses slots; unknown attributes are rejected."""
+    uploaded = file_utils.UploadedFile("a.txt", "text/plain", 1, "/tmp/a.txt")
+
+    assert not hasattr(uploaded, "__dict__")
+    with pytest.raises(AttributeError):
+        uploaded.extra = 1
+
@@ -0,0 +1,38 @@
+"""Tests for the JSON logger setup."""
+from sb_utils.logger_utils import get_logger
+
+
+def test_get_logger_configures_once():
+    """Repeated calls keep one handler and still apply the requested level."""
+    first = get_logger("sb-test-once")
+    second = get_logger("sb-test-once", log_level="DEBUG")
+
+    assert first is second
+    assert len(second.handlers) == 1
+    assert second.level == 10
+
+
+def test_loggers_share_one_formatter():
+    """Every configured logger uses the same formatter instance."""
+    a = get_logger("sb-test-a")
+    b = get_logger("sb-test-b")
+
+    assert a.handlers[0].formatter is b.handlers[0].formatter
+
+
+def test_formatter_emits_json_for_unusual_extras():
+    """Records with non-JSON extras and non-ASCII text still serialize."""
+    import logging
+
+    import orjson
+
+    from sb_utils.logger_utils import _formatter
+
+    record = logging.LogRecord("sb-test", logging.INFO, __file__, 1, "שלום %s", ("עולם",), None)
+    record.payload = {1: object()}
+
+    data = orjson.loads(_formatter.format(record))
+
+    assert data["message"] == "שלום עולם"
+    assert data["levelname"] == "INFO"
+    assert "object" in data["payload"]["1"]
@@ -0,0 +1,64 @@
+"""
+Tests for the shared RabbitMQ publisher connection.
+"""
+import json
+from unittest.mock import MagicMock, patch
+
+import pika
+import pytest
+
+from src.infrastructure import rabbitmq
+
+
+def setup_function():
+    rabbitmq._reset_publisher()
+
+
+@patch('src.infrastructure.rabbitmq.pika.BlockingConnection')
+def test_publish_task_reuses_connection(mock_connection_cls):
+    """Consecutive publishes share one connection and declare each queue once."""
+    channel = mock_connection_cls.return_value.channel.return_value
+
+    rabbitmq.publish_task("summarize", {"task_id": "1"})
+    rabbitmq.publish_task("summarize", {"task_id": "2"})
+
+    mock_connection_cls.assert_called_once()
+    channel.confirm_delivery.assert_called_once()
+    channel.queue_declare.assert_called_once_with(queue="summarize", durable=True)
+    assert channel.basic_publish.call_count == 2
+    body = channel.basic_publish.call_args.kwargs["body"]
+    assert json.loads(body) == {"task_id": "2", "queue_name": "summarize"}
+
+
+@patch('src.infrastructure.rabbitmq.pika.BlockingConnection')
+def test_publish_task_reconnects_after_dropped_connection(mock_connection_cls):
+    """A stale connection is rebuilt once and the task is still published."""
+    stale, fresh = MagicMock(), MagicMock()
+    stale.channel.return_value.basic_publish.side_effect = pika.exceptions.StreamLostError("gone")
+    mock_connection_cls.side_effect = [stale, fresh]
+
+    rabbitmq.publish_task("assess", {"task_id": "1"})
+
+    fresh.channel.return_value.basic_publish.assert_called_once()
+
+
+def test_probe_parameters_stay_within_probe_timeout():
+    """A probe connection gives up within the timeout it was given."""
+    params = rabbitmq.connection_parameters(probe_timeout=2.0)
+
+    assert params.connection_attempts == 1
+    assert params.stack_timeout == 2.0
+    assert params.socket_timeout < 2.0
+
+
+@patch('src.infrastructure.rabbitmq.pika.BlockingConnection')
+def test_publish_task_does_not_republish_nacked_message(mock_connection_cls):
+    """A broker nack is raised as is; resending could duplicate the task."""
+    channel = mock_connection_cls.return_value.channel.return_value
+    channel.basic_publish.side_effect = pika.exceptions.NackError([])
+
+    with pytest.raises(pika.exceptions.NackError):
+        rabbitmq.publish_task("assess", {"task_id": "1"})
+
+    assert channel.basic_publish.call_count == 1
+    mock_connection_cls.assert_called_once()
@@ -1,7 +1,7 @@
 from unittest.mock import MagicMock
 from datetime import datetime, timezone
 from src.infrastructure.repositories import MongoDocumentRepository, MongoTaskRepository
-from src.domain.models.db_models import Document, TaskStatus
+from src.domain.models.db_models import Document, Task, TaskStatus
 
 
 class TestMongoDocumentRepository:
@@ -38,6 +38,17 @@ class TestMongoDocumentRepository:
 
         assert doc is None
 
+    def test_get_by_id_skips_objectid_lookup_for_uuid(self):
+        """Test that non-ObjectId ids don't trigger an ObjectId query."""
+        mock_db = MagicMock()
+        mock_db.documents.find_one.return_value = None
+
+        repo = MongoDocumentRepository(mock_db)
+        repo.get_by_id("2b1c7c3e-8a1f-4c1e-9d57-0f3c1f7d2a10")
+
+        # string _id, then legacy 'id' field
+        assert mock_db.documents.find_one.call_count == 2
+
     def test_create_document(self):
         """Test creating a new document."""
         mock_db = MagicMock()
@@ -57,6 +68,20 @@ class TestMongoDocumentRepository:
         assert call_args["_id"] == "new-doc-123"
         assert call_args["filename"] == "new_file.txt"
 
+    def test_create_many_uses_one_insert(self):
+        """Test that a batch of documents is written with a single insert_many."""
+        mock_db = MagicMock()
+
+        repo = MongoDocumentRepository(mock_db)
+        repo.create_many([
+            Document(_id=f"doc-{i}", user_id="user-123", course_id="course-123", filename=f"{i}.txt", content_text="")
+            for i in range(3)
+        ])
+
+        mock_db.documents.insert_one.assert_not_called()
+        inserted = mock_db.documents.insert_many.call_args[0][0]
+        assert [d["_id"] for d in inserted] == ["doc-0", "doc-1", "doc-2"]
+
 
 class TestMongoTaskRepository:
     """Tests for MongoTaskRepository."""
@@ -100,8 +125,30 @@ class TestMongoTaskRepository:
 
         assert task is not None
         assert task.status == TaskStatus.PENDING
+        assert task.updated_at == task.created_at
         mock_db.tasks.insert_one.assert_called_once()
 
+    def test_create_many_uses_one_insert(self):
+        """Test that a batch of tasks is written with a single unordered insert_many."""
+        mock_db = MagicMock()
+
+        repo = MongoTaskRepository(mock_db)
+        repo.create_many([Task(_id=f"task-{i}", user_id="user-123", task_type="summary") for i in range(3)])
+
+        mock_db.tasks.insert_one.assert_not_called()
+        call = mock_db.tasks.insert_many.call_args
+        assert [t["_id"] for t in call[0][0]] == ["task-0", "task-1", "task-2"]
+        assert all(t["status"] == "PENDING" for t in call[0][0])
+        assert call.kwargs["ordered"] is False
+
+    def test_create_many_empty_batch_skips_insert(self):
+        """Test that an empty batch makes no database call."""
+        mock_db = MagicMock()
+
+        MongoTaskRepository(mock_db).create_many([])
+
+        mock_db.tasks.insert_many.assert_not_called()
+
     def test_update_status_to_processing(self):
         """Test updating task status to PROCESSING."""
         mock_db = MagicMock()
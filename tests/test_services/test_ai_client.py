@@ -31,6 +31,7 @@ class TestAIClient:
         mock_settings.GEMINI_API_KEY = "valid-api-key"
         mock_settings.OPENAI_API_KEY = ""
         mock_settings.SB_GEMINI_MODEL = "gemini-1.5-flash-latest"
+        mock_settings.SB_CONTEXT_TOKEN_BUDGET = 12000
 
         mock_model = MagicMock()
         mock_response = MagicMock()
@@ -67,6 +68,232 @@ class TestAIClient:
             with pytest.raises(ValueError, match="OpenAI API key is not configured"):
                 client._ensure_initialized()
 
+    @patch('src.services.ai_client.openai.OpenAI')
+    def test_openai_client_reused_between_calls(self, mock_openai):
+        """Test that consecutive OpenAI calls share one SDK client."""
+        mock_response = MagicMock()
+        mock_response.choices[0].message.content = " answer "
+        mock_openai.return_value.chat.completions.create.return_value = mock_response
+
+        client = AIClient(provider="openai")
+        client._openai_initialized = True
+
+        assert client._call_gpt_mini("first") == "answer"
+        assert client._call_gpt_mini("second") == "answer"
+        mock_openai.assert_called_once()
+
+    @patch('src.services.ai_client.openai.OpenAI')
+    def test_rejected_request_is_not_retried(self, mock_openai):
+        """Test that a 4xx rejection fails at once instead of sleeping through retries."""
+        import httpx
+        import openai
+        from src.domain.errors import AIClientError
+
+        request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+        mock_openai.return_value.chat.completions.create.side_effect = openai.BadRequestError(
+            "bad request", response=httpx.Response(400, request=request), body=None
+        )
+
+        client = AIClient(provider="openai")
+        client._openai_initialized = True
+
+        with pytest.raises(AIClientError):
+            client._call_gpt_mini("prompt")
+        mock_openai.return_value.chat.completions.create.assert_called_once()
+
+    def test_transient_errors_are_retried(self):
+        """Test the retry classification for rate limits and server errors."""
+        import httpx
+        import openai
+        from google.api_core import exceptions as google_exceptions
+        from src.services.ai_client import _is_transient
+
+        request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+
+        def wrapped(cause):
+            err = RuntimeError("call failed")
+            err.__cause__ = cause
+            return err
+
+        assert _is_transient(wrapped(openai.RateLimitError(
+            "slow down", response=httpx.Response(429, request=request), body=None)))
+        assert _is_transient(wrapped(openai.APIConnectionError(request=request)))
+        assert _is_transient(wrapped(google_exceptions.ServiceUnavailable("down")))
+        assert _is_transient(wrapped(google_exceptions.ResourceExhausted("quota")))
+        assert not _is_transient(wrapped(google_exceptions.InvalidArgument("bad")))
+
+        # Both providers treat the same 4xx statuses as transient
+        assert _is_transient(wrapped(openai.ConflictError(
+            "busy", response=httpx.Response(409, request=request), body=None)))
+        assert _is_transient(wrapped(google_exceptions.Conflict("busy")))
+        assert not _is_transient(wrapped(openai.BadRequestError(
+            "bad", response=httpx.Response(400, request=request), body=None)))
+
+    @patch('src.services.ai_client.genai')
+    @patch('src.services.ai_client.settings')
+    def test_gemini_model_cached_between_calls(self, mock_settings, mock_genai):
+        """Test that the Gemini model object is built once per model name."""
+        mock_settings.GEMINI_API_KEY = "valid-api-key"
+        mock_settings.SB_GEMINI_MODEL = "gemini-1.5-flash-latest"
+        mock_genai.GenerativeModel.return_value.generate_content.return_value.text = "ok"
+
+        client = AIClient(provider="gemini")
+        client._call_gemini_flash("first")
+        client._call_gemini_flash("second")
+
+        mock_genai.GenerativeModel.assert_called_once_with("gemini-1.5-flash-latest")
+        client.close()
+        assert client._gemini_models == {}
+
+    def test_route_task_json_types_use_openai_json_mode(self):
+        """Test that structured task types go to OpenAI in JSON mode."""
+        client = AIClient()
+        with patch.object(client, '_call_gpt_mini', return_value="{}") as mock_gpt, \
+                patch.object(client, '_call_gemini_flash') as mock_gemini:
+            for task_type in ("quiz", "assessment", "flashcards"):
+                client.route_task(task_type, "content")
+            client.route_task("summary", "content")
+
+        assert mock_gpt.call_count == 3
+        assert all(call.kwargs["require_json"] for call in mock_gpt.call_args_list)
+        mock_gemini.assert_called_once_with("content", None)
+
+    @patch('src.services.ai_client.threading.Thread')
+    @patch('src.services.ai_client.settings')
+    def test_warm_up_disabled_by_setting(self, mock_settings, mock_thread):
+        """Test that warm-up can be switched off (e.g. in tests)."""
+        mock_settings.SB_PREWARM_CONNECTIONS = False
+
+        AIClient().warm_up()
+
+        mock_thread.assert_not_called()
+
+    @patch('src.services.ai_client.openai.OpenAI')
+    @patch('src.services.ai_client.httpx.Client')
+    def test_warm_up_opens_pooled_connection(self, mock_http, mock_openai):
+        """Test that warm-up touches the API host through the shared pool."""
+        mock_openai.return_value.base_url = "https://api.openai.com/v1/"
+        client = AIClient(provider="openai")
+        client._openai_initialized = True
+
+        client._warm_up()
+
+        mock_http.return_value.head.assert_called_once_with("https://api.openai.com/v1/", timeout=5.0)
+
+
+    @patch('src.services.ai_client.openai.OpenAI')
+    def test_shared_material_gets_one_prompt_cache_key(self, mock_openai):
+        """Test that tasks over the same material share a prompt cache key."""
+        from sb_utils.ai_safety import create_safety_guard_prompt
+
+        mock_openai.return_value.chat.completions.create.return_value.choices[0].message.content = "ok"
+        client = AIClient(provider="openai")
+        client._openai_initialized = True
+        material = "Photosynthesis converts light into chemical energy. " * 100
+
+        client._call_gpt_mini(create_safety_guard_prompt("Summarize", material))
+        client._call_gpt_mini(create_safety_guard_prompt("List key terms", material))
+        client._call_gpt_mini(create_safety_guard_prompt("Summarize", "Other notes"))
+
+        keys = [c.kwargs["prompt_cache_key"] for c in mock_openai.return_value.chat.completions.create.call_args_list]
+        assert keys[0] == keys[1] != keys[2]
+
+    @patch('src.services.ai_client.settings')
+    def test_oversized_context_is_trimmed_to_budget(self, mock_settings):
+        """Test that whole-file contexts are capped before the provider call."""
+        mock_settings.SB_CONTEXT_TOKEN_BUDGET = 10
+        client = AIClient()
+
+        with patch.object(client, 'route_task', return_value="ok") as mock_route:
+            client.generate_text("Explain", "a" * 40 + "#" * 100, task_type="standard")
+
+        sent = mock_route.call_args.kwargs["content"]
+        assert "a" * 40 in sent and "#" not in sent
+
+    def test_identical_summary_requests_reuse_answer(self):
+        """Test that repeated summaries are answered from the response cache."""
+        from src.services import ai_client as ai_client_module
+
+        client = AIClient()
+        with patch.dict(ai_client_module._responses, clear=True), \
+                patch.object(client, 'route_task', side_effect=["first", "second", "q1", "q2"]) as mock_route:
+            assert client.generate_text("Summarize", "material", task_type="summary") == "first"
+            assert client.generate_text("Summarize", "material", task_type="summary") == "first"
+            assert client.generate_text("Summarize", "other material", task_type="summary") == "second"
+
+            # Question sets are regenerated on every request
+            assert client.generate_text("Quiz me", "material", task_type="quiz") == "q1"
+            assert client.generate_text("Quiz me", "material", task_type="quiz") == "q2"
+
+        assert mock_route.call_count == 4
+
+    def test_concurrent_identical_requests_share_one_call(self):
+        """Test that identical in-flight summaries wait for a single provider call."""
+        import threading
+        from concurrent.futures import Future, ThreadPoolExecutor
+        from src.services import ai_client as ai_client_module
+
+        client = AIClient()
+        callers = 4
+        release = threading.Event()
+        joined = threading.Semaphore(0)
+
+        class CountingFuture(Future):
+            """Signals each caller that starts waiting for the shared answer."""
+
+            def result(self, timeout=None):
+                joined.release()
+                return super().result(timeout)
+
+        def slow_route(**_):
+            release.wait(5)
+            return "shared"
+
+        with patch.dict(ai_client_module._responses, clear=True), \
+                patch.object(ai_client_module, 'Future', CountingFuture), \
+                patch.object(client, 'route_task', side_effect=slow_route) as mock_route, \
+                ThreadPoolExecutor(callers) as pool:
+            futures = [
+                pool.submit(client.generate_text, "Summarize", "material", task_type="summary")
+                for _ in range(callers)
+            ]
+            # The provider stays blocked until every other caller is waiting on
+            # the in-flight call, so none of them can be served from the cache
+            all_joined = all(joined.acquire(timeout=5) for _ in range(callers - 1))
+            release.set()
+            results = [f.result(timeout=5) for f in futures]
+
+        assert all_joined
+        assert results == ["shared"] * callers
+        assert mock_route.call_count == 1
+        assert ai_client_module._inflight == {}
+
+    def test_failed_shared_call_is_not_cached(self):
+        """Test that a provider failure propagates and the next request retries."""
+        from src.services import ai_client as ai_client_module
+        from src.domain.errors import AIClientError
+
+        client = AIClient()
+        with patch.dict(ai_client_module._responses, clear=True), \
+                patch.object(client, 'route_task', side_effect=[AIClientError("down"), "ok"]):
+            with pytest.raises(AIClientError):
+                client.generate_text("Summarize", "material", task_type="summary")
+            assert client.generate_text("Summarize", "material", task_type="summary") == "ok"
+
+    @patch('src.services.ai_client.time.monotonic')
+    def test_response_cache_entries_expire(self, mock_monotonic):
+        """Test that cached answers are dropped after their TTL."""
+        from src.services import ai_client as ai_client_module
+
+        client = AIClient()
+        mock_monotonic.return_value = 1000.0
+        with patch.dict(ai_client_module._responses, clear=True), \
+                patch.object(client, 'route_task', side_effect=["old", "new"]):
+            client.generate_text("Summarize", "material", task_type="summary")
+            mock_monotonic.return_value += ai_client_module.settings.SB_RESPONSE_CACHE_TTL_SECONDS + 1
+
+            assert client.generate_text("Summarize", "material", task_type="summary") == "new"
+
 
 class TestAISafetyPrompt:
     """Tests for AI safety prompt generation."""
@@ -85,3 +312,26 @@ class TestAISafetyPrompt:
         assert context in result
         assert prompt in result
         assert "Do NOT invent facts" in result
+
+    def test_safety_guard_prompt_layout(self):
+        """Test that the context sits between the markers and the task comes last."""
+        from sb_utils.ai_safety import create_safety_guard_prompt
+
+        result = create_safety_guard_prompt("Summarize this text\n", "Doc body")
+
+        assert result.startswith("IMPORTANT")
+        assert "--- TEXT FOR CONTEXT ---\nDoc body\n--- END OF TEXT ---" in result
+        assert result.endswith("Task: Summarize this text")
+
+    def test_safety_guard_prompt_caches_only_short_contexts(self):
+        """Test that repeated short pairs are memoized and long contexts are not."""
+        from sb_utils import ai_safety
+
+        ai_safety._wrap_cached.cache_clear()
+        first = ai_safety.create_safety_guard_prompt("Explain", "short context")
+        assert ai_safety.create_safety_guard_prompt("Explain", "short context") is first
+        assert ai_safety._wrap_cached.cache_info().hits == 1
+
+        long_context = "x" * (ai_safety._CACHEABLE_CONTEXT_CHARS + 1)
+        assert long_context in ai_safety.create_safety_guard_prompt("Explain", long_context)
+        assert ai_safety._wrap_cached.cache_info().currsize == 1
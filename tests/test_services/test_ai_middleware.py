@@ -0,0 +1,47 @@
+from unittest.mock import MagicMock, patch
+
+from src.services import ai_middleware
+from src.services.ai_middleware import PromptOptimizer, UserPreferences
+
+
+class TestPromptOptimizer:
+    """Tests for the prompt optimization layer."""
+
+    def setup_method(self):
+        ai_middleware._optimized_prompts.clear()
+
+    @patch('src.services.ai_middleware._openai_client')
+    @patch('src.services.ai_middleware.settings')
+    def test_identical_requests_reuse_optimized_prompt(self, mock_settings, mock_client):
+        """Test that a repeated request is answered from the cache."""
+        mock_settings.OPENAI_API_KEY = "key"
+        create = mock_client.return_value.with_options.return_value.chat.completions.create
+        create.return_value.choices = [MagicMock()]
+        create.return_value.choices[0].message.content = (
+            '{"optimized_prompt": "Explain the document only", "system_context": "ctx"}'
+        )
+        prefs = UserPreferences(user_id="user-1")
+
+        first = PromptOptimizer.optimize("explain", "summary", prefs, "doc text")
+        second = PromptOptimizer.optimize("explain", "summary", prefs, "doc text")
+        other = PromptOptimizer.optimize("explain more", "summary", prefs, "doc text")
+
+        assert first == second == other
+        assert create.call_count == 2
+
+
+class TestUserPreferences:
+    """Tests for the cached learning profile."""
+
+    def test_learning_profile_cached_until_invalidated(self):
+        """Test that the profile is reused and rebuilt after a change."""
+        prefs = UserPreferences(user_id="user-1", study_level="university")
+        profile = prefs.learning_profile
+
+        assert "Study Level: university" in profile
+        assert prefs.learning_profile is profile
+
+        prefs.study_level = "professional"
+        prefs.invalidate_cached_profile()
+        assert "Study Level: professional" in prefs.learning_profile
+        assert "learning_profile" not in prefs.to_dict()
@@ -0,0 +1,50 @@
+from unittest.mock import MagicMock
+
+from pymongo.errors import DuplicateKeyError, ServerSelectionTimeoutError
+
+from src.services.alert_throttle import AlertThrottle
+
+
+def _throttle(mock_db):
+    throttle = AlertThrottle(db_conn=mock_db)
+    throttle._started_at -= 3600  # past the start-up grace period
+    return throttle
+
+
+class TestAlertThrottle:
+    """Tests for the per-component alert cooldown."""
+
+    def test_first_alert_is_sent(self):
+        """Test that an unhealthy component claims the cooldown slot."""
+        mock_db = MagicMock()
+        throttle = _throttle(mock_db)
+
+        assert throttle.should_send("mongodb", "unhealthy") is True
+        mock_db["health_alerts"].update_one.assert_called_once()
+        query, update = mock_db["health_alerts"].update_one.call_args[0]
+        assert query["_id"] == "mongodb:unhealthy"
+        assert update["$set"]["sent_by"]
+
+    def test_alert_within_cooldown_is_suppressed(self):
+        """Test that a live cooldown entry suppresses the alert."""
+        mock_db = MagicMock()
+        mock_db["health_alerts"].update_one.side_effect = DuplicateKeyError("dup")
+
+        assert _throttle(mock_db).should_send("mongodb", "unhealthy") is False
+
+    def test_degraded_and_grace_period_are_suppressed(self):
+        """Test that low-impact statuses and boot-time alerts are not sent."""
+        mock_db = MagicMock()
+
+        assert _throttle(mock_db).should_send("rabbitmq", "degraded") is False
+        assert AlertThrottle(db_conn=mock_db).should_send("rabbitmq", "unhealthy") is False
+        mock_db["health_alerts"].update_one.assert_not_called()
+
+    def test_falls_back_to_local_cooldown_when_store_down(self):
+        """Test that alerts still go out (once) when MongoDB itself is down."""
+        mock_db = MagicMock()
+        mock_db["health_alerts"].create_index.side_effect = ServerSelectionTimeoutError("down")
+        throttle = _throttle(mock_db)
+
+        assert throttle.should_send("mongodb", "unhealthy") is True
+        assert throttle.should_send("mongodb", "unhealthy") is False
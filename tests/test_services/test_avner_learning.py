@@ -0,0 +1,42 @@
+import mongomock
+
+from src.services.avner_learning import AdminTeachingInterface, ContinuousImprovement
+
+
+class TestImprovementRules:
+    """Tests for admin improvement rules."""
+
+    def _db_with_rules(self):
+        db = mongomock.MongoClient().db
+        admin = AdminTeachingInterface(db)
+        admin.add_improvement_rule("admin", "teaching_strategy", {"task_type": "summary"},
+                                   {"add_examples": True}, "summary examples")
+        admin.add_improvement_rule("admin", "teaching_strategy", {"task_type": "quiz"},
+                                   {"add_practice": True}, "quiz practice")
+        admin.add_improvement_rule("admin", "teaching_strategy", {"study_level": "university"},
+                                   {"step_by_step": True}, "any task")
+        return db, admin
+
+    def test_rules_filtered_by_task_type_in_query(self):
+        """Test that only rules for the task (or any task) are loaded."""
+        db, admin = self._db_with_rules()
+
+        rules = admin.get_improvement_rules(task_type="summary")
+
+        assert sorted(r["description"] for r in rules) == ["any task", "summary examples"]
+        assert len(admin.get_improvement_rules()) == 3
+
+    def test_enhance_prompt_applies_matching_rules(self):
+        """Test that matching rules change the prompt and are counted."""
+        db, _ = self._db_with_rules()
+        improvement = ContinuousImprovement(db)
+
+        prompt = improvement.enhance_prompt_with_learnings(
+            "Summarize", "user-1", "summary", {"study_level": "university"}
+        )
+
+        assert "practical examples" in prompt
+        assert "clear steps" in prompt
+        assert "practice questions" not in prompt
+        applied = {r["description"]: r["times_applied"] for r in db.admin_improvement_rules.find()}
+        assert applied == {"summary examples": 1, "quiz practice": 0, "any task": 1}
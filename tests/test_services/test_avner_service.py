@@ -0,0 +1,65 @@
+from unittest.mock import MagicMock, patch
+
+from pymongo.database import Database
+
+from src.services import avner_service
+
+
+class TestChatContext:
+    """Tests for assembling the Avner chat context."""
+
+    @patch('src.services.avner_service.get_user_general_context', return_value="user ctx")
+    @patch('src.services.avner_service.get_course_context', return_value=("course ctx", "en"))
+    def test_combines_user_and_course_context(self, mock_course, mock_user):
+        """Test that both lookups run and the user context comes first."""
+        db = MagicMock(spec=Database)
+
+        context, language = avner_service.get_chat_context("course-1", "user-1", db)
+
+        assert context == "user ctx\n\ncourse ctx"
+        assert language == "en"
+        mock_course.assert_called_once_with("course-1", "user-1", db)
+        mock_user.assert_called_once_with("user-1", db)
+
+    @patch('src.services.avner_service.get_user_general_context', return_value="")
+    @patch('src.services.avner_service.get_course_context')
+    def test_no_course_skips_course_lookup(self, mock_course, _mock_user):
+        """Test the default language and empty context without a course."""
+        context, language = avner_service.get_chat_context("", "user-1", MagicMock())
+
+        assert (context, language) == ("", "he")
+        mock_course.assert_not_called()
+
+
+class TestCourseContextCache:
+    """Tests for the short-lived course context cache."""
+
+    def setup_method(self):
+        avner_service._course_context_cache.clear()
+
+    def test_repeat_questions_reuse_course_context(self):
+        """Test that follow-up questions skip the course queries until invalidated."""
+        db = MagicMock()
+        db.courses.find_one.return_value = {"_id": "course-1", "language": "en"}
+        db.documents.find.return_value.limit.return_value = [
+            {"filename": "notes.pdf", "content_text": "cells divide"}
+        ]
+
+        first = avner_service.get_course_context("course-1", "user-1", db)
+        second = avner_service.get_course_context("course-1", "user-1", db)
+
+        assert first == second == ("=== notes.pdf ===\ncells divide", "en")
+        db.courses.find_one.assert_called_once()
+
+        avner_service.invalidate_course_context("user-1", "course-1")
+        avner_service.get_course_context("course-1", "user-1", db)
+        assert db.courses.find_one.call_count == 2
+
+    def test_database_errors_are_not_cached(self):
+        """Test that a failed lookup is retried on the next question."""
+        db = MagicMock()
+        db.courses.find_one.side_effect = [RuntimeError("mongo down"), None]
+
+        assert avner_service.get_course_context("course-1", "user-1", db) == ("", "he")
+        assert avner_service.get_course_context("course-1", "user-1", db) == ("", "he")
+        assert db.courses.find_one.call_count == 2
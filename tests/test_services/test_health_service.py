@@ -0,0 +1,148 @@
+import time
+from unittest.mock import MagicMock, patch
+
+from src.services import health_service
+from src.services.health_service import get_comprehensive_health
+
+
+def _healthy():
+    return {"status": "healthy"}
+
+
+class TestComprehensiveHealth:
+    """Tests for the aggregated health report."""
+
+    @patch('src.services.health_service.check_git_connectivity', side_effect=_healthy)
+    @patch('src.services.health_service.check_file_upload', side_effect=_healthy)
+    @patch('src.services.health_service.check_ai_models', side_effect=_healthy)
+    @patch('src.services.health_service.check_rabbitmq', side_effect=_healthy)
+    @patch('src.services.health_service.check_mongodb')
+    def test_all_components_healthy(self, mock_mongo, *_):
+        """Test that every component is reported and the overall status is healthy."""
+        mock_mongo.return_value = {"status": "healthy"}
+
+        report = get_comprehensive_health(MagicMock())
+
+        assert report["overall_status"] == "healthy"
+        assert set(report["components"]) == {"mongodb", "rabbitmq", "ai_models", "file_upload", "git"}
+
+    @patch('src.services.health_service.check_git_connectivity', side_effect=_healthy)
+    @patch('src.services.health_service.check_file_upload', side_effect=_healthy)
+    @patch('src.services.health_service.check_ai_models', side_effect=_healthy)
+    @patch('src.services.health_service.check_rabbitmq', side_effect=ConnectionError("broker down"))
+    @patch('src.services.health_service.check_mongodb', return_value={"status": "healthy"})
+    def test_rabbitmq_exception_marks_unhealthy(self, *_):
+        """Test that an exception from a check is reported as unhealthy."""
+        report = get_comprehensive_health(MagicMock())
+
+        assert report["components"]["rabbitmq"]["status"] == "unhealthy"
+        assert "broker down" in report["components"]["rabbitmq"]["error"]
+        assert report["overall_status"] == "unhealthy"
+
+    @patch.object(health_service, 'HEALTH_CHECK_BUDGET_S', 0.2)
+    @patch('src.services.health_service.check_git_connectivity', side_effect=_healthy)
+    @patch('src.services.health_service.check_file_upload', side_effect=_healthy)
+    @patch('src.services.health_service.check_ai_models', side_effect=_healthy)
+    @patch('src.services.health_service.check_rabbitmq', side_effect=_healthy)
+    @patch('src.services.health_service.check_mongodb')
+    def test_slow_check_times_out(self, mock_mongo, *_):
+        """Test that a hanging check does not hold up the report."""
+        mock_mongo.side_effect = lambda db: time.sleep(1) or {"status": "healthy"}
+
+        started = time.monotonic()
+        report = get_comprehensive_health(MagicMock())
+
+        assert time.monotonic() - started < 1
+        assert report["components"]["mongodb"] == {"status": "unhealthy", "error": "timeout"}
+        assert report["components"]["git"]["status"] == "healthy"
+
+
+class TestCachedHealth:
+    """Tests for the background-refreshed health snapshot."""
+
+    @patch('src.services.health_service._ensure_refresher')
+    def test_cached_health_refreshed_in_background(self, _mock_refresher):
+        """Test that probes start unhealthy and then serve the refreshed report."""
+        from src.services.health_service import _refresh_snapshot, get_cached_health
+
+        with patch.object(health_service, '_cached_report', {"overall_status": "unhealthy", "components": {}}):
+            assert get_cached_health()["overall_status"] == "unhealthy"
+
+            report = {"overall_status": "healthy", "components": {"mongodb": {"status": "healthy"}}}
+            with patch('src.services.health_service.get_comprehensive_health', return_value=report) as mock_run:
+                _refresh_snapshot(MagicMock())
+                assert get_cached_health() == report
+                assert get_cached_health() == report
+                mock_run.assert_called_once()
+
+
+class TestRabbitMQHealth:
+    """Tests for the RabbitMQ connectivity check."""
+
+    def setup_method(self):
+        health_service._reset_rabbitmq_connection()
+
+    @patch('src.services.health_service._rabbitmq_connection')
+    def test_connection_reused_between_checks(self, mock_connect):
+        """Test that consecutive checks share one connection and declare passively."""
+        mock_channel = MagicMock()
+        mock_channel.queue_declare.return_value.method.message_count = 0
+        mock_connect.return_value.channel.return_value = mock_channel
+
+        assert health_service.check_rabbitmq()["status"] == "healthy"
+        assert health_service.check_rabbitmq()["status"] == "healthy"
+        assert health_service.check_rabbitmq_depths()["status"] == "healthy"
+
+        mock_connect.assert_called_once()
+        assert mock_channel.queue_declare.call_count == len(health_service._RABBITMQ_QUEUES)
+        assert all(call.kwargs["passive"] for call in mock_channel.queue_declare.call_args_list)
+
+    @patch('src.services.health_service._rabbitmq_connection')
+    def test_liveness_check_skips_queue_declares(self, mock_connect):
+        """Test that the probe-path check does not touch queues."""
+        health_service.check_rabbitmq()
+
+        mock_connect.return_value.channel.return_value.queue_declare.assert_not_called()
+        mock_connect.return_value.process_data_events.assert_called_once_with(time_limit=0)
+
+    @patch('src.services.health_service._rabbitmq_connection', side_effect=OSError("connection refused"))
+    def test_unreachable_broker_is_unhealthy(self, _mock_connect):
+        """Test that a connection failure is reported instead of raised."""
+        result = health_service.check_rabbitmq()
+
+        assert result["status"] == "unhealthy"
+        assert "connection refused" in result["error"]
+
+
+class TestFileUploadHealth:
+    """Tests for the filesystem checks."""
+
+    def test_fast_check_leaves_no_files(self, tmp_path):
+        """Test that the probe-path check writes and removes a single file."""
+        with patch('src.services.health_service.tempfile.gettempdir', return_value=str(tmp_path)):
+            result = health_service.check_file_upload()
+
+        assert result["status"] == "healthy"
+        assert list(tmp_path.iterdir()) == []
+
+    def test_deep_check_round_trips_files(self):
+        """Test the text + PDF round trip used by the monitoring daemon."""
+        assert health_service.check_file_upload_deep()["status"] == "healthy"
+
+    @patch('src.services.health_service._ensure_refresher')
+    def test_cached_health_json_matches_snapshot(self, _mock_refresher):
+        """Test that the pre-serialized body is refreshed with the snapshot."""
+        import orjson
+        from src.services.health_service import _refresh_snapshot, get_cached_health_json
+
+        report = {"overall_status": "degraded", "components": {"rabbitmq": {"status": "degraded"}}}
+        with patch.object(health_service, '_cached_report', {}), \
+                patch.object(health_service, '_cached_report_json', b""), \
+                patch.object(health_service, '_cached_report_etag', ""):
+            with patch('src.services.health_service.get_comprehensive_health', return_value=report):
+                _refresh_snapshot(MagicMock())
+
+            body, overall_status, etag = get_cached_health_json()
+            assert overall_status == "degraded"
+            assert orjson.loads(body) == report
+            assert etag and get_cached_health_json()[2] == etag
@@ -38,6 +38,37 @@ class TestSummaryService(unittest.TestCase):
         self.assertEqual(saved_data["document_id"], "doc123")
         self.assertEqual(saved_data["summary_text"], "This is a test summary.")
 
+    @patch('src.services.summary_service.get_smart_chunks')
+    def test_course_context_keeps_document_order(self, mock_smart_chunks):
+        """Course context keeps document order and falls back to content_text."""
+        mock_db_conn = MagicMock()
+        mock_db_conn.documents.find.return_value = [
+            {"_id": f"doc{i}", "content_text": f"text {i}"} for i in range(12)
+        ]
+        mock_smart_chunks.side_effect = lambda doc_id, query: None if doc_id == "doc3" else [f"ctx {doc_id}"]
+
+        context = summary_service._get_course_smart_context("course-1", "", mock_db_conn)
+
+        parts = context.split("\n\n---\n\n")
+        self.assertEqual(len(parts), 12)
+        self.assertEqual(parts[0], "ctx doc0")
+        self.assertEqual(parts[3], "text 3")
+        self.assertEqual(parts[11], "ctx doc11")
+
+    @patch('src.services.summary_service.settings')
+    @patch('src.services.summary_service.get_smart_chunks')
+    def test_course_context_respects_token_budget(self, mock_smart_chunks, mock_settings):
+        """Course context takes chunks round-robin until the budget is used."""
+        mock_settings.SB_CONTEXT_TOKEN_BUDGET = 30
+        mock_settings.SB_CONTEXT_PARALLEL_DOCS = 8
+        mock_db_conn = MagicMock()
+        mock_db_conn.documents.find.return_value = [{"_id": "a"}, {"_id": "b"}]
+        mock_smart_chunks.side_effect = lambda doc_id, query: [f"{doc_id}{i}" * 20 for i in range(5)]
+
+        context = summary_service._get_course_smart_context("course-1", "", mock_db_conn)
+
+        parts = context.split("\n\n---\n\n")
+        self.assertEqual([p[:2] for p in parts], ["a0", "b0", "a1"])
 
 if __name__ == '__main__':
     unittest.main()
@@ -53,6 +53,29 @@ class TestTaskService:
 
         assert task is None
 
+    @patch('src.services.task_service._get_db')
+    def test_get_task_terminal_status_is_cached(self, mock_get_db):
+        """Test that polling a finished task only reads MongoDB once."""
+        from datetime import datetime, timezone
+
+        mock_db = MagicMock()
+        now = datetime.now(timezone.utc)
+        mock_db.tasks.find_one.return_value = {
+            "_id": "finished-task-id",
+            "status": "COMPLETED",
+            "result_id": "result-1",
+            "created_at": now,
+            "updated_at": now
+        }
+        mock_get_db.return_value = mock_db
+
+        first = get_task("finished-task-id")
+        second = get_task("finished-task-id")
+
+        assert first.status == TaskStatus.COMPLETED
+        assert second.result_id == "result-1"
+        mock_db.tasks.find_one.assert_called_once()
+
     @patch('src.services.task_service._get_db')
     def test_update_task_status_to_completed(self, mock_get_db):
         """Test updating task status to completed."""
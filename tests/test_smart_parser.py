@@ -0,0 +1,106 @@
+"""Tests for smart repository retrieval and context packing."""
+import os
+import pickle
+from unittest.mock import patch
+
+from src.utils import smart_parser
+from src.utils.smart_parser import get_smart_chunks, get_smart_context, pack_context
+
+
+def _write_repo(root, document_id, chunks):
+    repo = root / document_id
+    repo.mkdir(exist_ok=True)
+    with open(repo / "chunks.pkl", "wb") as f:
+        pickle.dump(chunks, f)
+    return repo / "chunks.pkl"
+
+
+def test_smart_chunks_unpickled_once_until_rewritten(tmp_path):
+    """Repeated lookups hit the cache; rewriting the repository is picked up."""
+    path = _write_repo(tmp_path, "doc1", [{"heading": "Intro", "content": "cells divide"}])
+
+    with patch.object(smart_parser, "SMART_REPO_CACHE_DIR", str(tmp_path)), \
+            patch.object(smart_parser, "_chunk_cache", smart_parser.OrderedDict()), \
+            patch("src.utils.smart_parser.pickle.load", wraps=pickle.load) as mock_load:
+        assert "cells divide" in get_smart_chunks("doc1", "cells")[0]
+        assert "cells divide" in get_smart_chunks("doc1", "divide")[0]
+        assert mock_load.call_count == 1
+
+        _write_repo(tmp_path, "doc1", [{"heading": "Intro", "content": "cells grow larger"}])
+        os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000))
+        assert "grow" in get_smart_chunks("doc1", "cells")[0]
+        assert mock_load.call_count == 2
+        assert get_smart_chunks("missing", "cells") is None
+
+
+def test_pack_context_round_robin_across_documents():
+    """Every document contributes before any document gets a second chunk."""
+    docs = [["a1", "a2", "a3"], ["b1"], ["c1", "c2"]]
+
+    assert pack_context(docs, max_tokens=100) == ["a1", "b1", "c1", "a2", "c2", "a3"]
+
+
+def test_pack_context_skips_duplicate_chunks():
+    """A chunk repeated across documents is sent once."""
+    assert pack_context([["same", "x"], ["same", "y"]], max_tokens=100) == ["same", "x", "y"]
+
+
+def test_pack_context_keeps_distinct_chunks_with_equal_hashes():
+    """Duplicates are detected by text, so a hash collision drops nothing."""
+
+    class Colliding(str):
+        def __hash__(self):
+            return 0
+
+    assert pack_context([[Colliding("a")], [Colliding("b")]], max_tokens=100) == ["a", "b"]
+
+
+def test_pack_context_skips_the_rest_of_a_document_that_no_longer_fits():
+    """A chunk that crosses the budget ends its document, not the packing."""
+    packed = pack_context([["a" * 60, "b" * 60, "e" * 8], ["c" * 8, "d" * 8]], max_tokens=30)
+
+    assert packed == ["a" * 60, "c" * 8, "d" * 8]
+
+
+def test_pack_context_caps_oversize_fallback_document_to_its_share():
+    """A whole-document fallback is cut to its share; other documents still fit."""
+    smart = ["A1" * 50, "A2" * 50]
+    fallback = ["B" * 60000]
+    other = ["C1" * 50]
+
+    packed = pack_context([smart, fallback, other], max_tokens=12000)
+
+    assert packed == ["A1" * 50, "B" * 16000, "C1" * 50, "A2" * 50]
+
+
+def test_smart_context_keeps_whole_chunks_within_max_len(tmp_path):
+    """Matching chunks are joined in order and stop before exceeding max_len."""
+    _write_repo(tmp_path, "doc2", [
+        {"heading": "A", "content": "Cells divide"},
+        {"heading": "B", "content": "Unrelated text"},
+        {"heading": "C", "content": "cells grow " * 20},
+    ])
+
+    with patch.object(smart_parser, "SMART_REPO_CACHE_DIR", str(tmp_path)), \
+            patch.object(smart_parser, "_chunk_cache", smart_parser.OrderedDict()):
+        context = get_smart_context("doc2", "CELLS", max_len=100)
+        assert "Cells divide" in context
+        assert "Unrelated" not in context
+        assert "grow" not in context
+
+        assert "grow" in get_smart_context("doc2", "cells", max_len=4000)
+
+
+def test_smart_chunks_capped_per_document(tmp_path):
+    """Each document's matches stop before exceeding max_len, like get_smart_context."""
+    _write_repo(tmp_path, "doc3", [
+        {"heading": "A", "content": "Cells divide"},
+        {"heading": "C", "content": "cells grow " * 20},
+    ])
+
+    with patch.object(smart_parser, "SMART_REPO_CACHE_DIR", str(tmp_path)), \
+            patch.object(smart_parser, "_chunk_cache", smart_parser.OrderedDict()):
+        chunks = get_smart_chunks("doc3", "cells", max_len=100)
+        assert len(chunks) == 1 and "Cells divide" in chunks[0]
+
+        assert len(get_smart_chunks("doc3", "cells")) == 2
@@ -0,0 +1,8 @@
+"""Tests for the text cleaning helpers."""
+from src.utils.text_cleaner import is_blank
+
+
+def test_is_blank_matches_strip():
+    """is_blank agrees with strip() without copying the text."""
+    for text in ["", "   ", "\n\t  ", " a ", "x" + " " * 10_000]:
+        assert is_blank(text) == (not text.strip())
@@ -9,6 +9,7 @@ from src.infrastructure.config import settings
 from src.infrastructure.repositories import MongoTaskRepository
 from src.domain.models.db_models import TaskStatus
 from src.domain.errors import DocumentNotFoundError
+from src.services.ai_client import ai_client
 from sb_utils.logger_utils import logger
 
 # Worker task handlers - unified backend architecture
@@ -113,6 +114,9 @@ def main_callback(ch, method, properties, body):
 
 # --- Main Worker Loop ---
 def main():
+    # Hide the AI provider's TLS handshake behind RabbitMQ start-up
+    ai_client.warm_up()
+
     while True:
         try:
             connection = pika.BlockingConnection(pika.URLParameters(settings.RABBITMQ_URI))